@@ -0,0 +1,157 @@
+"""
+Micro-benchmarks of the conversion backend, with stored baselines.
+
+- Times every scalar `convert_*` method, the unit-name listings of the scene controllers and
+  the batch paths (`convert_*_batch`, `batch.convert_batch` with and without an `out=` buffer)
+  at sizes from 1 to 10^7 values.
+- Every benchmark keeps the best of several repeats, in nanoseconds per call.
+- `--save` writes the results as a JSON baseline; `--compare` reads one and exits with code 1
+  when a benchmark is slower than its baseline by more than `--threshold` percent.
+  Baselines are only comparable on the machine (and Python/NumPy versions) they were made on.
+- The controller listings need PyQt5; they are skipped when it is not installed.
+
+Usage (from the project root):
+    python benchmarks/bench_backend.py --save benchmarks/baseline.json
+    python benchmarks/bench_backend.py --compare benchmarks/baseline.json --threshold 10
+    python benchmarks/bench_backend.py --filter batch --max-size 100000
+"""
+import argparse  # Used to parse the command line arguments
+import json  # Used for the baseline files
+import platform  # Used to record where a baseline was made
+import sys  # Used for the exit code
+import timeit  # Used to time the benchmarks
+from pathlib import Path  # Used to import the project from its root
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))  # The benchmarks are run as a script from anywhere
+
+import numpy as np  # noqa: E402  Used for the batch inputs
+
+from src.application.backend.values import batch  # noqa: E402
+from src.application.backend.values.currencies import currencies  # noqa: E402
+from src.application.backend.values.longitudes import longitudes  # noqa: E402
+from src.application.backend.values.temperatures import temperatures  # noqa: E402
+from src.application.backend.values.weights_and_masses import weights_and_masses  # noqa: E402
+
+SIZES = tuple(10 ** exponent for exponent in range(8))  # 1 to 10^7 values
+DEFAULT_THRESHOLD = 10.0  # Percent
+
+
+def scalar_benchmarks():
+    """Yields (name, callable) for the scalar converters."""
+    yield "convert_longitud", lambda converter=longitudes(): converter.convert_longitud(12.5, "Meter", "Feet")
+    yield "convert_weight_and_mass", (
+        lambda converter=weights_and_masses(): converter.convert_weight_and_mass(12.5, "Pound", "Kilogram")
+    )
+    yield "convert_temperature", (
+        lambda converter=temperatures(): converter.convert_temperature(98.6, "Fahrenheit", "Celsius")
+    )
+    yield "convert_currency", lambda converter=currencies(): converter.convert_currency(12.5, "USD", "EUR")
+
+
+def listing_benchmarks():
+    """Yields (name, callable) for the unit-name listings of the scene controllers (needs PyQt5)."""
+    try:
+        from src.application.frontend.scenes.controller_conversor_currencies import ConversorCurriency
+        from src.application.frontend.scenes.controller_conversor_longitudes import ConversorLongitud
+        from src.application.frontend.scenes.controller_conversor_temperatures import ConversorTemperature
+        from src.application.frontend.scenes.controller_conversor_weights_masses import ConversorWeightAndMasses
+    except ImportError as error:
+        print(f"skipping the controller listings: {error}", file=sys.stderr)
+        return
+    # The listings do not touch the widget, so they are timed without creating a QApplication
+    yield "getCurrencyNames", lambda: ConversorCurriency.getCurrencyNames(None)
+    yield "getLongitudNames", lambda: ConversorLongitud.getLongitudNames(None)
+    yield "getTemperatureNames", lambda: ConversorTemperature.getTemperatureNames(None)
+    yield "getWeightNames", lambda: ConversorWeightAndMasses.getWeightNames(None)
+
+
+def batch_benchmarks(sizes):
+    """Yields (name, callable, size) for the batch paths at every size."""
+    for size in sizes:
+        values = np.random.default_rng(size).uniform(-1000, 1000, size)
+        out = np.empty_like(values)
+        yield f"convert_longitud_batch[{size}]", (
+            lambda converter=longitudes(), values=values: converter.convert_longitud_batch(values, "Meter", "Feet")
+        ), size
+        yield f"convert_temperature_batch[{size}]", (
+            lambda converter=temperatures(), values=values:
+                converter.convert_temperature_batch(values, "Fahrenheit", "Celsius")
+        ), size
+        yield f"convert_batch[{size}]", (
+            lambda values=values: batch.convert_batch("weights_and_masses", values, "Pound", "Kilogram")
+        ), size
+        yield f"convert_batch_out[{size}]", (
+            lambda values=values, out=out: batch.convert_batch("temperatures", values, "Celsius", "Kelvin", out=out)
+        ), size
+
+
+def time_call(function, repeat):
+    """Returns the best time of one call of `function`, in nanoseconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()  # Enough calls for at least 0.2 s per repeat
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def run(name_filter, max_size, repeat):
+    """Runs the benchmarks and returns {name: ns per call}."""
+    benchmarks = [(name, function, 1) for name, function in scalar_benchmarks()]
+    benchmarks += [(name, function, 1) for name, function in listing_benchmarks()]
+    benchmarks += list(batch_benchmarks(size for size in SIZES if size <= max_size))
+    results = {}
+    for name, function, size in benchmarks:
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = time_call(function, repeat)
+        per_value = f"  {results[name] / size:8.2f} ns/value" if size > 1 else ""
+        print(f"{name:<40} {results[name]:14,.1f} ns{per_value}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Prints the change of every benchmark against the baseline and returns the regressed names."""
+    regressions = []
+    for name, elapsed in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        change = (elapsed - reference) / reference * 100
+        regressed = change > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<40} {change:+8.1f} %  {'REGRESSION' if regressed else 'ok'}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks of the conversion backend.")
+    parser.add_argument("--save", type=Path, help="write the results to this JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare the results with this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown in percent that counts as a regression")
+    parser.add_argument("--filter", default="", help="only run the benchmarks whose name contains this text")
+    parser.add_argument("--max-size", type=int, default=SIZES[-1], help="largest batch size")
+    parser.add_argument("--repeat", type=int, default=5, help="repeats per benchmark (the best is kept)")
+    args = parser.parse_args()
+
+    results = run(args.filter, args.max_size, args.repeat)
+    if args.save:
+        args.save.write_text(json.dumps({
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "results": results,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) slower than the baseline by more than "
+                  f"{args.threshold:g} %: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
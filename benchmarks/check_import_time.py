@@ -0,0 +1,78 @@
+"""
+Import-time budget for the headless backend.
+
+- Imports each backend module in a fresh interpreter with `python -X importtime` and
+  reads the cumulative time of the module from the report.
+- Fails (exit code 1) when a module takes longer than the budget, or when importing it
+  pulls in PyQt5 or NumPy: scalar conversions and short command line jobs need neither.
+- The best of several runs is kept, so one slow start of the machine does not fail the check.
+
+Usage (from the project root):
+    python benchmarks/check_import_time.py
+    python benchmarks/check_import_time.py --budget-ms 40 --runs 5
+"""
+import argparse  # Used to parse the command line arguments
+import subprocess  # Used to import every module in a fresh interpreter
+import sys  # Used for the path of the interpreter and the exit code
+from pathlib import Path  # Used to run the imports from the project root
+
+ROOT = Path(__file__).resolve().parents[1]
+MODULES = (
+    "src.application.backend.values.longitudes",
+    "src.application.backend.values.weights_and_masses",
+    "src.application.backend.values.temperatures",
+    "src.application.backend.values.currencies",
+    "src.application.backend.values.batch",
+)
+FORBIDDEN = ("PyQt5", "numpy")  # Top-level packages a backend-only import must not load
+DEFAULT_BUDGET_MS = 50.0
+
+
+def import_report(module):
+    """Imports `module` in a fresh interpreter and returns {module name: cumulative µs}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    report = {}
+    for line in result.stderr.splitlines():  # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        report[name.strip()] = int(cumulative)
+    return report
+
+
+def check(module, budget_ms, runs):
+    """Returns the list of problems found for one module (empty when it is within budget)."""
+    best = None
+    for _ in range(runs):
+        report = import_report(module)
+        if best is None or report[module] < best[module]:
+            best = report
+    elapsed_ms = best[module] / 1000
+    problems = [f"imports {name}" for name in FORBIDDEN if name in best]
+    if elapsed_ms > budget_ms:
+        problems.append(f"takes {elapsed_ms:.1f} ms (budget {budget_ms:.1f} ms)")
+    print(f"{module:<55} {elapsed_ms:8.1f} ms  {'FAIL' if problems else 'ok'}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time budget for the headless backend.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="maximum cumulative import time of each module")
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters per module (best is kept)")
+    args = parser.parse_args()
+    failures = {}
+    for module in MODULES:
+        problems = check(module, args.budget_ms, args.runs)
+        if problems:
+            failures[module] = problems
+    for module, problems in failures.items():
+        print(f"{module}: {', '.join(problems)}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
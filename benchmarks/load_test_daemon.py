@@ -0,0 +1,79 @@
+"""
+Load test for the local conversion daemon (src/application/daemon.py).
+
+- Opens several connections to the Unix socket and sends requests on all of them at the same time.
+- Reports the requests per second and the p50/p99 round-trip latencies when the run ends.
+
+Usage (from the project root, with the daemon running):
+    python -m src.application.daemon &
+    python benchmarks/load_test_daemon.py --connections 32 --requests 50000
+    python benchmarks/load_test_daemon.py --batch-size 10000 --requests 500
+"""
+import argparse  # Used to parse the command line arguments
+import asyncio  # Used to run the connections concurrently
+import sys  # Used to import the project from its root
+import time  # Used to measure the latencies
+from pathlib import Path  # Used to import the project from its root
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))  # The benchmarks are run as a script from anywhere
+
+from src.application.daemon_client import DEFAULT_SOCKET, HEADER, STATUS_OK, encode_convert  # noqa: E402
+
+
+async def run_connection(path, request, count, latencies, errors):
+    """Sends `count` requests one after another on a single connection."""
+    reader, writer = await asyncio.open_unix_connection(path)
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            length, = HEADER.unpack(await reader.readexactly(HEADER.size))
+            payload = await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            if payload[0] != STATUS_OK:
+                errors.append(payload[1:])
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    """Returns a percentile of sorted values (nearest rank)."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def load_test(path, connections, requests, batch_size):
+    """Runs the load test and prints its report."""
+    request = encode_convert("weights_and_masses", [12.5] * max(batch_size, 1), "Pound", "Kilogram")
+    latencies, errors = [], []
+    per_connection = [requests // connections + (index < requests % connections) for index in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_connection(path, request, count, latencies, errors) for count in per_connection if count
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"requests:     {len(latencies):,} on {connections} connections ({len(errors)} errors)")
+    print(f"requests/s:   {len(latencies) / elapsed:,.0f}")
+    if batch_size:
+        print(f"values/s:     {len(latencies) * batch_size / elapsed:,.0f}")
+    print(f"latency p50:  {percentile(latencies, 0.50) * 1000:.3f} ms")
+    print(f"latency p99:  {percentile(latencies, 0.99) * 1000:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for the local conversion daemon.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="path of the daemon socket")
+    parser.add_argument("--connections", type=int, default=16, help="concurrent connections")
+    parser.add_argument("--requests", type=int, default=20000, help="total number of requests")
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="values per request (default: a single value)")
+    args = parser.parse_args()
+    asyncio.run(load_test(args.socket, args.connections, args.requests, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
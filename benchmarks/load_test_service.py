@@ -0,0 +1,99 @@
+"""
+Load test for the local conversion service (src/application/service.py).
+
+- Opens several keep-alive connections and sends requests on all of them at the same time.
+- Reports the requests per second and the p50/p99 latencies when the run ends.
+
+Usage (from the project root, with the service running):
+    python -m src.application.service --port 8080 &
+    python benchmarks/load_test_service.py --port 8080 --connections 32 --requests 20000
+    python benchmarks/load_test_service.py --port 8080 --batch-size 10000 --requests 500
+"""
+import argparse  # Used to parse the command line arguments
+import asyncio  # Used to run the connections concurrently
+import json  # Used for the batch request bodies
+import time  # Used to measure the latencies
+
+
+def build_request(host, batch_size):
+    """Returns the bytes of the request sent over and over."""
+    if batch_size:
+        body = json.dumps({"category": "longitudes", "from": "Meter", "to": "Feet",
+                           "values": list(range(batch_size))}).encode("utf-8")
+        head = (f"POST /convert/batch HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+        return head.encode("latin-1") + body
+    return (f"GET /convert?category=weights_and_masses&from=Pound&to=Kilogram&value=12.5 HTTP/1.1\r\n"
+            f"Host: {host}\r\n\r\n").encode("latin-1")
+
+
+async def read_response(reader):
+    """Reads one response and returns its status code."""
+    status_line = await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def run_connection(host, port, request, count, latencies, errors):
+    """Sends `count` requests one after another on a single keep-alive connection."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    """Returns a percentile of sorted values (nearest rank)."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def load_test(host, port, connections, requests, batch_size):
+    """Runs the load test and prints its report."""
+    request = build_request(host, batch_size)
+    latencies, errors = [], []
+    per_connection = [requests // connections + (index < requests % connections) for index in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        run_connection(host, port, request, count, latencies, errors) for count in per_connection if count
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"requests:     {len(latencies):,} on {connections} connections ({len(errors)} errors)")
+    print(f"requests/s:   {len(latencies) / elapsed:,.0f}")
+    if batch_size:
+        print(f"values/s:     {len(latencies) * batch_size / elapsed:,.0f}")
+    print(f"latency p50:  {percentile(latencies, 0.50) * 1000:.3f} ms")
+    print(f"latency p99:  {percentile(latencies, 0.99) * 1000:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for the local conversion service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--connections", type=int, default=16, help="concurrent keep-alive connections")
+    parser.add_argument("--requests", type=int, default=10000, help="total number of requests")
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="values per POST /convert/batch request (default: single GET /convert)")
+    args = parser.parse_args()
+    asyncio.run(load_test(args.host, args.port, args.connections, args.requests, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Unit converter project sources."""
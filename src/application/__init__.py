@@ -0,0 +1 @@
+"""The unit converter application: the headless backend, the PyQt5 frontend and the command line tools."""
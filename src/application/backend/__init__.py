@@ -0,0 +1,4 @@
+"""
+Headless conversion backend.
+- Imports neither PyQt5 nor NumPy: NumPy is loaded on the first batch conversion.
+"""
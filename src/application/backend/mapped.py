@@ -0,0 +1,56 @@
+"""
+This module converts raw binary files of little-endian float64 values.
+- The files are opened with `numpy.memmap`, so they can be larger than the RAM: the
+  operating system pages the data in and out as the blocks are converted.
+- Every block is converted with one vectorized operation straight from the input pages
+  into the output pages, either in place or into a second mapped file.
+"""
+import mmap  # Used for the page size of the system
+import os  # Used for the size of the input file
+import numpy as np  # Used to map the files as arrays
+
+from .values import batch  # Unit resolution for every category
+from .values.engine import convert_array  # Vectorized conversion
+
+DTYPE = np.dtype("<f8")  # Little-endian float64
+DEFAULT_BLOCK_SIZE = 1024 * mmap.PAGESIZE  # Bytes converted per block (a whole number of pages)
+
+
+def convert_file(path, category, origin, destin, out_path=None, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Converts every value of a raw float64 file.
+    Args:
+        path (str): The input file of little-endian float64 values.
+        category (str): The name of the category (e.g. "longitudes").
+        origin (str | int): The unit the values are in.
+        destin (str | int): The unit to convert them to.
+        out_path (str): The output file, or None to convert the input in place (an output
+            naming the input file itself also converts it in place).
+        block_size (int): The number of bytes converted at once, rounded down to whole pages.
+    Returns:
+        int: The number of values converted.
+    Raises:
+        ValueError: If the size of the file is not a multiple of 8 bytes.
+        AttributeError: If a unit is not defined in the category.
+    """
+    scale, offset = batch.resolve_pair(category, origin, destin)  # Units are resolved once
+    size = os.path.getsize(path)
+    if size % DTYPE.itemsize:
+        raise ValueError(f"{path} is not a file of float64 values ({size} bytes)")
+    count = size // DTYPE.itemsize
+    if out_path is not None and os.path.exists(out_path) and os.path.samefile(path, out_path):
+        out_path = None  # Emptying the output would destroy the input: convert through one r+ map
+    if out_path is not None:
+        open(out_path, "wb").close()  # Create (or empty) the output even for an empty input
+    if count == 0:
+        return 0
+
+    source = np.memmap(path, dtype=DTYPE, mode="r" if out_path else "r+", shape=(count,))
+    target = np.memmap(out_path, dtype=DTYPE, mode="w+", shape=(count,)) if out_path else source
+    step = max(block_size // mmap.PAGESIZE, 1) * mmap.PAGESIZE // DTYPE.itemsize
+    for start in range(0, count, step):
+        stop = min(start + step, count)
+        convert_array(source[start:stop], scale, offset, out=target[start:stop])
+    target.flush()
+    del source, target  # Unmaps the files
+    return count
@@ -0,0 +1,217 @@
+"""
+This module counts the conversions of the backend and measures how long they take.
+- The counters and latency histograms are keyed by the converter function, the category and
+  the (origin, destination) pair, by the canonical names of the units ("ft", "FEET" and 2 are
+  all "Feet"); failed conversions are counted by their error type instead, so that unknown
+  unit names typed by users do not create new series.
+- The latencies are kept in log-scaled buckets (powers of two, from 2^-26 s to 2^4 s), so
+  recording one is a bisection of the bucket bounds and two additions.
+- Nothing is measured until `enable()` is called: it replaces the converters with timed
+  wrappers, and `disable()` puts the original functions back. While disabled the layer
+  costs nothing, because the converters are the plain functions.
+- `render()` returns the metrics in the Prometheus text format; `write_textfile(path)`
+  writes them to a file for the textfile collector of a node exporter.
+"""
+import inspect  # Used to read the arguments given by keyword
+import os  # Used to replace the metric file atomically
+import threading  # Used to record from several threads at once
+import time  # Used to measure the latencies
+from bisect import bisect_left  # Used to find the bucket of a latency
+from functools import wraps  # Used to keep the names of the wrapped converters
+from importlib import import_module  # Used to find the converters to instrument
+from .values import registry  # Used to key the series by the canonical unit names
+
+MIN_EXPONENT = -26  # Smallest bucket: latencies up to 2^-26 s (about 15 ns)
+MAX_EXPONENT = 4  # Largest bucket: latencies up to 2^4 s; slower ones only count in +Inf
+UNLABELED = "unlabeled"  # The labels of a call whose arguments could not be read
+BUCKET_BOUNDS = tuple(2.0 ** exponent for exponent in range(MIN_EXPONENT, MAX_EXPONENT + 1))
+
+"""
+The backend converters instrumented by `enable()`: (module, class or None, function, category or None).
+Every converter takes (self or category, value or values, origin, destin, ...); when the category
+is None it is read from the first argument.
+"""
+CONVERTERS = (
+    ("src.application.backend.values.longitudes", "longitudes", "convert_longitud", "longitudes"),
+    ("src.application.backend.values.longitudes", "longitudes", "convert_longitud_batch", "longitudes"),
+    ("src.application.backend.values.weights_and_masses", "weights_and_masses", "convert_weight_and_mass",
+     "weights_and_masses"),
+    ("src.application.backend.values.weights_and_masses", "weights_and_masses", "convert_weight_and_mass_batch",
+     "weights_and_masses"),
+    ("src.application.backend.values.temperatures", "temperatures", "convert_temperature", "temperatures"),
+    ("src.application.backend.values.temperatures", "temperatures", "convert_temperature_batch", "temperatures"),
+    ("src.application.backend.values.currencies", "currencies", "convert_currency", "currencies"),
+    ("src.application.backend.values.currencies", "currencies", "convert_currency_batch", "currencies"),
+    ("src.application.backend.values.batch", None, "convert_value", None),
+    ("src.application.backend.values.batch", None, "convert_batch", None),
+)
+
+
+class ConversionMetrics:
+    """
+    The counters and histograms of the instrumented converters.
+    Attributes:
+        latencies (dict): (function, category, origin, destin) -> [bucket counts..., +Inf count, sum].
+        errors (dict): (function, category, error type) -> number of failed conversions.
+    """
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def record(self, key, seconds):
+        """Counts one successful conversion that took `seconds`."""
+        index = bisect_left(BUCKET_BOUNDS, seconds)  # The first bucket with seconds <= bound (+Inf past the last)
+        with self._lock:
+            counts = self.latencies.get(key)
+            if counts is None:
+                counts = self.latencies[key] = [0] * (len(BUCKET_BOUNDS) + 1) + [0.0]
+            counts[index] += 1
+            counts[-1] += seconds
+
+    def record_error(self, key):
+        """Counts one conversion that raised an error."""
+        with self._lock:
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def reset(self):
+        """Forgets every recorded conversion."""
+        with self._lock:
+            self.latencies.clear()
+            self.errors.clear()
+
+    def render(self):
+        """Returns the metrics in the Prometheus text format."""
+        with self._lock:
+            latencies = {key: list(counts) for key, counts in self.latencies.items()}
+            errors = dict(self.errors)
+        lines = ["# TYPE conversor_conversion_seconds histogram"]
+        for (function, category, origin, destin), counts in sorted(latencies.items(), key=sort_key):
+            labels = (f'function="{function}",category="{category}",'
+                      f'origin="{escape(origin)}",destin="{escape(destin)}"')
+            cumulative = 0
+            for bound, count in zip(BUCKET_BOUNDS, counts):
+                cumulative += count
+                lines.append(f'conversor_conversion_seconds_bucket{{{labels},le="{bound:.9g}"}} {cumulative}')
+            total = sum(counts[:-1])
+            lines.append(f'conversor_conversion_seconds_bucket{{{labels},le="+Inf"}} {total}')
+            lines.append(f"conversor_conversion_seconds_sum{{{labels}}} {counts[-1]:.9f}")
+            lines.append(f"conversor_conversion_seconds_count{{{labels}}} {total}")
+        lines.append("# TYPE conversor_conversion_errors_total counter")
+        for (function, category, error), count in sorted(errors.items(), key=sort_key):
+            lines.append(f'conversor_conversion_errors_total{{function="{function}",category="{escape(category)}",'
+                         f'error="{error}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def sort_key(item):
+    """Orders the series by their labels."""
+    return tuple(map(str, item[0]))
+
+
+def escape(value):
+    """Returns a label value with the characters Prometheus needs escaped."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+METRICS = ConversionMetrics()  # The metrics of this process
+_originals = {}  # (owner, name) -> the function replaced by `instrument`
+
+
+def timed(function, category=None, name=None, metrics=METRICS):
+    """
+    Returns `function` wrapped so that every call is recorded in `metrics`.
+    Args:
+        function (callable): A converter taking (self or category, value, origin, destin, ...).
+        category (str): The category of the converter, or None to read it from the first argument
+            (a category name, or a class named after its category).
+        name (str): The function label of the metrics (default: the name of the function).
+        metrics (ConversionMetrics): Where the calls are recorded.
+    The arguments may be given by position or by keyword; a call whose labels can't be read
+    is recorded as UNLABELED, so measuring never changes the outcome of a call.
+    """
+    name = name or function.__name__
+    clock = time.perf_counter
+    try:
+        signature = inspect.signature(function)
+    except (TypeError, ValueError):  # Some builtins have no signature
+        signature = None
+
+    def labels(args, kwargs):
+        """Returns (category, origin, destin) of a call, reading keyword arguments when needed."""
+        if len(args) < 4 or kwargs:
+            arguments = tuple(signature.bind(*args, **kwargs).arguments.values())
+            args = arguments[:4]
+        owner = category or getattr(args[0], "__name__", args[0])
+        return owner, args[2], args[3]
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            result = function(*args, **kwargs)
+        except (ValueError, AttributeError, KeyError, TypeError) as error:
+            try:
+                label = labels(args, kwargs)[0]
+            except Exception:
+                label = UNLABELED
+            metrics.record_error((name, label, type(error).__name__))
+            raise
+        elapsed = clock() - start
+        try:
+            label, origin, destin = labels(args, kwargs)
+            key = (name, label, unit_name(label, origin), unit_name(label, destin))
+        except Exception:  # Labels only describe the call: they must not fail it
+            key = (name, UNLABELED, UNLABELED, UNLABELED)
+        metrics.record(key, elapsed)
+        return result
+
+    return wrapper
+
+
+def unit_name(category, unit):
+    """Returns the canonical name of a unit given by any spelling or ID (the unit itself if unknown)."""
+    try:
+        return registry.category(category).unit(unit).name
+    except (KeyError, AttributeError, TypeError):
+        return unit
+
+
+def instrument(owner, name, category=None):
+    """
+    Replaces the function `name` of a class or module with a timed wrapper (once).
+    `disable()` puts the original function back.
+    """
+    if (owner, name) in _originals:
+        return
+    function = getattr(owner, name)
+    _originals[(owner, name)] = function
+    setattr(owner, name, timed(function, category))
+
+
+def enable():
+    """Instruments every backend converter listed in CONVERTERS."""
+    for module_name, class_name, name, category in CONVERTERS:
+        owner = import_module(module_name)
+        instrument(getattr(owner, class_name) if class_name else owner, name, category)
+
+
+def disable():
+    """Puts the original converters back; the recorded metrics are kept."""
+    while _originals:
+        (owner, name), function = _originals.popitem()
+        setattr(owner, name, function)
+
+
+def is_enabled():
+    """Returns True while converters are instrumented."""
+    return bool(_originals)
+
+
+def write_textfile(path, metrics=METRICS):
+    """Writes the metrics to `path` in the Prometheus text format, replacing the file atomically."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as metric_file:
+        metric_file.write(metrics.render())
+    os.replace(temporary, path)
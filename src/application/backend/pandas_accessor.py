@@ -0,0 +1,168 @@
+"""
+This module registers a `units` accessor on pandas Series and DataFrames.
+- Importing it is enough to register the accessor (pandas is an optional dependency):
+      import src.application.backend.pandas_accessor
+      df["mass_kg"] = df["mass"].units.convert("Pound", "Kilogram")
+      df["length"].units.convert(df["unit"], "Meter")          # one unit per row
+      df.units.convert({"mass": ("Pound", "Kilogram"), "tare": ("Ounce", "Gram")})
+- Every conversion is one vectorized operation: scalar units go through the backend engine
+  with the (scale, offset) of the pair, and a column of units is factorized, its distinct
+  spellings resolved once with the registry, and the scales and offsets gathered from the
+  factor matrices of the category. No Python code runs per row.
+- The index and the name of the converted columns are kept; rows whose unit is missing
+  become NaN.
+"""
+import numpy as np  # Used for the vectorized factor lookups
+import pandas as pd  # Used to register the accessors
+
+from .values import batch, registry  # Converters and unit catalog
+
+
+def find_category(*units):
+    """
+    Returns the category defining every given unit (names, symbols or aliases).
+    Raises:
+        ValueError: If the units can't identify a single category: unit IDs (every category
+            has a unit 0) or units defined by several categories. Pass `category=` instead.
+        AttributeError: If no category defines all of them.
+    """
+    if not all(isinstance(unit, str) for unit in units):
+        raise ValueError(f"Unit IDs don't identify a category: {', '.join(map(str, units))} "
+                         f"(pass category=)")
+    matches = []
+    for category in registry.catalog().values():
+        try:
+            for unit in units:
+                category.unit(unit)
+        except AttributeError:
+            continue
+        matches.append(category.name)
+    if not matches:
+        raise AttributeError(f"No category defines the units: {', '.join(units)}")
+    if len(matches) > 1:
+        raise ValueError(f"The units {', '.join(units)} are defined by several categories: "
+                         f"{', '.join(matches)} (pass category=)")
+    return registry.category(matches[0])
+
+
+def is_column(units):
+    """Returns True when `units` gives one unit per row rather than a single unit."""
+    return isinstance(units, (pd.Series, pd.Index, np.ndarray, list, tuple))
+
+
+def first_unit(units):
+    """Returns a unit that identifies the category: the unit itself, or the first one of a column."""
+    if not is_column(units):
+        return units
+    present = pd.Series(units).dropna()
+    if present.empty:
+        raise ValueError("The unit column is empty")
+    return present.iloc[0]
+
+
+def unit_id_array(category, units, index):
+    """
+    Resolves a column of units to their IDs.
+    Args:
+        category (registry.Category): The category of the units.
+        units (Series | array_like): One unit per row, aligned on `index` when it is a Series.
+        index (pandas.Index): The index of the converted values.
+    Returns:
+        tuple: (ids, missing) where ids is an intp array and missing marks the rows without a unit.
+    """
+    if isinstance(units, pd.Series):
+        units = units.reindex(index)
+    codes, uniques = pd.factorize(np.asarray(units, dtype=object))
+    ids = np.asarray(category.unit_ids(uniques), dtype=np.intp)  # Each distinct spelling resolved once
+    missing = codes < 0
+    return ids[np.where(missing, 0, codes)], missing
+
+
+def convert_values(values, index, origin, destin, category=None):
+    """
+    Converts a float64 array whose units are given as scalars or as columns.
+    Returns:
+        numpy.ndarray: The converted values.
+    """
+    if category is None:
+        category = find_category(first_unit(origin), first_unit(destin))
+    elif isinstance(category, str):
+        category = registry.category(category)
+    if not is_column(origin) and not is_column(destin):
+        return np.asarray(batch.convert_batch(category.name, values, origin, destin, out=values))
+    if category.source is not None:
+        category.source.refresh()  # The factor matrix of the latest rates
+    missing = np.zeros(len(values), dtype=bool)
+    if is_column(origin):
+        origin_ids, missing_origin = unit_id_array(category, origin, index)
+        missing |= missing_origin
+    else:
+        origin_ids = category.unit_id(origin)
+    if is_column(destin):
+        destin_ids, missing_destin = unit_id_array(category, destin, index)
+        missing |= missing_destin
+    else:
+        destin_ids = category.unit_id(destin)
+    values *= category.matrix[origin_ids, destin_ids]  # Gathered scale of every row
+    if not category.linear:
+        values += category.offset_matrix[origin_ids, destin_ids]
+    values[missing] = np.nan
+    return values
+
+
+@pd.api.extensions.register_series_accessor("units")
+class SeriesUnits:
+    """
+    The `units` accessor of a Series.
+    Methods:
+        convert(origin, destin, category=None):
+            Converts the values of the Series.
+            Args:
+                origin (str | int | Series): The unit of the values, or one unit per row.
+                destin (str | int | Series): The unit to convert to, or one unit per row.
+                category (str): The category name; found from the units when None (the units
+                    must then be names that only one category defines).
+            Returns:
+                Series: The converted values, with the same index and name.
+            Raises:
+                ValueError: If `category` is None and the units don't identify one category.
+                AttributeError: If a unit is not defined in the category.
+    """
+
+    def __init__(self, series):
+        self._series = series
+
+    def convert(self, origin, destin, category=None):
+        series = self._series
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)  # Converted in place
+        converted = convert_values(values, series.index, origin, destin, category)
+        return pd.Series(converted, index=series.index, name=series.name)
+
+
+@pd.api.extensions.register_dataframe_accessor("units")
+class DataFrameUnits:
+    """
+    The `units` accessor of a DataFrame.
+    Methods:
+        convert(columns, category=None):
+            Converts several columns at once.
+            Args:
+                columns (dict): Column name -> (origin, destin); a unit may be a name or a
+                    Series with one unit per row (e.g. another column of the frame).
+                category (str): The category of every column; found per column when None.
+            Returns:
+                DataFrame: A copy of the frame with the converted columns.
+            Raises:
+                KeyError: If a column does not exist.
+                ValueError: If `category` is None and the units of a column don't identify one category.
+                AttributeError: If a unit is not defined in the category.
+    """
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def convert(self, columns, category=None):
+        frame = self._frame.copy()
+        for name, (origin, destin) in columns.items():
+            frame[name] = frame[name].units.convert(origin, destin, category)
+        return frame
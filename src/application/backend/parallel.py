@@ -0,0 +1,152 @@
+"""
+This module runs large batch conversions on several processes.
+- The `ConversionPool` class keeps a pool of worker processes alive between jobs.
+- Arrays are split into slices; the input and the output live in shared memory, so every
+  worker reads and writes its own slice in place and no array is pickled.
+- The `imap` method runs any picklable function over a stream of items (e.g. chunks of
+  CSV rows) with a bounded number of jobs in flight, and yields the results in order.
+"""
+from collections import deque  # Used for the window of pending jobs
+from concurrent.futures import ProcessPoolExecutor  # Used for the worker processes
+from multiprocessing import shared_memory  # Used to share the arrays
+import os  # Used to count the available cores
+import numpy as np  # Used for the array views over the shared memory
+
+from .values import batch  # Unit resolution for every category
+from .values.engine import convert_array  # Vectorized conversion
+
+MIN_SLICE_SIZE = 1 << 16  # Smaller slices cost more in scheduling than they save
+
+
+def _attach(name):
+    """
+    Attaches to a shared memory block created by the parent process.
+    The workers share the resource tracker of the parent, which unlinks the block once.
+    """
+    return shared_memory.SharedMemory(name=name)
+
+
+def _convert_slice(source_name, target_name, length, start, stop, scale, offset):
+    """
+    Converts values[start:stop] of the shared input into the shared output (runs in a worker).
+    """
+    source = _attach(source_name)
+    target = _attach(target_name)
+    try:
+        values = np.ndarray((length,), dtype=np.float64, buffer=source.buf)
+        result = np.ndarray((length,), dtype=np.float64, buffer=target.buf)
+        convert_array(values[start:stop], scale, offset, out=result[start:stop])
+        del values, result  # The views must be released before the blocks are closed
+    finally:
+        source.close()
+        target.close()
+
+
+class ConversionPool:
+    """
+    A persistent pool of worker processes for large conversions.
+    Attributes:
+        workers (int): The number of worker processes.
+    Usage:
+        with ConversionPool(workers=8) as pool:
+            kilograms = pool.convert(pounds, "weights_and_masses", "Pound", "Kilogram")
+    """
+
+    def __init__(self, workers=None):
+        """
+        Args:
+            workers (int): The number of worker processes (default: the number of cores).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stops the worker processes."""
+        self._executor.shutdown()
+
+    def slices(self, length):
+        """
+        Splits `length` values into contiguous (start, stop) slices, a few per worker.
+        """
+        size = max(MIN_SLICE_SIZE, -(-length // (self.workers * 4)))
+        return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+    def convert(self, values, category, origin, destin, out=None):
+        """
+        Converts an array of values on the worker processes.
+        Args:
+            values (array_like): A NumPy array or any sequence of numbers.
+            category (str): The name of the category (e.g. "longitudes").
+            origin (str | int): The unit to convert from.
+            destin (str | int): The unit to convert to.
+            out (numpy.ndarray): Optional float64 buffer to write the result into.
+        Returns:
+            numpy.ndarray: The converted values, in the same order and shape as the input.
+        Raises:
+            KeyError: If the category does not exist.
+            AttributeError: If a unit is not defined in the category.
+        """
+        scale, offset = batch.resolve_pair(category, origin, destin)  # Units are resolved once
+        values = np.asarray(values, dtype=np.float64)
+        slices = self.slices(values.size)
+        if len(slices) < 2:  # Not worth the round trip to the workers
+            return convert_array(values, scale, offset, out=out)
+
+        source = shared_memory.SharedMemory(create=True, size=values.nbytes)
+        target = shared_memory.SharedMemory(create=True, size=values.nbytes)
+        try:
+            shared_values = np.ndarray(values.shape, dtype=np.float64, buffer=source.buf)
+            shared_values[...] = values
+            jobs = [
+                self._executor.submit(
+                    _convert_slice, source.name, target.name, values.size, start, stop, scale, offset
+                )
+                for start, stop in slices
+            ]
+            for job in jobs:
+                job.result()  # Re-raises the first error of a worker
+            shared_result = np.ndarray(values.shape, dtype=np.float64, buffer=target.buf)
+            if out is None:
+                out = shared_result.copy()
+            else:
+                out[...] = shared_result
+            del shared_values, shared_result  # The views must be released before the blocks are closed
+        finally:
+            for block in (source, target):
+                block.close()
+                block.unlink()
+        return out
+
+    def imap(self, function, items, window=None):
+        """
+        Runs `function` over every item on the workers and yields the results in order.
+        At most `window` jobs are in flight, so a stream of items is never read ahead
+        further than that.
+        Args:
+            function (callable): A picklable (module-level) function of one argument.
+            items (iterable): The arguments, e.g. chunks of rows read from a file.
+            window (int): The maximum number of pending jobs (default: two per worker).
+        """
+        window = window or self.workers * 2
+        pending = deque()
+        for item in items:
+            pending.append(self._executor.submit(function, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def convert_parallel(values, category, origin, destin, workers=None, out=None):
+    """
+    Converts an array of values on a temporary pool of worker processes.
+    Use a `ConversionPool` instead when converting several arrays, to start the workers once.
+    """
+    with ConversionPool(workers) as pool:
+        return pool.convert(values, category, origin, destin, out=out)
@@ -0,0 +1,5 @@
+"""
+Unit catalogs, factor tables and the vectorized conversion engine.
+- Every category module registers its units in `registry`; import them as
+  `from src.application.backend.values import longitudes`.
+"""
@@ -0,0 +1,137 @@
+"""
+This module gives every category the same batch entry point.
+- resolve_pair(category, origin, destin) looks the two units up once and returns the
+  (scale, offset) that converts a value between them.
+- convert_value(category, value, origin, destin) converts a single value with that pair.
+- convert_batch(category, values, origin, destin) converts a whole array with that pair.
+- convert_records(categories, origins, destins, values) converts heterogeneous records,
+  where every row has its own category and units: the (category, origin, destination)
+  triples are factorized into integer codes, the rows are grouped by triple, every triple is
+  resolved once and converted with one vectorized kernel, and the results are scattered
+  back into the original order.
+The headless tools (such as the CSV conversion command) use these functions so
+they do not need to know which class implements each category.
+"""
+from . import registry  # Unit catalog
+from .engine import as_float_array, convert_array, load_numpy  # Vectorized conversion
+
+
+
+def resolve_pair(category, origin, destin):
+    """
+    Resolves a pair of units to the coefficients that convert between them.
+    Args:
+        category (str): The name of the category (e.g. "longitudes").
+        origin (str | int): The unit to convert from (name, alias or ID).
+        destin (str | int): The unit to convert to (name, alias or ID).
+    Returns:
+        tuple: (scale, offset) so that converted = value * scale + offset.
+    Raises:
+        KeyError: If the category does not exist.
+        AttributeError: If a unit is not defined in the category.
+    """
+    return registry.category(category).pair(origin, destin)
+
+
+def convert_value(category, value, origin, destin):
+    """
+    Converts a single value of any category.
+    Args:
+        category (str): The name of the category (e.g. "temperatures").
+        value (float | str): The value to convert.
+        origin (str | int): The unit to convert from.
+        destin (str | int): The unit to convert to.
+    Returns:
+        float: The converted value.
+    """
+    scale, offset = resolve_pair(category, origin, destin)
+    return float(value) * scale + offset
+
+
+def convert_batch(category, values, origin, destin, out=None):
+    """
+    Converts a whole array of values of any category in a single operation.
+    Args:
+        category (str): The name of the category (e.g. "temperatures").
+        values (array_like): A NumPy array, any sequence of numbers or a float64 buffer.
+        origin (str | int): The unit to convert from.
+        destin (str | int): The unit to convert to.
+        out (buffer): Optional writable float64 buffer to write the result into (may be `values`).
+    Returns:
+        numpy.ndarray: The converted values.
+    """
+    scale, offset = resolve_pair(category, origin, destin)
+    return convert_array(values, scale, offset, out=out)
+
+
+def factorize(column, size):
+    """
+    Returns (uniques, codes) of a column of labels, broadcasting a single label to `size` rows.
+    The labels of a column must be of one type (all names or all IDs), so they can be sorted.
+    """
+    np = load_numpy()
+    uniques, codes = np.unique(np.broadcast_to(np.asarray(column), (size,)), return_inverse=True)
+    return uniques, codes.reshape(size)
+
+
+def convert_records(categories, origins, destins, values, out=None, errors="raise"):
+    """
+    Converts heterogeneous records, each one with its own category and units.
+    Args:
+        categories (array_like | str): The category of every row (or one for all rows).
+        origins (array_like | str): The unit every row is in (or one for all rows).
+        destins (array_like | str): The unit to convert every row to (or one for all rows).
+        values (array_like | buffer): The values to convert.
+        out (buffer): Optional writable float64 buffer to write the results into.
+        errors (str): "raise" to fail on an unknown category or unit, "nan" to give NaN for
+            the rows of that triple instead.
+    Returns:
+        numpy.ndarray: The converted values, in the order of the records.
+    Raises:
+        KeyError: If a category does not exist (errors="raise").
+        AttributeError: If a unit is not defined in its category (errors="raise").
+    """
+    np = load_numpy()
+    values = as_float_array(np, values)
+    size = len(values)
+    if out is None:
+        result = np.empty(size)
+    else:  # Written straight into the caller's memory
+        result = out if isinstance(out, np.ndarray) else np.frombuffer(out, dtype=np.float64)
+
+    # Factorize the triples into one integer code per row
+    keys = np.zeros(size, dtype=np.int64)
+    labels = []
+    for column in (categories, origins, destins):
+        uniques, codes = factorize(column, size)
+        keys = keys * len(uniques) + codes
+        labels.append(uniques)
+    triples, groups = np.unique(keys, return_inverse=True)
+    groups = groups.reshape(size)
+
+    # Group the rows by triple: the rows of group g are order[bounds[g]:bounds[g + 1]]
+    order = np.argsort(groups, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(groups, minlength=len(triples)))))
+
+    category_labels, origin_labels, destin_labels = labels
+    for group, key in enumerate(triples.tolist()):
+        key, destin_code = divmod(key, len(destin_labels))
+        category_code, origin_code = divmod(key, len(origin_labels))
+        rows = order[bounds[group]:bounds[group + 1]]
+        try:
+            scale, offset = resolve_pair(category_labels[category_code], origin_labels[origin_code],
+                                         destin_labels[destin_code])  # Once per triple
+        except (KeyError, AttributeError):
+            if errors == "raise":
+                raise
+            result[rows] = np.nan
+            continue
+        selected = values[rows]  # Gather
+        result[rows] = convert_array(selected, scale, offset, out=selected)  # One kernel, then scatter
+    return result
+
+
+def __getattr__(name):
+    if name == "CATEGORY_NAMES":  # The names of every category, read from the catalog on first access
+        return tuple(registry.catalog())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
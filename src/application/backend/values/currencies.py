@@ -3,7 +3,9 @@ This module contains the currency class and the currencies class.
 - The currency class represents a single currency with its name and value.
 - The currencies class contains several predefined currency instances and
   provides a method to convert between different currencies.
-- The exchange rates are updated as of May 17, 2025.
+- The currencies and their default exchange rates are declared in data/units.json (see
+  `definitions`); the rates in use are loaded from the rate file data/rates.json (see
+  `rates.RateTable`) and reloaded when the file changes.
 
 The currencies class includes the following currencies:
 - USD (United States Dollar)
@@ -15,11 +17,14 @@ The currencies class includes the following currencies:
 - CAD (Canadian Dollar)
 - AUD (Australian Dollar)
 """
+from .engine import convert_array  # Vectorized conversion for batches
+from . import definitions, factors, rates  # Unit definitions, rate file and the unit attributes of the class
 
 class currency:
-    def __init__(self, name, value):
+    def __init__(self, name, value, symbol=None):
         self.name = name # name of the currency
         self.value = value # value of the currency in relation to USD
+        self.symbol = symbol # symbol of the currency (e.g. "$")
 
 """
 This class represents a currency with its name and value in USD.
@@ -27,27 +32,50 @@ This class represents a currency with its name and value in USD.
 """
 
 class currencies:
-    """Exchange rates updated as of 2, June, 2025"""
-
-    USD = currency("USD", 1)  # unit base
-    MXN = currency("MXN", 0.052)  # 1 mxn = 0.052 usd
-    EUR = currency("EUR", 1.14)  # 1 eur = 1.14 usd
-    GBP = currency("GBP", 1.35)  # 1 gbp = 1.36 usd
-    JPY = currency("JPY", 0.007)  # 1 jpy = 0.007 usd
-    KRW = currency("KRW", 0.00073)  # 1 krw = 0.00073 usd
-    CAD = currency("CAD", 0.73)  # 1 cad = 0.73 usd
-    AUD = currency("AUD", 0.65)  # 1 aud = 0.65 usd
+    """
+    One `currency` per currency declared in data/units.json (currencies.USD, currencies.EUR...),
+    with its default exchange rate, used until the rate file is loaded.
+    """
+
     """This method converts a value from one currency to another.
     Args:
         value (float): The amount to convert.
-        origin (str): The currency to convert from.
-        destin (str): The currency to convert to.
+        origin (str | int): The currency to convert from (code or ID).
+        destin (str | int): The currency to convert to (code or ID).
         Returns:
         float: The converted amount.
     """
 
     def convert_currency(self, value, origin, destin):
-        value = float(value)
-        origin_unit = getattr(currencies, origin)
-        destin_unit = getattr(currencies, destin)
-        return (value * origin_unit.value) / destin_unit.value
+        return float(value) * CATEGORY.pair(origin, destin)[0] # One multiply by the current factor
+
+    """This method converts a whole array of amounts from one currency to another.
+    The currencies are resolved once and the array is converted in a single operation.
+    Args:
+        values (array_like): A NumPy array, any sequence of amounts or a float64 buffer.
+        origin (str | int): The currency to convert from (code or ID).
+        destin (str | int): The currency to convert to (code or ID).
+        out (buffer): Optional writable float64 buffer to write the result into (may be `values`).
+        Returns:
+        numpy.ndarray: The converted amounts.
+    """
+
+    def convert_currency_batch(self, values, origin, destin, out=None):
+        return convert_array(values, CATEGORY.pair(origin, destin)[0], out=out)
+
+
+"""
+Unit IDs and conversion factors, loaded once from the unit definitions and shared through the registry.
+- CATEGORY (registry.Category): The units of this module, with their name/alias/ID indexes.
+  Its factor tables (CATEGORY.factors, CATEGORY.matrix) are swapped when the rates change.
+- UNIT_NAMES (tuple): The unit names; the position of each name is its integer ID.
+- RATES (rates.RateTable): The rate file the factors are loaded from.
+- ALIASES (dict): Names of the currencies, besides their codes and symbols.
+"""
+CATEGORY = definitions.category("currencies")
+factors.define_units(currencies, currency, CATEGORY)  # currencies.USD, currencies.EUR... (default rates)
+ALIASES = CATEGORY.aliases
+UNIT_NAMES = CATEGORY.names
+RATES = rates.RateTable(CATEGORY)
+CATEGORY.source = RATES  # Every pair lookup checks the rate file once per TTL
+unit_id = CATEGORY.unit_id  # Returns the integer ID of a unit given by name, alias or ID
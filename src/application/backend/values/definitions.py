@@ -0,0 +1,192 @@
+"""
+This module loads the unit definitions of every category from a declarative data file.
+- The units are declared in data/units.json (or the file given by $UNIT_CONVERSOR_UNITS):
+  per category its title, base unit and units, each with its name, symbol, value in the
+  base unit, optional offset (affine scales) and optional aliases. Values may be numbers or
+  exact fractions written as strings ("5/9"). The categories of the dimensional system also
+  declare their dimension, and their units may be derived from the units of the categories
+  declared before them instead of giving a value (see `dimensions`).
+- Building the categories computes the factor table of every unit pair and the alias
+  indexes, which grows with the square of the number of units. The first load therefore
+  compiles the file into a snapshot, a pickle of the built `registry.Category` objects kept
+  in a __pycache__ directory next to the file, and the following loads read the snapshot:
+  a few stats (the data file and the compiler modules) and one read, whatever the number
+  of units.
+- The snapshot is used while the modification time and size of the data file match the
+  ones it was compiled from; when they differ, the file is hashed, and it is compiled again
+  only if its contents changed. The modification times and sizes of the modules that build
+  the categories (COMPILER_FILES) are part of the stamp too, so changing how the aliases or
+  the derived units are compiled rebuilds the snapshot. A snapshot that can't be read or
+  written is ignored.
+"""
+import os  # Used to stamp the snapshot and replace it atomically
+import pickle  # Used for the snapshot
+import sys  # Used to tie the snapshot to the Python version
+from pathlib import Path  # Used to handle file paths in a platform-independent way
+from . import dimensions, factors, registry  # Derived units, exact unit values and the categories
+
+DEFAULT_UNIT_FILE = Path(__file__).resolve().parent / "data" / "units.json"
+SNAPSHOT_VERSION = 2  # Changes whenever the pickled `Category` state changes
+"""The modules whose code builds the snapshot: editing one of them invalidates it"""
+COMPILER_FILES = tuple(
+    Path(__file__).resolve().with_name(f"{module}.py")
+    for module in ("definitions", "dimensions", "factors", "registry")
+)
+
+_categories = {}  # Definition file -> the categories loaded from it
+
+
+def unit_file():
+    """Returns the definition file in use."""
+    return Path(os.environ.get("UNIT_CONVERSOR_UNITS") or DEFAULT_UNIT_FILE)
+
+
+def snapshot_file(path):
+    """Returns the snapshot of a definition file (e.g. data/__pycache__/units.json.pickle)."""
+    return path.parent / "__pycache__" / f"{path.name}.pickle"
+
+
+def compiler_stamp():
+    """Returns the modification time and size of every module in COMPILER_FILES."""
+    stamp = []
+    for source in COMPILER_FILES:
+        try:
+            stat = os.stat(source)
+        except OSError:  # Run from an archive or without the sources: only the version counts
+            stamp.append(None)
+        else:
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def category(name, path=None):
+    """
+    Returns a category declared in the definition file, loading the file once per process.
+    Raises:
+        KeyError: If the file does not declare the category.
+    """
+    return load(path)[name]
+
+
+def load(path=None):
+    """
+    Returns every category declared in a definition file, from its snapshot when it is current.
+    Args:
+        path (str | Path): The definition file (default: `unit_file()`).
+    Returns:
+        dict: Category name -> `registry.Category`, in the order of the file.
+    Raises:
+        OSError: If the definition file can't be read.
+        ValueError: If the definition file is not valid.
+    """
+    path = Path(path) if path is not None else unit_file()
+    categories = _categories.get(path)
+    if categories is None:
+        categories = _categories[path] = load_snapshot(path)
+    return categories
+
+
+def load_snapshot(path):
+    """Reads the snapshot of a definition file, compiling the file when the snapshot is stale."""
+    stat = os.stat(path)
+    stamp = (SNAPSHOT_VERSION, sys.version_info[:2], compiler_stamp(), stat.st_mtime_ns, stat.st_size)
+    snapshot = snapshot_file(path)
+    try:
+        with open(snapshot, "rb") as snapshot_stream:
+            header = pickle.load(snapshot_stream)
+            if header["stamp"] == stamp:
+                return pickle.load(snapshot_stream)  # The usual case: a few stats and one read
+            if header["stamp"][:3] == stamp[:3] and header["digest"] == file_digest(path):
+                categories = pickle.load(snapshot_stream)  # Touched but unchanged: only re-stamp
+                write_snapshot(snapshot, stamp, header["digest"], categories)
+                return categories
+    except Exception:  # Missing or unreadable snapshot (a corrupt pickle may raise almost anything)
+        pass
+    categories = compile_definitions(path)
+    write_snapshot(snapshot, stamp, file_digest(path), categories)
+    return categories
+
+
+def write_snapshot(snapshot, stamp, digest, categories):
+    """Writes a snapshot atomically; a directory that can't be written only disables the cache."""
+    temporary = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+    try:
+        snapshot.parent.mkdir(exist_ok=True)
+        with open(temporary, "wb") as snapshot_stream:
+            pickle.dump({"stamp": stamp, "digest": digest}, snapshot_stream, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(categories, snapshot_stream, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, snapshot)
+    except OSError:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+
+
+def file_digest(path):
+    """Returns the SHA-256 of a file, used to tell a touched file from a changed one."""
+    from hashlib import sha256  # Only needed when the modification time has changed
+    with open(path, "rb") as definition_file:
+        return sha256(definition_file.read()).hexdigest()
+
+
+def compile_definitions(path):
+    """
+    Builds the categories declared in a definition file.
+    Returns:
+        dict: Category name -> `registry.Category`, in the order of the file.
+    Raises:
+        OSError: If the file can't be read.
+        ValueError: If the file is not valid (no units, a unit declared twice, a base unit
+            whose value is not 1, a derived unit of the wrong dimension...).
+    """
+    import json  # Only needed to compile: a current snapshot is read without it
+    with open(path, encoding="utf-8") as definition_file:
+        content = json.load(definition_file)  # json.JSONDecodeError is a ValueError
+    categories = {}
+    try:
+        for name, declaration in content["categories"].items():
+            categories[name] = compile_category(name, declaration, categories.values())
+    except (KeyError, TypeError, ZeroDivisionError) as error:
+        raise ValueError(f"{path}: invalid unit definition ({type(error).__name__}: {error})") from None
+    except ValueError as error:
+        raise ValueError(f"{path}: {error}") from None
+    return categories
+
+
+def compile_category(name, declaration, compiled=()):
+    """
+    Builds one category from its declaration in the definition file.
+    Args:
+        name (str): The name of the category.
+        declaration (dict): The declaration of the category in the file.
+        compiled (iterable): The categories declared before it, which derived units refer to.
+    """
+    dimension = declaration.get("dimension")
+    if dimension is not None:
+        dimension = dimensions.dimension_vector(dimension)
+    units = []
+    for unit in declaration["units"]:
+        value = unit.get("value")
+        if "of" in unit:  # Derived from the units of other categories
+            if dimension is None:
+                raise ValueError(f"{name} must declare its dimension to derive {unit['name']}")
+            value, unit_dimension = dimensions.derive(unit["of"], compiled, unit.get("factor", 1))
+            if unit_dimension != dimension:
+                raise ValueError(f"{unit['name']} is a {dimensions.format_dimension(unit_dimension)}, "
+                                 f"but {name} are {dimensions.format_dimension(dimension)}")
+        elif value is None:
+            raise ValueError(f"{unit['name']} must declare its value or the units it is derived from")
+        units.append((unit["name"], unit.get("symbol"), value, unit.get("offset", 0)))
+    names = [unit[0] for unit in units]
+    if not units or len(set(names)) != len(names):
+        raise ValueError(f"{name} must declare its units once each")
+    base = declaration.get("base")
+    if base is not None:
+        if base not in names:
+            raise ValueError(f"the base unit of {name} ({base}) is not declared")
+        _, _, value, offset = units[names.index(base)]
+        if factors.exact(value) != 1 or factors.exact(offset) != 0:
+            raise ValueError(f"the base unit of {name} ({base}) must have value 1 and no offset")
+    aliases = {unit["name"]: tuple(unit["aliases"]) for unit in declaration["units"] if unit.get("aliases")}
+    return registry.Category(name, declaration.get("title", name), units, aliases, dimension)
@@ -0,0 +1,92 @@
+"""
+This module derives units (areas, volumes, speeds...) from the units of the base dimensions.
+- Every category of the dimensional system has a dimension: a vector of exponents over
+  DIMENSIONS. Longitudes are (1, 0, 0), weights and masses (0, 1, 0), times (0, 0, 1); an
+  area is (2, 0, 0) and a speed (1, 0, -1).
+- A derived unit is declared in data/units.json as a product of units of other categories
+  raised to integer exponents, times an optional factor:
+      {"name": "Square Foot", "of": {"Feet": 2}}
+      {"name": "Knot", "of": {"Nautical Mile": 1, "Hour": -1}}
+      {"name": "US Gallon", "of": {"Inche": 3}, "factor": 231}
+  Its value is computed from the exact values of those units, and its dimension checked
+  against the dimension of its category, so a derived unit can't drift from the units it
+  is made of.
+- The derived categories are built by `definitions` into ordinary `registry.Category`
+  objects, with the same factor tables and matrices as the base categories, and cached in
+  the same snapshot: converting an area costs the same as converting a length.
+"""
+from . import factors  # Exact unit values
+
+DIMENSIONS = ("length", "mass", "time")  # The base dimensions, in the order of the vectors
+SUPERSCRIPTS = str.maketrans("-0123456789", "⁻⁰¹²³⁴⁵⁶⁷⁸⁹")  # Used to print the exponents
+
+
+def dimension_vector(exponents):
+    """
+    Returns the vector of a dimension declared as a mapping (e.g. {"length": 1, "time": -1}).
+    Raises:
+        ValueError: If a dimension is unknown or an exponent is not an integer.
+    """
+    unknown = set(exponents) - set(DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown dimension: {', '.join(sorted(unknown))}")
+    if any(not isinstance(exponent, int) for exponent in exponents.values()):
+        raise ValueError(f"The exponents of a dimension must be integers: {exponents}")
+    return tuple(exponents.get(dimension, 0) for dimension in DIMENSIONS)
+
+
+def format_dimension(vector):
+    """Returns a dimension vector as text (e.g. "length·time⁻¹"); "dimensionless" for zeros."""
+    terms = [
+        dimension if exponent == 1 else f"{dimension}{str(exponent).translate(SUPERSCRIPTS)}"
+        for dimension, exponent in zip(DIMENSIONS, vector or ()) if exponent
+    ]
+    return "·".join(terms) or "dimensionless"
+
+
+def find_unit(text, categories):
+    """
+    Finds a unit (name, symbol or alias) in the categories of the dimensional system.
+    Args:
+        text (str): The unit as written in the declaration.
+        categories (iterable): The `registry.Category` objects already built.
+    Returns:
+        tuple: (category, unit record).
+    Raises:
+        ValueError: If no category with a dimension defines the unit.
+    """
+    for category in categories:
+        if category.dimension is None:
+            continue
+        try:
+            return category, category.unit(text)
+        except AttributeError:
+            continue
+    raise ValueError(f"Unknown unit in a derived unit: {text}")
+
+
+def derive(terms, categories, factor=1):
+    """
+    Computes the value and the dimension of a derived unit.
+    Args:
+        terms (dict): Unit name -> integer exponent (e.g. {"Kilometer": 1, "Hour": -1}).
+        categories (iterable): The categories the units are taken from.
+        factor (float | str): A number the product is multiplied by (e.g. 4840 for an acre
+            in square yards); strings such as "231/128" are read exactly.
+    Returns:
+        tuple: (value, dimension) where value is the exact value of the unit in the coherent
+            unit of its dimension (e.g. m/s) and dimension its vector.
+    Raises:
+        ValueError: If a unit is unknown or an exponent is not an integer.
+    """
+    categories = tuple(categories)
+    value = factors.exact(factor)
+    dimension = [0] * len(DIMENSIONS)
+    for text, exponent in terms.items():
+        if not isinstance(exponent, int):
+            raise ValueError(f"The exponent of {text} must be an integer")
+        category, unit = find_unit(text, categories)
+        value *= category.scales[unit.id] ** exponent
+        for axis, base_exponent in enumerate(category.dimension):
+            dimension[axis] += base_exponent * exponent
+    return value, tuple(dimension)
@@ -0,0 +1,110 @@
+"""
+This module contains the vectorized conversion engine shared by the value classes.
+- Every conversion supported by the application is a scale followed by an optional
+  offset, so a whole array of values can be converted with one NumPy operation.
+- The unit lookup is done once by the caller; this module only applies the numbers.
+- The values may be any sequence of numbers or any contiguous buffer of float64
+  (`array.array('d')`, `memoryview` slices of network buffers, `bytearray`, NumPy views).
+  Buffers are read in place, and the result can be written into a caller-supplied buffer,
+  or into the input itself (`out=values`), without intermediate lists or copies.
+- NumPy is imported on the first batch conversion, so that importing the value modules
+  for scalar conversions stays fast. Without NumPy the same calls run in pure Python
+  over memoryviews, and return an `array.array('d')` when no output buffer is given.
+"""
+from array import array  # Used for the results of the pure-Python fallback
+
+_numpy = None  # The numpy module once imported, or False when it is not installed
+
+
+def load_numpy():
+    """Returns the numpy module, or None when it is not installed (checked once)."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def convert_array(values, scale, offset=0.0, out=None):
+    """
+    Converts a whole array of values with a single scale and offset.
+    Args:
+        values (array_like | buffer): A NumPy array, any sequence of numbers or a contiguous
+            buffer of float64 (raw byte buffers are read as native float64).
+        scale (float): The factor every value is multiplied by.
+        offset (float): The amount added after scaling (0 for linear units).
+        out (buffer): Optional writable float64 buffer (NumPy array, `array.array('d')`,
+            `bytearray`, `memoryview`...) to write the result into; it may be `values`
+            itself to convert in place.
+    Returns:
+        numpy.ndarray: The converted values (a view of the `out` buffer when given), or
+            an `array.array('d')` / the `out` memoryview when NumPy is not installed.
+    Raises:
+        ValueError: If `out` does not have one float64 slot per value.
+    """
+    np = load_numpy()
+    if np is None:
+        return convert_sequence(values, scale, offset, out)
+    values = as_float_array(np, values)
+    if out is not None and not isinstance(out, np.ndarray):
+        if memoryview(out).format not in RAW_FORMATS:
+            raise ValueError("out must be a writable float64 buffer")
+        out = np.frombuffer(out, dtype=np.float64)  # Writes straight into the caller's memory
+    result = np.multiply(values, scale, out=out)
+    if offset:  # Linear units skip the second pass
+        np.add(result, offset, out=result)
+    return result
+
+
+RAW_FORMATS = ("B", "b", "c", "d")  # Buffer formats read as native float64 in place
+
+
+def as_float_array(np, values):
+    """
+    Returns `values` as a float64 NumPy array, without copying float64 buffers.
+    Raw byte buffers and 'd' views are read in place as native float64; views of any other
+    format (e.g. a memoryview of `array('f')`) are converted value by value.
+    """
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        view = memoryview(values)
+        if view.format in RAW_FORMATS:
+            return np.frombuffer(view, dtype=np.float64)
+        return np.asarray(view, dtype=np.float64)
+    return np.asarray(values, dtype=np.float64)  # No copy when it is already float64
+
+
+def float_view(buffer):
+    """
+    Returns a contiguous buffer as a memoryview of float64, or None when it is not a buffer.
+    Byte buffers are cast to native float64; typed buffers keep their own format.
+    """
+    try:
+        view = memoryview(buffer)
+    except TypeError:
+        return None
+    if view.format in ("B", "b", "c"):
+        return view.cast("B").cast("d")
+    return view
+
+
+def convert_sequence(values, scale, offset=0.0, out=None):
+    """
+    The pure-Python version of convert_array, used when NumPy is not installed.
+    Buffers are read and written through memoryviews, so nothing is copied but the results.
+    """
+    source = float_view(values)
+    if source is None:
+        source = values
+    if out is None:
+        return array("d", [value * scale + offset for value in source])
+    target = float_view(out)
+    if target is None or target.readonly or target.format != "d":  # The same buffers as convert_array
+        raise ValueError("out must be a writable float64 buffer")
+    if len(target) != len(source):
+        raise ValueError(f"out has {len(target)} values, expected {len(source)}")
+    for position, value in enumerate(source):  # Reads each value before writing it, so out may be values
+        target[position] = value * scale + offset
+    return target
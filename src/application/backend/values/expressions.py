@@ -0,0 +1,151 @@
+"""
+This module converts quantities written as free text, such as "5 ft 3 in", "12 st 4 lb",
+"98.6 F to C" or "5 ft 3 in to cm".
+- An expression is one or more (number, unit) terms of the same category, optionally followed
+  by "to", "as" or "->" and the destination unit. Without a destination the result is given
+  in the unit of the first term. Only linear units can be added up; an affine scale (a
+  temperature) must be a single term.
+- The numbers are cut out of the text first, which leaves its shape: "5 ft 3 in to cm" and
+  "6 ft 1 in to cm" both have the shape "# ft # in to cm". Every distinct shape is compiled
+  once into a plan, a closure holding the fused factors (and offset) of its terms, kept in a
+  bounded LRU cache. Repeated shapes skip the unit lookups entirely: evaluating them is one
+  regex pass and a few multiplications.
+- Units are resolved with the alias index of every category (names, symbols, plurals and
+  abbreviations, in any case; "F" for "°F").
+"""
+import re  # Used to cut the numbers out of the expressions
+from collections import namedtuple  # Used for the results
+from functools import lru_cache  # Used for the plan cache
+from operator import mul  # Used to add up the terms of a plan
+from . import registry  # Unit catalog
+
+PLAN_CACHE_SIZE = 4096  # Distinct expression shapes kept compiled
+
+NUMBER = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")  # A number of the expression
+TARGET = re.compile(r"\s*(?:->|\bto\b|\bas\b)\s*")  # Separates the quantity from the destination unit
+PLACEHOLDER = "#"  # Stands for a number in the shape of an expression
+OPERATOR = re.compile(r"[+*×÷=()\[\]{},;:!?<>^%&|\\]|(?<!\w)-|-(?!\w)")  # Not part of a unit ("nautical-mile" is)
+
+"""
+Result:
+- value (float): The converted quantity.
+- unit (registry.Unit): The unit of the value.
+"""
+Result = namedtuple("Result", ["value", "unit"])
+
+
+def resolve_unit(text, category=None):
+    """
+    Resolves the text of a unit, trying the given category first and then every category.
+    Args:
+        text (str): The unit as written in the expression (name, symbol or alias).
+        category (registry.Category): The category of the previous terms, or None.
+    Returns:
+        registry.Unit: The unit record.
+    Raises:
+        AttributeError: If no category defines the unit.
+    """
+    candidates = registry.catalog().values()
+    if category is not None:
+        candidates = [category, *(other for other in candidates if other is not category)]
+    for candidate in candidates:
+        try:
+            return candidate.unit(text)
+        except AttributeError:
+            continue
+    raise AttributeError(f"Unknown unit: {text}")
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_plan(shape):
+    """
+    Compiles the shape of an expression into a plan.
+    Args:
+        shape (str): The expression with every number replaced by PLACEHOLDER and its
+            whitespace normalized (e.g. "# ft # in to cm").
+    Returns:
+        tuple: (plan, unit) where plan(numbers) returns the converted value of the numbers of
+            the expression, in order, and unit is the `registry.Unit` of the result.
+    Raises:
+        ValueError: If the shape is not a quantity (e.g. a unit without a number, or terms
+            joined by an operator such as "-").
+        AttributeError: If a unit is not defined in any category.
+    """
+    quantity, *target = TARGET.split(shape, maxsplit=1)
+    terms = quantity.split(PLACEHOLDER)
+    if terms[0].strip() or len(terms) < 2:
+        raise ValueError(f"Not a quantity: {shape.replace(PLACEHOLDER, 'N')}")
+    units = []
+    for term in terms[1:]:
+        unit_text = term.strip()
+        if not unit_text:
+            raise ValueError(f"Missing unit in: {shape.replace(PLACEHOLDER, 'N')}")
+        if OPERATOR.search(unit_text):  # "10 m - 3 m": only sums of terms are supported
+            raise ValueError(f"Unexpected operator in: {shape.replace(PLACEHOLDER, 'N')}")
+        previous = registry.category(units[0].category) if units else None
+        units.append(resolve_unit(unit_text, previous))
+    category = registry.category(units[0].category)
+    if any(unit.category != category.name for unit in units):
+        raise ValueError(f"Units of different categories in: {shape.replace(PLACEHOLDER, 'N')}")
+    destin = resolve_unit(target[0].strip(), category) if target and target[0].strip() else units[0]
+    if destin.category != category.name:
+        raise ValueError(f"Cannot convert {category.title.lower()} to {destin.name}")
+    if len(units) > 1 and not category.linear:
+        raise ValueError(f"{category.title} can't be added up: {shape.replace(PLACEHOLDER, 'N')}")
+
+    ids = tuple(unit.id for unit in units)
+    if category.source is not None:  # Values that change while the process runs (exchange rates)
+        def plan(numbers):
+            category.source.refresh()
+            row = [category.factors[unit_id][destin.id] for unit_id in ids]
+            return sum(map(mul, numbers, row))
+    elif len(ids) == 1:
+        scale, offset = category.pair(ids[0], destin.id)
+        def plan(numbers):
+            return numbers[0] * scale + offset
+    else:
+        scales = tuple(category.factors[unit_id][destin.id] for unit_id in ids)  # Fused per term
+        def plan(numbers):
+            return sum(map(mul, numbers, scales))
+    return plan, destin
+
+
+def split_expression(text):
+    """
+    Cuts the numbers out of an expression.
+    Returns:
+        tuple: (shape, numbers) where shape is the key of the plan cache.
+    """
+    numbers = [float(number) for number in NUMBER.findall(text)]
+    shape = " ".join(NUMBER.sub(f" {PLACEHOLDER} ", text).split())
+    return shape, numbers
+
+
+def evaluate(text):
+    """
+    Converts a quantity written as free text.
+    Args:
+        text (str): The expression (e.g. "5 ft 3 in to cm").
+    Returns:
+        Result: The converted value and its unit.
+    Raises:
+        ValueError: If the text is not a quantity, uses an operator, mixes categories or adds
+            up temperatures.
+        AttributeError: If a unit is not defined in any category.
+    """
+    shape, numbers = split_expression(text)
+    plan, unit = compile_plan(shape)
+    return Result(plan(numbers), unit)
+
+
+def evaluate_many(lines):
+    """
+    Converts an iterable of expressions, one result at a time.
+    Yields:
+        Result: The converted value and unit of every line, or the error it raised.
+    """
+    for line in lines:
+        try:
+            yield evaluate(line)
+        except (ValueError, AttributeError) as error:
+            yield error
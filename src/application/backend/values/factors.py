@@ -0,0 +1,73 @@
+"""
+This module builds the conversion-factor tables of the linear unit classes.
+- Every unit gets an integer ID given by its position in its category, so callers in hot
+  loops can pass IDs instead of names (see `registry.Category`).
+- The factor of every (origin, destination) pair is computed once, with exact fractions,
+  and rounded a single time to float. Converting is then one multiply by table[i][j].
+- Affine scales (temperatures) also get an offset table, so converting is one multiply
+  and one add: value * factor[i][j] + offset[i][j].
+"""
+from fractions import Fraction  # Used to compute the factor products without rounding
+
+
+def define_units(unit_class, unit_type, category):
+    """
+    Sets the units of a category as class attributes, named after the units with their
+    spaces replaced by underscores (e.g. `longitudes.Nautical_Mile`).
+    Args:
+        unit_class (type): The class receiving the units.
+        unit_type (type): The type of the unit instances (e.g. `longitud`), built from
+            (name, value, symbol).
+        category (registry.Category): The category declaring the units.
+    """
+    for unit in category.units:
+        setattr(unit_class, unit.name.replace(" ", "_"), unit_type(unit.name, unit.value, unit.symbol))
+
+
+def exact(value):
+    """
+    Returns a declared unit value as an exact fraction.
+    Floats go through str() so that 0.0254 is read as the decimal 254/10000; fractions and
+    strings such as "5/9" are kept exactly.
+    """
+    if isinstance(value, Fraction):
+        return value
+    return Fraction(str(value))
+
+
+def build_factor_table(scales):
+    """
+    Builds the N x N table where table[i][j] converts a value from unit i to unit j.
+    Args:
+        scales (list): The value of every unit in the base unit, as exact fractions.
+    Returns:
+        tuple: A tuple of tuples of floats (fast to index from Python code).
+    """
+    return tuple(tuple(float(origin / destin) for destin in scales) for origin in scales)
+
+
+def build_offset_table(scales, offsets):
+    """
+    Builds the N x N table of offsets of an affine category.
+    A unit i measures base = value * scales[i] + offsets[i], so converting from unit i to
+    unit j is value * factor[i][j] + table[i][j], with table[i][j] = (offsets[i] - offsets[j]) / scales[j].
+    Args:
+        scales (list): The scale of every unit relative to the base unit, as exact fractions.
+        offsets (list): The offset of every unit relative to the base unit, as exact fractions.
+    Returns:
+        tuple: A tuple of tuples of floats.
+    """
+    return tuple(
+        tuple(float((origin_offset - destin_offset) / destin_scale)
+              for destin_scale, destin_offset in zip(scales, offsets))
+        for origin_offset in offsets
+    )
+
+
+def build_factor_matrix(table):
+    """Returns a factor or offset table as a dense float64 NumPy matrix (for vectorized lookups)."""
+    import numpy as np  # Imported on first use: scalar conversions do not need NumPy
+    matrix = np.array(table, dtype=np.float64)
+    matrix.setflags(write=False)  # The table is shared by every converter
+    return matrix
+
@@ -0,0 +1,149 @@
+"""
+This module formats converted values as text.
+- PRECISION holds the number of decimals shown for every category; the window, the bulk
+  panel and the command line tools all read it here.
+- format_value(value, category) formats one result for the interface.
+- format_array / write_array turn a whole array into fixed-precision lines, optionally with
+  thousands separators, written as bytes. The digits are computed with NumPy for a block of
+  rows at a time and laid out in a byte matrix, so no Python string is built per value.
+  The values are rounded as value * 10^precision; the rows that lie close to a half (where
+  that product may round the other way) are rounded again from their exact binary value, so
+  the output is the same as `format()` digit for digit.
+"""
+from fractions import Fraction  # Used to round the values close to a half exactly
+from .engine import as_float_array, load_numpy  # NumPy is only needed by the bulk formatter
+
+PRECISION = {  # Decimals shown for each category
+    "currencies": 2,
+    "longitudes": 4,
+    "temperatures": 2,
+    "weights_and_masses": 3,
+}
+DEFAULT_PRECISION = 4  # Decimals of the categories not listed in PRECISION
+DEFAULT_CHUNK_SIZE = 65536  # Rows formatted at once by write_array
+EXACT_LIMIT = 2 ** 53  # Scaled values up to this size are exact integers in float64
+TIE_TOLERANCE = 2.0 ** -48  # Relative distance to a half under which a row is rounded exactly
+
+
+def precision(category):
+    """Returns the number of decimals shown for a category."""
+    return PRECISION.get(category, DEFAULT_PRECISION)
+
+
+def format_value(value, category, grouping=True):
+    """
+    Formats one converted value with the precision of its category (e.g. "1,234.5679").
+    Args:
+        value (float): The converted value.
+        category (str): The name of the category of the value.
+        grouping (bool): True to separate the thousands with commas.
+    """
+    return f"{value:{',' if grouping else ''}.{precision(category)}f}"
+
+
+def format_array(values, decimals, grouping=False, separator=b"\n", nan=b"nan"):
+    """
+    Formats an array of values as bytes, every value followed by `separator`.
+    Args:
+        values (array_like | buffer): The values to format.
+        decimals (int): The number of decimals of every value.
+        grouping (bool): True to separate the thousands with commas.
+        separator (bytes): Written after every value.
+        nan (bytes): Written for NaN values (e.g. b"" for empty CSV cells).
+    Returns:
+        bytes: The formatted values.
+    """
+    output = bytearray()
+    write_array(values, output, decimals, grouping, separator, nan)
+    return bytes(output)
+
+
+def write_array(values, output, decimals, grouping=False, separator=b"\n", nan=b"nan",
+                chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Formats an array of values straight into a byte buffer or a binary stream.
+    Args:
+        values (array_like | buffer): The values to format.
+        output (bytearray | stream): A bytearray (extended) or an object with `write(bytes)`.
+        decimals (int): The number of decimals of every value.
+        grouping (bool): True to separate the thousands with commas.
+        separator (bytes): Written after every value.
+        nan (bytes): Written for NaN values.
+        chunk_size (int): The number of values formatted at once (bounds the memory used).
+    Returns:
+        int: The number of bytes written.
+    """
+    np = load_numpy()
+    values = as_float_array(np, values).reshape(-1)
+    write = output.extend if isinstance(output, bytearray) else output.write
+    written = 0
+    for start in range(0, len(values), chunk_size):
+        text = format_chunk(np, values[start:start + chunk_size], decimals, grouping, separator, nan)
+        write(text)
+        written += len(text)
+    return written
+
+
+def format_chunk(np, values, decimals, grouping, separator, nan):
+    """
+    Formats a block of values with NumPy.
+    Every row is laid out right-aligned in a byte matrix (digits, separators, sign), and the
+    padding on the left of each row is dropped with a mask, which also joins the rows.
+    """
+    scale = 10 ** decimals
+    finite = np.isfinite(values)
+    magnitude = np.abs(np.where(finite, values, 0.0)) * scale
+    if (magnitude >= EXACT_LIMIT).any():  # Too large for exact integer digits
+        return format_chunk_python(values, decimals, grouping, separator, nan)
+    rounded = np.rint(magnitude).astype(np.int64)
+    near_tie = np.flatnonzero(np.abs(magnitude - np.floor(magnitude) - 0.5) <= magnitude * TIE_TOLERANCE)
+    for row in near_tie.tolist():  # The product may have rounded across the half: use the exact value
+        rounded[row] = round(abs(Fraction(float(values[row]))) * scale)
+    whole, fraction = np.divmod(rounded, scale)
+    digit_counts = np.searchsorted(10 ** np.arange(1, 19, dtype=np.int64), whole, side="right") + 1
+    negative = np.signbit(values)
+    is_nan = np.isnan(values)
+    is_inf = np.isinf(values)
+
+    widths = negative.astype(np.int64) + digit_counts + (decimals + 1 if decimals else 0)
+    if grouping:
+        widths += (digit_counts - 1) // 3
+    widths = np.where(is_nan, len(nan), np.where(is_inf, 3 + negative, widths)) + len(separator)
+    max_digits = int(digit_counts.max()) if len(values) else 0
+    layout = max_digits + (decimals + 1 if decimals else 0) + len(separator)  # Columns written for every row
+    if grouping:
+        layout += max(max_digits - 1, 0) // 3
+    total = max(int(widths.max()), layout) if len(widths) else 0
+    matrix = np.zeros((len(values), total), dtype=np.uint8)
+
+    column = total - len(separator)
+    if separator:
+        matrix[:, column:] = np.frombuffer(separator, dtype=np.uint8)
+    for position in range(decimals):  # Decimals, from the right
+        column -= 1
+        matrix[:, column] = 48 + (fraction // 10 ** position) % 10
+    if decimals:
+        column -= 1
+        matrix[:, column] = ord(".")
+    for position in range(max_digits):  # Integer digits, from the right
+        if grouping and position and position % 3 == 0:
+            column -= 1
+            matrix[:, column] = ord(",")
+        column -= 1
+        matrix[:, column] = 48 + (whole // 10 ** position) % 10
+
+    starts = total - widths
+    signed = np.flatnonzero(negative & ~is_nan)
+    matrix[signed, starts[signed]] = ord("-")
+    end = total - len(separator)
+    for text, rows in ((nan, is_nan), (b"inf", is_inf)):
+        if text and rows.any():
+            matrix[rows, end - len(text):end] = np.frombuffer(text, dtype=np.uint8)
+    return matrix[np.arange(total) >= starts[:, None]].tobytes()
+
+
+def format_chunk_python(values, decimals, grouping, separator, nan):
+    """Formats a block of values one by one (used for values beyond the exact integer range)."""
+    template = f"{{:{',' if grouping else ''}.{decimals}f}}"
+    texts = [nan if value != value else template.format(value).encode("ascii") for value in values.tolist()]
+    return separator.join(texts) + separator if texts else b""
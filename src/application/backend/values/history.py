@@ -0,0 +1,131 @@
+"""
+This module contains the historical exchange-rate store.
+- The `HistoricalRates` class keeps one time series per currency: a sorted array of dates
+  and the array of rates in force from each date (value of one unit in USD).
+- rate_at(currency, when) finds the rate in force at a moment with a binary search.
+- convert(amounts, currencies, timestamps, destin) converts a whole ledger: the rows are
+  grouped by currency and every group resolves its rates with one vectorized searchsorted.
+
+History files are CSV files with a "date,currency,rate" header, e.g.:
+    date,currency,rate
+    2025-06-02,EUR,1.14
+    2025-06-03,EUR,1.15
+"""
+import csv  # Used to read the history files
+import numpy as np  # Used for the time series and the vectorized lookups
+
+from .rates import parse_rate  # The same rate checks as the rate files
+
+BASE_CURRENCY = "USD"  # The currency every rate is expressed in
+TIME_UNIT = "datetime64[s]"  # The resolution of the timestamps
+
+
+class HistoricalRates:
+    """
+    Exchange rates over time, one sorted series per currency.
+    Attributes:
+        series (dict): Currency code -> (dates, rates) arrays sorted by date.
+    """
+
+    def __init__(self, series):
+        """
+        Args:
+            series (dict): Currency code -> (dates, rates). The dates may be datetime64 values
+                or ISO strings and do not need to be sorted.
+        Raises:
+            ValueError: If a series has not one rate per date, or a rate is not a positive
+                finite number.
+        """
+        self.series = {}
+        for code, (dates, rates) in series.items():
+            dates = np.asarray(dates, dtype=TIME_UNIT)
+            rates = np.asarray(rates, dtype=np.float64)
+            if len(dates) != len(rates):
+                raise ValueError(f"The history of {code} has {len(dates)} dates and {len(rates)} rates")
+            invalid = np.flatnonzero(~(np.isfinite(rates) & (rates > 0)))
+            if invalid.size:
+                parse_rate(code, rates[invalid[0]], "The history")  # Raises the error of the rate files
+            order = np.argsort(dates, kind="stable")
+            self.series[code] = (dates[order], rates[order])
+
+    @classmethod
+    def from_files(cls, *paths):
+        """
+        Loads the history from one or more CSV files ("date,currency,rate").
+        Raises:
+            OSError: If a file can't be read.
+            KeyError: If a file is missing one of the columns.
+            ValueError: If a date can't be parsed or a rate is not a positive finite number.
+        """
+        columns = {}
+        for path in paths:
+            with open(path, newline="", encoding="utf-8") as history_file:
+                reader = csv.DictReader(history_file)
+                for row in reader:
+                    code = row["currency"].strip()
+                    dates, rates = columns.setdefault(code, ([], []))
+                    dates.append(row["date"].strip())
+                    rates.append(parse_rate(code, row["rate"], f"{path} line {reader.line_num}"))
+        return cls(columns)
+
+    def currencies(self):
+        """Returns the codes of the currencies with a history (plus the base currency)."""
+        return sorted(set(self.series) | {BASE_CURRENCY})
+
+    def _lookup(self, code, timestamps):
+        """
+        Returns the rates of one currency in force at every timestamp (vectorized).
+        Raises:
+            AttributeError: If the currency has no history.
+            ValueError: If a timestamp is earlier than the first rate of the currency.
+        """
+        if code == BASE_CURRENCY and code not in self.series:
+            return np.ones(timestamps.shape, dtype=np.float64)
+        try:
+            dates, rates = self.series[code]
+        except KeyError:
+            raise AttributeError(f"No exchange-rate history for {code}") from None
+        positions = np.searchsorted(dates, timestamps, side="right") - 1  # Last date <= timestamp
+        if positions.size and positions.min() < 0:
+            raise ValueError(f"No {code} rate before {timestamps[positions.argmin()]}")
+        return rates[positions]
+
+    def rate_at(self, code, when):
+        """
+        Returns the rate of a currency in force at a moment.
+        Args:
+            code (str): The currency code.
+            when (str | datetime | numpy.datetime64): The moment.
+        Returns:
+            float: The value of one unit of the currency in USD at that moment.
+        """
+        return float(self._lookup(code, np.asarray([when], dtype=TIME_UNIT))[0])
+
+    def convert(self, amounts, currencies, timestamps, destin=BASE_CURRENCY):
+        """
+        Converts every row of a ledger with the rates in force at its timestamp.
+        Args:
+            amounts (array_like): The amounts.
+            currencies (array_like): The currency code of every amount.
+            timestamps (array_like): The moment of every amount (datetime64 or ISO strings).
+            destin (str): The currency to convert every amount to.
+        Returns:
+            numpy.ndarray: The converted amounts, in the order of the rows.
+        Raises:
+            AttributeError: If a currency has no history.
+            ValueError: If a row is earlier than the first rate of its currency.
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=TIME_UNIT)
+        codes, rows_codes = np.unique(np.asarray(currencies), return_inverse=True)
+        rows_codes = rows_codes.reshape(-1)
+        order = np.argsort(rows_codes, kind="stable")  # Rows grouped by currency
+        bounds = np.searchsorted(rows_codes[order], np.arange(len(codes) + 1))
+        rates = np.empty(amounts.shape, dtype=np.float64)
+        for index, code in enumerate(codes.tolist()):  # One vectorized lookup per currency
+            rows = order[bounds[index]:bounds[index + 1]]
+            rates[rows] = self._lookup(code, timestamps[rows])
+        result = amounts * rates
+        if destin != BASE_CURRENCY:
+            result /= self._lookup(destin, timestamps)
+        return result
@@ -1,11 +1,16 @@
 """
 This module defines a class `longitudes` that provides a set of predefined length units
 and a method to convert values between these units. 
+The units are declared in data/units.json (see `definitions`).
 """
+from .engine import convert_array  # Vectorized conversion for batches
+from . import definitions, factors  # Unit definitions and the unit attributes of the class
+
 class longitud:
-    def __init__(self, name, value):
+    def __init__(self, name, value, symbol=None):
         self.name = name
         self.value = value
+        self.symbol = symbol
 
 """
 Classes:
@@ -13,46 +18,63 @@ Classes:
         A class containing predefined length units as class attributes and a method 
         for unit conversion.
 Attributes:
-    Nanometer (longitud): Represents the unit "Nanometer" with a value of 1e-9 meters.
-    Micron (longitud): Represents the unit "Micron" with a value of 1e-6 meters.
-    Millimeter (longitud): Represents the unit "Millimeter" with a value of 0.001 meters.
-    Centimeter (longitud): Represents the unit "Centimeter" with a value of 0.01 meters.
-    Meter (longitud): Represents the base unit "Meter" with a value of 1 meter.
-    Kilometer (longitud): Represents the unit "Kilometer" with a value of 1000 meters.
-    Inche (longitud): Represents the unit "Inche" with a value of 0.0254 meters.
-    Feet (longitud): Represents the unit "Feet" with a value of 0.3048 meters.
-    Yard (longitud): Represents the unit "Yard" with a value of 0.9144 meters.
-    Mile (longitud): Represents the unit "Mile" with a value of 1609.34 meters.
-    Nautical_Mile (longitud): Represents the unit "Nautical Mile" with a value of 1852 meters.
+    One `longitud` per unit declared in data/units.json, named after the unit with its spaces
+    replaced by underscores (Nanometer, Micron, ..., Meter (base unit), ..., Nautical_Mile),
+    with its value in meters.
 """
 class longitudes:
-    Nanometer = longitud("Nanometer", 1e-9)
-    Micron = longitud("Micron", 1e-6)
-    Millimeter = longitud("Millimeter", 0.001)
-    Centimeter = longitud("Centimeter", 0.01) 
-    Meter = longitud("Meter", 1) # unit base
-    Kilometer = longitud("Kilometer", 1000)
-    Inche = longitud("Inche", 0.0254)
-    Feet = longitud("Feet", 0.3048) 
-    Yard = longitud("Yard", 0.9144)
-    Mile = longitud("Mile", 1609.34)
-    Nautical_Mile = longitud("Nautical Mile", 1852)
-    
     """
     Methods:
         convert_longitud(value, origin, destin):
             Converts a given value from one length unit to another.
             Parameters:
                 value (float): The numerical value to be converted.
-                origin (str): The name of the origin unit (case-insensitive).
-                destin (str): The name of the destination unit (case-insensitive).
+                origin (str | int): The name of the origin unit (case-insensitive) or its ID.
+                destin (str | int): The name of the destination unit (case-insensitive) or its ID.
             Returns:
                 float: The converted value in the destination unit.
             Raises:
                 AttributeError: If the origin or destination unit is not defined in the class.
     """
     def convert_longitud(self, value, origin, destin):
-        value = float(value)
-        origin_unit = getattr(longitudes, origin.title().replace(" ", "_")) # Convert to title case and replace spaces with underscores
-        destin_unit = getattr(longitudes, destin.title().replace(" ", "_")) # Convert to title case and replace spaces with underscores
-        return (value * origin_unit.value) / destin_unit.value 
\ No newline at end of file
+        return float(value) * FACTORS[unit_id(origin)][unit_id(destin)] # One multiply by the precomputed factor
+
+    """
+    Methods:
+        convert_longitud_batch(values, origin, destin, out=None):
+            Converts a whole array of values from one length unit to another.
+            The units are resolved once and the array is converted in a single operation.
+            Parameters:
+                values (array_like): A NumPy array, any sequence of numbers or a float64 buffer.
+                origin (str | int): The name of the origin unit (case-insensitive) or its ID.
+                destin (str | int): The name of the destination unit (case-insensitive) or its ID.
+                out (buffer): Optional writable float64 buffer to write the result into (may be `values`).
+            Returns:
+                numpy.ndarray: The converted values in the destination unit.
+            Raises:
+                AttributeError: If the origin or destination unit is not defined in the class.
+    """
+    def convert_longitud_batch(self, values, origin, destin, out=None):
+        return convert_array(values, FACTORS[unit_id(origin)][unit_id(destin)], out=out)
+
+
+"""
+Unit IDs and conversion factors, loaded once from the unit definitions and shared through the registry.
+- CATEGORY (registry.Category): The units of this module, with their name/alias/ID indexes.
+- UNIT_NAMES (tuple): The unit names; the position of each name is its integer ID.
+- FACTORS (tuple): FACTORS[i][j] converts a value from unit i to unit j.
+- FACTOR_MATRIX (numpy.ndarray): The same factors as a dense read-only matrix, built on first access.
+- ALIASES (dict): Extra spellings of the units, besides their names, symbols and plurals.
+"""
+CATEGORY = definitions.category("longitudes")
+factors.define_units(longitudes, longitud, CATEGORY)  # longitudes.Meter, longitudes.Nautical_Mile...
+ALIASES = CATEGORY.aliases
+UNIT_NAMES = CATEGORY.names
+FACTORS = CATEGORY.factors
+unit_id = CATEGORY.unit_id  # Returns the integer ID of a unit given by name, alias or ID
+
+
+def __getattr__(name):
+    if name == "FACTOR_MATRIX":  # Built on first access, so that importing this module does not load NumPy
+        return CATEGORY.matrix
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,132 @@
+"""
+This module loads the currency exchange rates from a local rate file.
+- The `RateTable` class parses a JSON or CSV rate file, keeps the table in memory and
+  checks the modification time of the file at most once per TTL.
+- When the file changes, the new rates are swapped into the currency category, so the
+  converters and the interface use them without a restart.
+
+Rate file formats (every rate is the value of one unit of the currency in USD):
+- JSON: {"date": "2025-06-02", "rates": {"USD": 1, "MXN": 0.052, ...}}
+- CSV: a "currency,rate" header followed by one row per currency.
+"""
+import csv  # Used to read CSV rate files
+import json  # Used to read JSON rate files
+import math  # Used to reject rates that are not finite
+import os  # Used for the modification time of the rate file
+import threading  # Used to reload the table from one thread at a time
+import time  # Used for the TTL between file checks
+import warnings  # Used to report rate files that can't be read
+from pathlib import Path  # Used to handle file paths in a platform-independent way
+
+DEFAULT_RATE_FILE = Path(__file__).resolve().parent / "data" / "rates.json"
+DEFAULT_TTL = 5.0  # Seconds between two checks of the rate file
+
+
+def read_rate_file(path):
+    """
+    Reads a JSON or CSV rate file.
+    Args:
+        path (Path): The rate file; the format is chosen by its extension.
+    Returns:
+        tuple: (rates, date) where rates maps currency codes to their value in USD and
+            date is the date of the rates (or None when the file does not give it).
+    Raises:
+        OSError: If the file can't be read.
+        ValueError: If the file is not a valid rate file (not a mapping of currency codes to
+            positive finite numbers).
+    """
+    with open(path, newline="", encoding="utf-8") as rate_file:
+        if path.suffix.lower() == ".csv":
+            rows = [(row.get("currency"), row.get("rate")) for row in csv.DictReader(rate_file)]
+            date = None
+        else:
+            content = json.load(rate_file)
+            if not isinstance(content, dict) or not isinstance(content.get("rates"), dict):
+                raise ValueError(f"{path} has no \"rates\" object")
+            rows = list(content["rates"].items())
+            date = content.get("date")
+    rates = {}
+    for code, rate in rows:
+        if not isinstance(code, str) or not code.strip():
+            raise ValueError(f"{path} has a rate without a currency code")
+        rates[code.strip()] = parse_rate(code.strip(), rate, path)
+    return rates, date
+
+
+def parse_rate(code, rate, source):
+    """
+    Returns a rate read from a rate file as a float.
+    Args:
+        code (str): The currency of the rate.
+        rate (float | str): The rate as read from the file.
+        source (str | Path): Where the rate comes from, for the error message.
+    Raises:
+        ValueError: If the rate is not a positive finite number.
+    """
+    try:
+        if isinstance(rate, bool):  # JSON true/false are not rates
+            raise TypeError
+        rate = float(rate)
+    except (TypeError, ValueError):
+        raise ValueError(f"{source} has an invalid rate for {code}: {rate!r}") from None
+    if not (math.isfinite(rate) and rate > 0):
+        raise ValueError(f"{source} has a rate that is not a positive number: {code}")
+    return rate
+
+
+class RateTable:
+    """
+    A rate file loaded into a currency category, reloaded when the file changes.
+    Attributes:
+        path (Path): The rate file.
+        ttl (float): The seconds between two checks of the modification time of the file.
+        date (str): The date of the loaded rates, or None.
+    """
+
+    def __init__(self, category, path=None, ttl=DEFAULT_TTL):
+        """
+        Args:
+            category (registry.Category): The currency category the rates are loaded into.
+            path (str | Path): The rate file (default: $UNIT_CONVERSOR_RATES or data/rates.json).
+            ttl (float): The seconds between two checks of the rate file.
+        """
+        self.category = category
+        self.path = Path(path or os.environ.get("UNIT_CONVERSOR_RATES") or DEFAULT_RATE_FILE)
+        self.ttl = ttl
+        self.date = None
+        self._mtime = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Reloads the rates if the TTL has expired and the file has changed since the last load.
+        Between two checks this is a single comparison.
+        """
+        if time.monotonic() < self._next_check:
+            return
+        with self._lock:
+            if time.monotonic() < self._next_check:  # Another thread has just checked
+                return
+            self._next_check = time.monotonic() + self.ttl
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except OSError:
+                return  # Keep the current rates while the file is missing
+            if mtime != self._mtime:
+                self._mtime = mtime
+                self.load()
+
+    def load(self):
+        """
+        Loads the rate file into the category now.
+        Currencies that are not in the category are ignored, and a file that can't be read
+        leaves the current rates in place.
+        """
+        try:
+            rates, date = read_rate_file(self.path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+            warnings.warn(f"Could not load the exchange rates from {self.path}: {error}")
+            return
+        self.category.replace_values(rates)
+        self.date = date
@@ -0,0 +1,268 @@
+"""
+This module contains the central registry of unit categories.
+- The `Unit` tuple describes a single unit: its ID, name, symbol, and scale and offset
+  relative to the base unit.
+- The `Category` class holds the ordered, immutable units of one category together with
+  dict indexes by name, alias and ID, and the (scale, offset) tables of every unit pair.
+- The alias index is built once per category: names, symbols, plurals and the abbreviations
+  declared by the value modules, stored under their exact spelling and their normalized
+  form (see `normalize_alias`), so "inches", "IN" and "in" all resolve with a hash probe.
+- Every value module takes its `Category` from the unit definitions (see `definitions`) at
+  import; `catalog()` collects them once, in menu order, followed by the categories that
+  only exist in the definitions (times and the derived areas, volumes and speeds), so
+  listing and resolving units costs a dict lookup.
+"""
+from collections import namedtuple  # Used for the immutable unit records
+from functools import lru_cache  # Used to build the catalog only once
+from importlib import import_module  # Used to load the value modules on first use
+from operator import index  # Used to accept any integer type (int, numpy.int64...) as an ID
+from types import MappingProxyType  # Used for the read-only indexes
+from unicodedata import normalize  # Used to fold the spellings of the aliases (µ and μ, ...)
+from . import factors  # Factor tables of the linear categories
+
+"""
+Unit:
+- id (int): The position of the unit in its category.
+- name (str): The display name of the unit (e.g. "Nautical Mile").
+- symbol (str): The short symbol of the unit (e.g. "nmi"), or None.
+- value (float): The value of the unit in the base unit (the scale of an affine unit).
+- offset (float): The offset of the unit in the base unit (0 except for affine scales):
+  base = measure * value + offset.
+- category (str): The name of the category the unit belongs to.
+"""
+Unit = namedtuple("Unit", ["id", "name", "symbol", "value", "offset", "category"])
+
+def normalize_alias(text):
+    """
+    Returns the normalized spelling of a unit alias: Unicode-compatible, case-folded, with
+    underscores and hyphens read as spaces and the whitespace collapsed.
+    ("Nautical_Mile", "nautical-mile" and " NAUTICAL  MILE " all give "nautical mile".)
+    """
+    return " ".join(normalize("NFKC", text).replace("_", " ").replace("-", " ").split()).casefold()
+
+
+def unit_aliases(name, symbol, extra=()):
+    """
+    Returns every spelling a unit is known by: its name, the name of its class attribute,
+    its symbol (also without the degree sign), the plural of its name and the `extra` aliases.
+    """
+    aliases = [name, name.replace(" ", "_"), symbol]
+    if symbol and symbol.startswith("°"):
+        aliases.append(symbol[1:])  # "C" for "°C"
+    if not name.endswith(("s", "S")) and name[-1:].isalpha() and not name.isupper():
+        aliases.append(name + "s")  # "Inches", "Nautical Miles" (currency codes have no plural)
+    aliases.extend(extra)
+    return [alias for alias in aliases if alias]
+
+
+"""The value modules in the order the categories are shown in the menu"""
+CATEGORY_MODULES = ("currencies", "longitudes", "temperatures", "weights_and_masses")
+
+
+class Category:
+    """
+    An ordered, immutable set of units of the same kind.
+    Attributes:
+        name (str): The name of the category (the name of its value module).
+        title (str): The name shown to the user (e.g. "Weights & Masses").
+        units (tuple): The `Unit` records; units[i] is the unit with ID i.
+        names (tuple): The display names of the units, in order.
+        by_name (mapping): Display name -> `Unit`.
+        by_alias (mapping): Every alias (see `unit_aliases`), under its exact spelling and
+            its normalized spelling -> `Unit`.
+        aliases (dict): Unit name -> the extra aliases declared for the unit.
+        linear (bool): True when every unit is a plain factor of the base unit.
+        scales (tuple): The exact value of every unit in the base unit (fractions).
+        dimension (tuple): The exponents of the category over `dimensions.DIMENSIONS` (e.g.
+            (1, 0, -1) for speeds), or None for the categories outside the dimensional system.
+        factors (tuple): factors[i][j] is the scale that converts from unit i to unit j.
+        matrix (numpy.ndarray): The factors as a dense read-only matrix.
+        offsets (tuple): offsets[i][j] is the offset added after scaling (None if linear).
+        offset_matrix (numpy.ndarray): The offsets as a dense read-only matrix (None if linear).
+        source: An optional value source (e.g. `rates.RateTable`) whose `refresh()` is called
+            before a pair is resolved, so its values can change while the process runs.
+    """
+
+    def __init__(self, name, title, units, aliases=None, dimension=None):
+        """
+        Args:
+            name (str): The name of the category.
+            title (str): The name shown to the user.
+            units (iterable): (name, symbol, value) or (name, symbol, value, offset) tuples in
+                display order. Values and offsets may be floats, strings ("5/9") or fractions.
+            aliases (dict): Unit name -> extra aliases (abbreviations, other spellings).
+            dimension (tuple): The exponents of the category over the base dimensions, or None.
+        """
+        self.name = name
+        self.title = title
+        definitions = [tuple(unit) + (0,) * (4 - len(unit)) for unit in units]
+        scales = [factors.exact(value) for _, _, value, _ in definitions]
+        offsets = [factors.exact(offset) for _, _, _, offset in definitions]
+        self.units = tuple(
+            Unit(unit_id, unit_name, symbol, float(scale), float(offset), name)
+            for unit_id, ((unit_name, symbol, _, _), scale, offset)
+            in enumerate(zip(definitions, scales, offsets))
+        )
+        self.names = tuple(unit.name for unit in self.units)
+        self.by_name = MappingProxyType({unit.name: unit for unit in self.units})
+        self.aliases = dict(aliases or {})
+        by_alias = {}
+        for unit in self.units:  # Exact spellings first, so they win over normalized collisions
+            for alias in unit_aliases(unit.name, unit.symbol, self.aliases.get(unit.name, ())):
+                by_alias.setdefault(alias, unit)
+        for alias, unit in list(by_alias.items()):
+            by_alias.setdefault(normalize_alias(alias), unit)
+        self.by_alias = MappingProxyType(by_alias)
+        self._resolved = {}  # Spelling -> unit ID, filled by unit_ids()
+        self.linear = not any(offsets)
+        self.scales = tuple(scales)
+        self.dimension = dimension
+        self.factors = factors.build_factor_table(scales)
+        self.offsets = None if self.linear else factors.build_offset_table(scales, offsets)
+        self.source = None
+        self._matrices = None  # Built on first use, so that scalar-only callers never import NumPy
+
+    @property
+    def matrix(self):
+        """The factor table as a dense read-only NumPy matrix (built on first use)."""
+        return self._get_matrices()[0]
+
+    @property
+    def offset_matrix(self):
+        """The offset table as a dense read-only NumPy matrix, or None for linear categories."""
+        return self._get_matrices()[1]
+
+    def _get_matrices(self):
+        matrices = self._matrices
+        if matrices is None:
+            matrices = (
+                factors.build_factor_matrix(self.factors),
+                None if self.offsets is None else factors.build_factor_matrix(self.offsets),
+            )
+            self._matrices = matrices
+        return matrices
+
+    def __repr__(self):
+        return f"Category({self.name!r}, {len(self.units)} units)"
+
+    def __getstate__(self):
+        """The state kept in a snapshot (see `definitions`): the indexes as plain dicts, without
+        the NumPy matrices, the resolved spellings or the value source of this process."""
+        state = dict(vars(self))
+        state.update(by_name=dict(self.by_name), by_alias=dict(self.by_alias),
+                     _resolved={}, _matrices=None, source=None)
+        return state
+
+    def __setstate__(self, state):
+        vars(self).update(state)
+        self.by_name = MappingProxyType(self.by_name)
+        self.by_alias = MappingProxyType(self.by_alias)
+
+    def unit(self, unit):
+        """
+        Resolves a unit name, alias or ID to its `Unit` record.
+        Args:
+            unit (str | int): The unit name, symbol or alias (in any case) or integer ID.
+        Returns:
+            Unit: The unit record.
+        Raises:
+            AttributeError: If the unit is not defined in the category.
+        """
+        if not isinstance(unit, str):
+            unit_id = index(unit)
+            if 0 <= unit_id < len(self.units):
+                return self.units[unit_id]
+            raise AttributeError(f"Unknown {self.name} unit ID: {unit}")
+        record = self.by_alias.get(unit)  # Exact spelling, one dict lookup
+        if record is None:
+            record = self.by_alias.get(normalize_alias(unit))  # Any other spelling, one more lookup
+            if record is None:
+                raise AttributeError(f"Unknown {self.name} unit: {unit}")
+        return record
+
+    def unit_id(self, unit):
+        """Returns the integer ID of a unit given by name, alias or ID."""
+        return self.unit(unit).id
+
+    def unit_ids(self, units):
+        """
+        Resolves a batch of units (e.g. a column of mixed spellings) to their integer IDs.
+        Every distinct spelling is resolved once; the following rows are a dict lookup.
+        Args:
+            units (iterable): Unit names, symbols, aliases or IDs.
+        Returns:
+            list: The unit IDs, in order.
+        Raises:
+            AttributeError: If a unit is not defined in the category.
+        """
+        resolved = self._resolved
+        ids = []
+        for unit in units:
+            unit_id = resolved.get(unit)
+            if unit_id is None:
+                unit_id = resolved[unit] = self.unit(unit).id
+            ids.append(unit_id)
+        return ids
+
+    def pair(self, origin, destin):
+        """
+        Returns the coefficients that convert a value from one unit to another.
+        Args:
+            origin (str | int): The unit to convert from (name, alias or ID).
+            destin (str | int): The unit to convert to (name, alias or ID).
+        Returns:
+            tuple: (scale, offset) so that converted = value * scale + offset.
+        Raises:
+            AttributeError: If a unit is not defined in the category.
+        """
+        if self.source is not None:
+            self.source.refresh()  # Swaps in new values when the source has changed
+        origin_id = self.unit(origin).id
+        destin_id = self.unit(destin).id
+        if self.offsets is None:
+            return self.factors[origin_id][destin_id], 0.0
+        return self.factors[origin_id][destin_id], self.offsets[origin_id][destin_id]
+
+    def replace_values(self, values):
+        """
+        Swaps in new unit values (e.g. fresh exchange rates) and rebuilds the tables.
+        The names, symbols and IDs do not change, so the category keeps its identity and
+        everything holding it sees the new values.
+        Args:
+            values (dict): Unit name -> new value; units not in the dict keep their value.
+        """
+        updated = Category(
+            self.name,
+            self.title,
+            ((unit.name, unit.symbol, values.get(unit.name, unit.value), unit.offset) for unit in self.units),
+            self.aliases,
+            self.dimension,
+        )
+        updated.source = self.source
+        vars(self).update(vars(updated))
+
+
+@lru_cache(maxsize=None)
+def catalog():
+    """
+    Returns the catalog of every category, built once on first use.
+    Returns:
+        mapping: Category name -> `Category`: the categories of the value modules in menu
+            order, then the other categories of the unit definitions (read-only).
+    """
+    categories = {}
+    for module_name in CATEGORY_MODULES:
+        module = import_module(f".{module_name}", __package__)
+        categories[module.CATEGORY.name] = module.CATEGORY
+    for name, declared in import_module(".definitions", __package__).load().items():
+        categories.setdefault(name, declared)  # Categories without a value module
+    return MappingProxyType(categories)
+
+
+def category(name):
+    """
+    Returns a category of the catalog by name.
+    Raises:
+        KeyError: If the category does not exist.
+    """
+    return catalog()[name]
@@ -1,105 +1,89 @@
+from .engine import convert_array  # Vectorized conversion for batches
+from . import definitions  # Unit definitions
+
+"""
+CATEGORY (registry.Category): The temperature scales, shared through the registry.
+Every scale is an affine transform relative to Kelvin: kelvin = value * scale + offset.
+The category precomputes the (scale, offset) of every pair of scales, so adding a scale
+is one more entry in data/units.json, where the scales are declared with their symbols,
+exact scales and offsets ("5/9") and aliases.
+"""
+CATEGORY = definitions.category("temperatures")
+
+
 class temperatures:
     """
     This module provides a class `temperatures` for temperature conversions and formatting.
     Classes:
-        temperatures: A class containing methods for converting temperatures between Celsius, Fahrenheit, and Kelvin,
-                      as well as formatting temperature symbols.
+        temperatures: A class containing methods for converting temperatures between Celsius, Fahrenheit, Kelvin,
+                      Rankine and Réaumur, as well as formatting temperature symbols.
     Methods:
         symbol_format(temperature):
             Returns the symbol representation of a given temperature scale.
             Args:
-                temperature (str): The name of the temperature scale ("Celsius", "Fahrenheit", "Kelvin").
-            Returns:
-                str: The symbol of the temperature scale ("°C", "°F", "K").
-        celsius_to_fahrenheit(celsius):
-            Converts a temperature from Celsius to Fahrenheit.
-            Args:
-                celsius (float): Temperature in Celsius.
-            Returns:
-                float: Temperature in Fahrenheit.
-        celsius_to_kelvin(celsius):
-            Converts a temperature from Celsius to Kelvin.
-            Args:
-                celsius (float): Temperature in Celsius.
-            Returns:
-                float: Temperature in Kelvin.
-        fahrenheit_to_celsius(fahrenheit):
-            Converts a temperature from Fahrenheit to Celsius.
-            Args:
-                fahrenheit (float): Temperature in Fahrenheit.
-            Returns:
-                float: Temperature in Celsius.
-        fahrenheit_to_kelvin(fahrenheit):
-            Converts a temperature from Fahrenheit to Kelvin.
-            Args:
-                fahrenheit (float): Temperature in Fahrenheit.
-            Returns:
-                float: Temperature in Kelvin.
-        kelvin_to_celsius(kelvin):
-            Converts a temperature from Kelvin to Celsius.
-            Args:
-                kelvin (float): Temperature in Kelvin.
+                temperature (str): The name of the temperature scale (e.g. "Celsius").
             Returns:
-                float: Temperature in Celsius.
-        kelvin_to_fahrenheit(kelvin):
-            Converts a temperature from Kelvin to Fahrenheit.
+                str: The symbol of the temperature scale (e.g. "°C").
+        celsius_to_fahrenheit(celsius), celsius_to_kelvin(celsius), fahrenheit_to_celsius(fahrenheit),
+        fahrenheit_to_kelvin(fahrenheit), kelvin_to_celsius(kelvin), kelvin_to_fahrenheit(kelvin):
+            Convert a temperature between two fixed scales.
             Args:
-                kelvin (float): Temperature in Kelvin.
+                (float): Temperature in the origin scale.
             Returns:
-                float: Temperature in Fahrenheit.
+                float: Temperature in the destination scale.
         convert_temperature(value, origin, destin):
-            Converts a temperature value from one scale to another.
+            Converts a temperature value (or a NumPy array of values) from one scale to another
+            with one multiply and one add: value * scale + offset.
             Args:
-                value (float): The temperature value to convert.
-                origin (str): The original temperature scale ("Celsius", "Fahrenheit", "Kelvin").
-                destin (str): The destination temperature scale ("Celsius", "Fahrenheit", "Kelvin").
+                value (float | numpy.ndarray): The temperature value to convert.
+                origin (str | int): The original temperature scale (name, symbol or ID).
+                destin (str | int): The destination temperature scale (name, symbol or ID).
             Returns:
                 float: The converted temperature value.
+            Raises:
+                AttributeError: If a scale is not defined.
+        convert_temperature_batch(values, origin, destin, out=None):
+            Converts a whole array of temperature values from one scale to another.
+            Args:
+                values (array_like): A NumPy array, any sequence of temperature values or a float64 buffer.
+                origin (str | int): The original temperature scale (name, symbol or ID).
+                destin (str | int): The destination temperature scale (name, symbol or ID).
+                out (buffer): Optional writable float64 buffer to write the result into (may be `values`).
+            Returns:
+                numpy.ndarray: The converted temperature values.
+            Raises:
+                AttributeError: If a scale is not defined.
     """
 
     def symbol_format(self, temperature): # formatting the temperature symbol
-        if temperature == "Celsius":
-            return "°C" 
-        elif temperature == "Fahrenheit":
-            return "°F"
-        elif temperature == "Kelvin":
-            return "K"
+        unit = CATEGORY.by_name.get(temperature) # looking up the scale in the catalog
+        if unit is not None:
+            return unit.symbol
 
     def celsius_to_fahrenheit(celsius):
-        celsius = float(celsius)
-        return (celsius * 9 / 5) + 32
+        return temperatures().convert_temperature(celsius, "Celsius", "Fahrenheit")
 
     def celsius_to_kelvin(celsius):
-        celsius = float(celsius)
-        return celsius + 273.15
+        return temperatures().convert_temperature(celsius, "Celsius", "Kelvin")
 
     def fahrenheit_to_celsius(fahrenheit):
-        fahrenheit = float(fahrenheit)
-        return (fahrenheit - 32) * 5 / 9
+        return temperatures().convert_temperature(fahrenheit, "Fahrenheit", "Celsius")
 
     def fahrenheit_to_kelvin(fahrenheit):
-        fahrenheit = float(fahrenheit)
-        return (fahrenheit - 32) * 5 / 9 + 273.15
+        return temperatures().convert_temperature(fahrenheit, "Fahrenheit", "Kelvin")
 
     def kelvin_to_celsius(kelvin):
-        kelvin = float(kelvin)
-        return kelvin - 273.15
+        return temperatures().convert_temperature(kelvin, "Kelvin", "Celsius")
 
     def kelvin_to_fahrenheit(kelvin):
-        kelvin = float(kelvin)
-        return (kelvin - 273.15) * 9 / 5 + 32
+        return temperatures().convert_temperature(kelvin, "Kelvin", "Fahrenheit")
 
     def convert_temperature(self, value, origin, destin):
-        value = float(value) # converting the value to float
-        if origin == "Celsius" and destin == "Fahrenheit": # converting Celsius to Fahrenheit
-            return temperatures.celsius_to_fahrenheit(value) # calling the function
-        elif origin == "Celsius" and destin == "Kelvin": # converting Celsius to Kelvin
-            return temperatures.celsius_to_kelvin(value)
-        elif origin == "Fahrenheit" and destin == "Celsius": # converting Fahrenheit to Celsius
-            return temperatures.fahrenheit_to_celsius(value)
-        elif origin == "Fahrenheit" and destin == "Kelvin": # converting Fahrenheit to Kelvin
-            return temperatures.fahrenheit_to_kelvin(value)
-        elif origin == "Kelvin" and destin == "Celsius": # converting Kelvin to Celsius
-            return temperatures.kelvin_to_celsius(value)
-        elif origin == "Kelvin" and destin == "Fahrenheit": # converting Kelvin to Fahrenheit
-            return temperatures.kelvin_to_fahrenheit(value)
+        if isinstance(value, str): # accepting text input like the other converters
+            value = float(value)
+        scale, offset = CATEGORY.pair(origin, destin) # looking the pair up in the precomputed table
+        return value * scale + offset
+
+    def convert_temperature_batch(self, values, origin, destin, out=None):
+        scale, offset = CATEGORY.pair(origin, destin) # resolving the pair once
+        return convert_array(values, scale, offset, out=out)
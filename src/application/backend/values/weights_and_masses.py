@@ -2,11 +2,16 @@
 This module contains the definition of various weight and mass units, their conversion factors, and a method to convert between them.
 - The `weight_and_mass` class represents a single weight or mass unit with its name and value.
 - The `weights_and_masses` class contains several predefined weight and mass units as class attributes and provides a method to convert between them.
+- The units are declared in data/units.json (see `definitions`).
 """
+from .engine import convert_array  # Vectorized conversion for batches
+from . import definitions, factors  # Unit definitions and the unit attributes of the class
+
 class weight_and_mass:
-    def __init__(self, name, value):
+    def __init__(self, name, value, symbol=None):
         self.name = name
         self.value = value
+        self.symbol = symbol
 
 """
 This class represents a weight or mass unit with its name and value in grams.
@@ -18,51 +23,58 @@ class weights_and_masses:
     The conversion factors are based on the metric system and common
     imperial units. The base unit is Gram (g).
     
-    The conversion factors are as follows:
-    - 1 Carat = 0.02 grams
-    - 1 Milligram = 0.001 grams
-    - 1 Centigram = 0.01 grams
-    - 1 Decigram = 0.1 grams
-    - 1 Gram = 1 gram (base unit)
-    - 1 Decagram = 10 grams
-    - 1 Hectogram = 100 grams
-    - 1 Kilogram = 1000 grams
-    - 1 Metric Ton = 1000000 grams
-    - 1 Ounce = 28.3495 grams
-    - 1 Pound = 453.592 grams
-    - 1 Stone = 6350.29 grams
-    - 1 Short Ton = 907185 grams
-    - 1 Long Ton = 1016047 grams
+    The units are declared in data/units.json and set as class attributes named after
+    them (Carat, Gram, Kilogram, Metric_Ton, Pound, Long_Ton...) when the module loads.
     """
-    Carat = weight_and_mass("Carat", 0.02)
-    Milligram = weight_and_mass("Milligram", 0.001)
-    Centigram = weight_and_mass("Centigram", 0.01)
-    Decigram = weight_and_mass("Decigram", 0.1)
-    Gram = weight_and_mass("Gram", 1.0) # unit base
-    Decagram = weight_and_mass("Decagram", 10.0)
-    Hectogram = weight_and_mass("Hectogram", 100.0)
-    Kilogram = weight_and_mass("Kilogram", 1000.0)
-    Metric_Ton = weight_and_mass("Metric Ton", 1000000.0)
-    Ounce = weight_and_mass("Ounce", 28.3495)
-    Pound = weight_and_mass("Pound", 453.592)
-    Stone = weight_and_mass("Stone", 6350.29)
-    Short_Ton = weight_and_mass("Short Ton", 907185.0)
-    Long_Ton = weight_and_mass("Long Ton", 1016047.0)
 
     """
     This method converts a value from one weight or mass unit to another.
     Args:
         value (float): The amount to convert.
-        origin (str): The weight or mass unit to convert from.
-        destin (str): The weight or mass unit to convert to.
+        origin (str | int): The weight or mass unit to convert from (name or ID).
+        destin (str | int): The weight or mass unit to convert to (name or ID).
     Returns:
         float: The converted amount.
     Raises:
         AttributeError: If the origin or destination unit is not defined in the class.
     """
     def convert_weight_and_mass(self, value, origin, destin):
-        value = float(value)
-        origin_unit = getattr(weights_and_masses, origin.title().replace(" ", "_")) # Convert to title case and replace spaces with underscores
-        destin_unit = getattr(weights_and_masses, destin.title().replace(" ", "_")) # Convert to title case and replace spaces with underscores
-        return (value * origin_unit.value) / destin_unit.value 
-    
\ No newline at end of file
+        return float(value) * FACTORS[unit_id(origin)][unit_id(destin)] # One multiply by the precomputed factor
+
+    """
+    This method converts a whole array of values from one weight or mass unit to another.
+    The units are resolved once and the array is converted in a single operation.
+    Args:
+        values (array_like): A NumPy array, any sequence of amounts or a float64 buffer.
+        origin (str | int): The weight or mass unit to convert from (name or ID).
+        destin (str | int): The weight or mass unit to convert to (name or ID).
+        out (buffer): Optional writable float64 buffer to write the result into (may be `values`).
+    Returns:
+        numpy.ndarray: The converted amounts.
+    Raises:
+        AttributeError: If the origin or destination unit is not defined in the class.
+    """
+    def convert_weight_and_mass_batch(self, values, origin, destin, out=None):
+        return convert_array(values, FACTORS[unit_id(origin)][unit_id(destin)], out=out)
+
+
+"""
+Unit IDs and conversion factors, loaded once from the unit definitions and shared through the registry.
+- CATEGORY (registry.Category): The units of this module, with their name/alias/ID indexes.
+- UNIT_NAMES (tuple): The unit names; the position of each name is its integer ID.
+- FACTORS (tuple): FACTORS[i][j] converts a value from unit i to unit j.
+- FACTOR_MATRIX (numpy.ndarray): The same factors as a dense read-only matrix, built on first access.
+- ALIASES (dict): Extra spellings of the units, besides their names, symbols and plurals.
+"""
+CATEGORY = definitions.category("weights_and_masses")
+factors.define_units(weights_and_masses, weight_and_mass, CATEGORY)  # weights_and_masses.Gram...
+ALIASES = CATEGORY.aliases
+UNIT_NAMES = CATEGORY.names
+FACTORS = CATEGORY.factors
+unit_id = CATEGORY.unit_id  # Returns the integer ID of a unit given by name, alias or ID
+
+
+def __getattr__(name):
+    if name == "FACTOR_MATRIX":  # Built on first access, so that importing this module does not load NumPy
+        return CATEGORY.matrix
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
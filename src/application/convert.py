@@ -0,0 +1,294 @@
+"""
+This is the headless entry point for converting files without the PyQt5 interface.
+
+- The csv command streams a CSV file in chunks of rows, converts the named columns with
+  the backend batch functions and writes the output CSV as it goes.
+- The work is a generator pipeline (read chunk -> convert chunk -> write chunk), so the
+  memory used depends on the chunk size and not on the size of the file.
+- With --workers the chunks are converted on a pool of processes, in order, with a
+  bounded number of chunks in flight.
+- The f64 command converts raw little-endian float64 files through memory maps, in place
+  or into a second file, so files larger than the RAM are converted at disk speed.
+- The expr command converts free-text quantities ("5 ft 3 in to cm"), one per line; the
+  expressions sharing a shape reuse one compiled plan.
+- The throughput of the run is reported on stderr when it ends.
+
+Usage (from the project root):
+    python -m src.application.convert csv input.csv output.csv --category weights_and_masses \\
+        --column mass Pound Kilogram --column tare Ounce Gram --workers 8
+    python -m src.application.convert f64 readings.bin --output feet.bin --category longitudes \
+        --from Meter --to Feet
+    python -m src.application.convert expr quantities.log --output results.tsv
+"""
+import argparse  # Used to parse the command line arguments
+import csv  # Used to read and write the CSV rows
+from contextlib import nullcontext  # Used to write to the standard output without closing it
+from functools import partial  # Used to bind the conversions to the chunk function
+import os  # Used to read the size of the input file
+import sys  # Used for the standard streams and the exit code
+import time  # Used to measure the throughput
+import numpy as np  # Used to convert each column of a chunk at once
+
+from src.application.backend.values import batch, expressions  # Batch conversion and free-text quantities
+from src.application.backend.values import formatting  # Bulk fixed-precision formatting
+from src.application.backend.parallel import ConversionPool  # Worker processes for --workers
+from src.application.backend.mapped import DEFAULT_BLOCK_SIZE, convert_file  # Memory-mapped float64 conversion
+
+DEFAULT_CHUNK_SIZE = 65536  # Rows converted per chunk
+
+
+def read_chunks(reader, chunk_size, width=0):
+    """
+    Yields lists of at most `chunk_size` rows from a CSV reader.
+    Blank lines are skipped.
+    Raises:
+        ValueError: If a row has fewer than `width` cells (the converted columns must exist).
+    """
+    chunk = []
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            raise ValueError(f"line {reader.line_num}: expected at least {width} cells, found {len(row)}")
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_column(cells):
+    """
+    Parses the cells of a column into a float64 array.
+    Empty cells become NaN and are written back empty.
+    Raises:
+        ValueError: If a cell is not a number.
+    """
+    try:
+        return np.array(cells, dtype=np.float64)  # Fast path: every cell is a number
+    except ValueError:
+        return np.array([float(cell) if cell.strip() else np.nan for cell in cells], dtype=np.float64)
+
+
+def format_column(values, precision):
+    """
+    Formats a converted column back into CSV cells.
+    Args:
+        values (numpy.ndarray): The converted values.
+        precision (int): The number of decimals, or None to keep the full precision.
+    """
+    if precision is None:
+        cells = [repr(value) for value in values.tolist()]
+        return ["" if cell == "nan" else cell for cell in cells]
+    text = formatting.format_array(values, precision, nan=b"")  # Formatted in blocks with NumPy
+    return text.decode("ascii").split("\n")[:-1]
+
+
+def convert_chunk(chunk, conversions, precision):
+    """
+    Converts the columns of a chunk of rows.
+    Args:
+        chunk (list): The CSV rows.
+        conversions (list): (column index, scale, offset) of every converted column.
+        precision (int): The number of decimals of the converted cells, or None.
+    Returns:
+        list: The chunk with its converted cells replaced.
+    """
+    for index, scale, offset in conversions:
+        values = parse_column([row[index] for row in chunk])
+        values *= scale  # In place: the column array is already a fresh buffer
+        if offset:
+            values += offset
+        for row, cell in zip(chunk, format_column(values, precision)):
+            row[index] = cell
+    return chunk
+
+
+def convert_chunks(chunks, conversions, precision, pool=None):
+    """
+    Converts every chunk of rows, on the worker processes of `pool` when given.
+    Yields:
+        list: The converted chunks, in the order they were read.
+    """
+    convert = partial(convert_chunk, conversions=conversions, precision=precision)
+    if pool is None:
+        return map(convert, chunks)
+    return pool.imap(convert, chunks)
+
+
+def convert_csv(source, destination, category, columns, chunk_size=DEFAULT_CHUNK_SIZE,
+                delimiter=",", precision=None, pool=None):
+    """
+    Converts the named columns of a CSV stream and writes the result to another stream.
+    Args:
+        source (file): The input CSV, opened in text mode with newline="".
+        destination (file): The output CSV, opened in text mode with newline="".
+        category (str): The name of the category of every converted column.
+        columns (list): (column name, origin unit, destination unit) triples.
+        chunk_size (int): The number of rows converted at once.
+        delimiter (str): The field delimiter of both files.
+        precision (int | str): The number of decimals of the converted cells, "auto" for the
+            precision of the category, or None for the full precision.
+        pool (ConversionPool): Optional pool of worker processes to convert the chunks on.
+    Returns:
+        int: The number of data rows written.
+    Raises:
+        KeyError: If a column or the category does not exist.
+        AttributeError: If a unit is not defined in the category.
+        ValueError: If a converted cell is not a number or a row is too short.
+    """
+    reader = csv.reader(source, delimiter=delimiter)
+    writer = csv.writer(destination, delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        return 0
+    writer.writerow(header)
+
+    conversions = []
+    for name, origin, destin in columns:
+        if name not in header:
+            raise KeyError(f"Column not found: {name}")
+        scale, offset = batch.resolve_pair(category, origin, destin)  # Units are resolved once
+        conversions.append((header.index(name), scale, offset))
+
+    if precision == "auto":
+        precision = formatting.precision(category)
+    rows = 0
+    width = max(index for index, _, _ in conversions) + 1
+    for chunk in convert_chunks(read_chunks(reader, chunk_size, width), conversions, precision, pool):
+        writer.writerows(chunk)
+        rows += len(chunk)
+    return rows
+
+
+def run_csv(args):
+    """Runs the csv command and reports its throughput on stderr."""
+    start = time.perf_counter()
+    pool = ConversionPool(args.workers) if args.workers > 1 else None
+    try:
+        with open(args.input, newline="", encoding="utf-8") as source, \
+                open(args.output, "w", newline="", encoding="utf-8") as destination:
+            rows = convert_csv(source, destination, args.category, args.column,
+                               args.chunk_size, args.delimiter, args.precision, pool)
+    finally:
+        if pool is not None:
+            pool.close()
+    report(rows, "rows", os.path.getsize(args.input), time.perf_counter() - start)
+
+
+def run_f64(args):
+    """Runs the f64 command and reports its throughput on stderr."""
+    start = time.perf_counter()
+    count = convert_file(args.input, args.category, args.origin, args.destin,
+                         args.output, args.block_size)
+    report(count, "values", count * 8, time.perf_counter() - start)
+
+
+def convert_expressions(source, destination):
+    """
+    Converts one free-text quantity per line and writes "value<TAB>unit name" lines.
+    Lines that can't be converted are written empty, so the output keeps the line numbers.
+    Returns:
+        tuple: (lines converted, lines that failed).
+    """
+    converted = failed = 0
+    for result in expressions.evaluate_many(line for line in source):
+        if isinstance(result, Exception):
+            destination.write("\n")
+            failed += 1
+        else:
+            destination.write(f"{result.value!r}\t{result.unit.name}\n")
+            converted += 1
+    return converted, failed
+
+
+def run_expr(args):
+    """Runs the expr command and reports its throughput on stderr."""
+    start = time.perf_counter()
+    with open(args.input, encoding="utf-8") as source, \
+            (open(args.output, "w", encoding="utf-8") if args.output else nullcontext(sys.stdout)) as destination:
+        converted, failed = convert_expressions(source, destination)
+    report(converted, "expressions", os.path.getsize(args.input), time.perf_counter() - start)
+    if failed:
+        print(f"{failed:,} lines could not be converted", file=sys.stderr)
+
+
+def report(count, label, size, elapsed):
+    """Prints the throughput of a run on stderr."""
+    elapsed = max(elapsed, 1e-9)
+    print(
+        f"Converted {count:,} {label} in {elapsed:.2f} s "
+        f"({count / elapsed:,.0f} {label}/s, {size / elapsed / 1e6:,.1f} MB/s)",
+        file=sys.stderr,
+    )
+
+
+def parse_precision(text):
+    """Reads the --precision option: a number of decimals or "auto"."""
+    return text if text == "auto" else int(text)
+
+
+def build_parser():
+    """Builds the command line parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.application.convert",
+        description="Convert units in files without the graphical interface.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    csv_parser = commands.add_parser("csv", help="convert columns of a CSV file")
+    csv_parser.add_argument("input", help="path of the input CSV file")
+    csv_parser.add_argument("output", help="path of the output CSV file")
+    csv_parser.add_argument("-k", "--category", required=True, choices=batch.CATEGORY_NAMES,
+                            help="category of the converted columns")
+    csv_parser.add_argument("-c", "--column", required=True, action="append", nargs=3,
+                            metavar=("NAME", "FROM", "TO"),
+                            help="column to convert and its units (repeatable)")
+    csv_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                            help=f"rows converted at once (default {DEFAULT_CHUNK_SIZE})")
+    csv_parser.add_argument("--delimiter", default=",", help="field delimiter (default ,)")
+    csv_parser.add_argument("--precision", type=parse_precision, default=None,
+                            help="decimals of the converted values, or 'auto' for the precision of the "
+                                 "category (default: full precision)")
+    csv_parser.add_argument("-w", "--workers", type=int, default=1,
+                            help="worker processes converting chunks in parallel (default 1)")
+    csv_parser.set_defaults(run=run_csv)
+
+    f64_parser = commands.add_parser("f64", help="convert a raw little-endian float64 file")
+    f64_parser.add_argument("input", help="path of the input file")
+    f64_parser.add_argument("-o", "--output", default=None,
+                            help="path of the output file (default: convert the input in place)")
+    f64_parser.add_argument("-k", "--category", required=True, choices=batch.CATEGORY_NAMES,
+                            help="category of the values")
+    f64_parser.add_argument("--from", dest="origin", required=True, help="unit of the values")
+    f64_parser.add_argument("--to", dest="destin", required=True, help="unit to convert to")
+    f64_parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+                            help=f"bytes converted at once (default {DEFAULT_BLOCK_SIZE})")
+    f64_parser.set_defaults(run=run_f64)
+
+    expr_parser = commands.add_parser("expr", help="convert free-text quantities, one per line")
+    expr_parser.add_argument("input", help="path of the text file (e.g. \"5 ft 3 in to cm\" lines)")
+    expr_parser.add_argument("-o", "--output", default=None,
+                             help="path of the output file (default: standard output)")
+    expr_parser.set_defaults(run=run_expr)
+    return parser
+
+
+def main(argv=None):
+    """
+    Parses the command line and runs the selected command.
+    Returns:
+        int: The exit code (0 on success, 1 on a conversion error).
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        args.run(args)
+    except (KeyError, AttributeError, ValueError, OSError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
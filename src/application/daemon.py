@@ -0,0 +1,183 @@
+"""
+This is a long-lived conversion daemon listening on a Unix domain socket.
+
+- The unit catalogs, the exchange rates and NumPy are loaded once when it starts, so every
+  request costs one socket round trip instead of a Python start and the backend imports.
+- The requests use the compact binary framing of src/application/daemon_client.py: a
+  uint32 length, the category and unit names, and the values as raw float64, so a batch of
+  values is converted straight from the received bytes with one vectorized operation.
+- It is built on asyncio streams: every client has its own connection, served concurrently,
+  and may pipeline several requests, answered in order. Large batches are converted off the
+  event loop so they do not hold up the other clients.
+- The socket is only accessible to the user running the daemon. Unix sockets are not
+  available on Windows; use the HTTP service (src/application/service.py) there.
+
+Usage (from the project root):
+    python -m src.application.daemon &
+    python src/application/daemon_client.py longitudes Meter Feet 1 2.5 3
+"""
+import argparse  # Used to parse the command line arguments
+import asyncio  # Used for the non-blocking server
+import os  # Used to set up the socket file
+import signal  # Used to stop cleanly on SIGTERM
+import socket  # Used to detect a daemon already running on the socket
+
+from src.application.backend.values import batch, registry  # Converters and unit catalog
+from src.application.backend.values.engine import load_numpy  # Loaded at start-up
+from src.application.daemon_client import (  # The wire protocol shared with the client
+    DEFAULT_SOCKET, HEADER, MAX_FRAME_SIZE, OP_CONVERT, OP_PING, STATUS_ERROR, STATUS_OK, encode_response,
+)
+
+OFFLOAD_SIZE = 1024 * 1024  # Payloads from this size (in bytes) are converted in a worker thread
+
+
+class ConversionDaemon:
+    """
+    The Unix socket server of the daemon.
+    Attributes:
+        connections (int): The open connections.
+        requests (int): The requests answered since the daemon started.
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+
+    def warm_up(self):
+        """Loads the catalogs, the exchange rates and NumPy before the first request."""
+        for category in registry.catalog().values():
+            if category.source is not None:
+                category.source.refresh()
+        load_numpy()
+        batch.convert_batch("longitudes", [1.0], "Meter", "Feet")
+
+    async def start(self, path=DEFAULT_SOCKET):
+        """Starts listening on `path` and returns the asyncio server."""
+        prepare_socket_path(path)
+        server = await asyncio.start_unix_server(self.handle_connection, path)
+        os.chmod(path, 0o600)  # Only the user running the daemon may connect
+        return server
+
+    async def handle_connection(self, reader, writer):
+        """Answers the frames of one connection, in order, until it is closed."""
+        self.connections += 1
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    length, = HEADER.unpack(await reader.readexactly(HEADER.size))
+                    if length > MAX_FRAME_SIZE or length == 0:
+                        writer.write(encode_response(STATUS_ERROR, b"Invalid frame length"))
+                        break
+                    payload = await reader.readexactly(length)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if length >= OFFLOAD_SIZE:
+                    response = await loop.run_in_executor(None, handle_request, payload)
+                else:
+                    response = handle_request(payload)
+                self.requests += 1
+                writer.write(response)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+
+def handle_request(payload):
+    """
+    Returns the response frame of one request payload.
+    Errors of the request (unknown category or unit, malformed payload) are answered with
+    STATUS_ERROR and their message; the connection stays open.
+    """
+    try:
+        operation = payload[0]
+        if operation == OP_PING:
+            return encode_response(STATUS_OK, b"")
+        if operation != OP_CONVERT:
+            raise ValueError(f"Unknown operation: {operation}")
+        (category, origin, destin), position = read_strings(payload, 1, 3)
+        values = memoryview(payload)[position:]
+        if len(values) % 8:
+            raise ValueError("The values are not a whole number of float64")
+        results = batch.convert_batch(category, values, origin, destin)  # Read in place from the frame
+        return encode_response(STATUS_OK, results.tobytes())
+    except KeyError as error:  # Raised by the registry for unknown categories
+        return encode_response(STATUS_ERROR, f"Unknown category: {error.args[0]}".encode("utf-8"))
+    except (AttributeError, ValueError, TypeError, IndexError) as error:
+        return encode_response(STATUS_ERROR, str(error).encode("utf-8"))
+
+
+def read_strings(payload, position, count):
+    """
+    Reads `count` length-prefixed UTF-8 strings starting at `position`.
+    Returns:
+        tuple: (strings, position after the last string).
+    Raises:
+        ValueError: If the payload ends inside a string.
+    """
+    strings = []
+    for _ in range(count):
+        length = payload[position]
+        end = position + 1 + length
+        if end > len(payload):
+            raise ValueError("Truncated request")
+        strings.append(payload[position + 1:end].decode("utf-8"))
+        position = end
+    return strings, position
+
+
+def prepare_socket_path(path):
+    """
+    Removes a socket file left behind by a daemon that is no longer running.
+    Raises:
+        RuntimeError: If another daemon is listening on `path`.
+    """
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)  # Stale socket
+    else:
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    finally:
+        probe.close()
+
+
+async def serve(path):
+    """Runs the daemon until it is interrupted, removing its socket on exit."""
+    daemon = ConversionDaemon()
+    daemon.warm_up()
+    server = await daemon.start(path)
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    print(f"Serving conversions on unix:{path}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def main(argv=None):
+    """Parses the command line and runs the daemon."""
+    parser = argparse.ArgumentParser(prog="python -m src.application.daemon",
+                                     description="Local conversion daemon on a Unix domain socket.")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET,
+                        help=f"path of the socket to listen on (default {DEFAULT_SOCKET}, "
+                             f"or the UNIT_CONVERSOR_SOCKET environment variable)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.socket))
+    except RuntimeError as error:
+        parser.exit(1, f"error: {error}\n")
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+This is the client of the local conversion daemon (src/application/daemon.py).
+
+- It only uses the standard library and imports nothing from the backend, so a shell script
+  or a cron job pays for a Python start and one socket round trip, not for the catalogs.
+- It also defines the wire protocol shared with the daemon. Every message is a frame: a
+  little-endian uint32 with the length of the payload, followed by the payload.
+    request:  uint8 operation, then for OP_CONVERT three strings (category, origin, destin),
+              each a uint8 length and UTF-8 bytes, then the values as native float64.
+    response: uint8 status, then the results as native float64 (STATUS_OK) or a UTF-8
+              error message (STATUS_ERROR).
+  The values are native float64 because both ends run on the same machine. A frame may hold
+  any number of values, and several frames may be sent before reading the answers, which
+  come back in order.
+
+Usage (from the project root, with the daemon running):
+    python src/application/daemon_client.py longitudes Meter Feet 1 2.5 3
+    seq 1 1000 | python src/application/daemon_client.py weights_and_masses Pound Kilogram
+"""
+import os  # Used to find the default socket path
+import socket  # Used to talk to the daemon
+import struct  # Used to pack the frames
+import sys  # Used to read the values from the standard input
+from array import array  # Used to pack the values as float64
+
+OP_PING = 0  # Empty request, answered with an empty STATUS_OK frame
+OP_CONVERT = 1  # Converts the values of the request
+STATUS_OK = 0
+STATUS_ERROR = 1
+HEADER = struct.Struct("<I")  # The length of the payload of a frame
+MAX_FRAME_SIZE = 64 * 1024 * 1024  # Largest accepted payload, in bytes
+
+"""The socket the daemon listens on, unless UNIT_CONVERSOR_SOCKET gives another one"""
+DEFAULT_SOCKET = os.environ.get("UNIT_CONVERSOR_SOCKET") or os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or "/tmp", f"unit-conversor-{os.getuid()}.sock")
+
+
+class DaemonError(Exception):
+    """An error answered by the daemon (e.g. an unknown unit)."""
+
+
+def encode_string(text):
+    """Returns a string of the protocol: its uint8 length and its UTF-8 bytes."""
+    data = text.encode("utf-8")
+    if len(data) > 255:
+        raise ValueError(f"Name too long: {text[:32]}...")
+    return bytes((len(data),)) + data
+
+
+def encode_convert(category, values, origin, destin):
+    """
+    Returns the frame of a conversion request.
+    Args:
+        category (str): The name of the category (e.g. "longitudes").
+        values (iterable | array): The values, or an `array.array('d')` sent as it is.
+        origin (str): The unit to convert from (name, symbol or alias).
+        destin (str): The unit to convert to.
+    """
+    if not isinstance(values, array) or values.typecode != "d":
+        values = array("d", values)
+    payload = (bytes((OP_CONVERT,)) + encode_string(category) + encode_string(origin)
+               + encode_string(destin) + values.tobytes())
+    return HEADER.pack(len(payload)) + payload
+
+
+def encode_response(status, body):
+    """Returns the frame of a response."""
+    return HEADER.pack(len(body) + 1) + bytes((status,)) + body
+
+
+class DaemonClient:
+    """
+    A connection to the daemon, opened on the first request and kept open.
+    Methods:
+        convert(category, values, origin, destin):
+            Converts a batch of values in one round trip.
+            Returns:
+                array.array: The converted values ('d').
+            Raises:
+                DaemonError: If the daemon could not convert them.
+        convert_value(category, value, origin, destin):
+            Converts a single value and returns it as a float.
+        ping():
+            Checks that the daemon answers.
+        close():
+            Closes the connection.
+    """
+
+    def __init__(self, path=DEFAULT_SOCKET, timeout=30.0):
+        self.path = path
+        self.timeout = timeout
+        self._socket = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def connect(self):
+        """Opens the connection (done by the first request)."""
+        if self._socket is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self.timeout)
+            try:
+                connection.connect(self.path)
+            except OSError:
+                connection.close()
+                raise
+            self._socket = connection
+        return self._socket
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def request(self, frame):
+        """Sends one frame and returns the body of its answer."""
+        connection = self.connect()
+        connection.sendall(frame)
+        length, = HEADER.unpack(self._receive(HEADER.size))
+        payload = self._receive(length)
+        if payload[0] != STATUS_OK:
+            raise DaemonError(payload[1:].decode("utf-8", "replace"))
+        return payload[1:]
+
+    def _receive(self, size):
+        """Reads exactly `size` bytes from the connection."""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = self._socket.recv_into(view[received:])
+            if not count:
+                self.close()
+                raise ConnectionError("The daemon closed the connection")
+            received += count
+        return buffer
+
+    def convert(self, category, values, origin, destin):
+        results = array("d")
+        results.frombytes(self.request(encode_convert(category, values, origin, destin)))
+        return results
+
+    def convert_value(self, category, value, origin, destin):
+        return self.convert(category, (float(value),), origin, destin)[0]
+
+    def ping(self):
+        self.request(HEADER.pack(1) + bytes((OP_PING,)))
+
+
+def main(argv=None):
+    """Converts the values given as arguments, or one per line of the standard input."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) < 3 or args[0] in ("-h", "--help"):
+        print("usage: daemon_client.py CATEGORY ORIGIN DESTIN [VALUE ...]", file=sys.stderr)
+        return 2
+    category, origin, destin, *values = args
+    if not values:
+        values = sys.stdin.read().split()
+    try:
+        with DaemonClient() as client:
+            results = client.convert(category, map(float, values), origin, destin)
+    except (ValueError, DaemonError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    except OSError as error:
+        print(f"error: cannot reach the daemon at {DEFAULT_SOCKET} ({error}); "
+              f"start it with: python -m src.application.daemon", file=sys.stderr)
+        return 1
+    sys.stdout.write("".join(f"{result!r}\n" for result in results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""PyQt5 interface of the unit converter. Importing it requires PyQt5."""
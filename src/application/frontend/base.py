@@ -28,13 +28,8 @@ Run the script to launch the Unit Converter application. Use the menu buttons to
 """
 
 """Import necessary modules and classes"""
-import sys  # Used to manipulate the Python runtime environment
-from pathlib import Path  # Used to handle file paths in a platform-independent way
-
-# Dynamically set the base directory for the application
-BASE_DIR = Path(__file__).resolve().parents[3]  # Assuming the structure is src/application/main.py
-if str(BASE_DIR) not in sys.path:
-    sys.path.append(str(BASE_DIR))  # Add the base directory to the system path
+import os  # Used to read the UNIT_CONVERSOR_METRICS environment variable
+import sys  # Used for the command line arguments of the application
 
 from PyQt5.QtWidgets import (
     QApplication,  # QApplication is the main application class
@@ -48,14 +43,30 @@ from PyQt5.QtWidgets import (
     QLineEdit,  # QLineEdit is a class for creating single-line text input fields
     QComboBox,  # QComboBox is a class for creating combo boxes (drop-down lists)
 )
-from PyQt5.QtGui import QIcon  # QIcon is a class for creating icons
-from PyQt5.QtCore import Qt, QSize # Qt is a class for core non-GUI functionality
+from PyQt5.QtGui import (
+    QIcon,  # QIcon is a class for creating icons
+    QPixmap,  # QPixmap holds a decoded image, so every flag file is read only once
+    QStandardItem,  # QStandardItem is one entry of a combo box model
+    QStandardItemModel,  # QStandardItemModel is the list of entries shown by a combo box
+)
+from PyQt5.QtCore import (
+    Qt,  # Qt is a class for core non-GUI functionality
+    QSize,  # QSize is used for the icon size of the combo boxes
+    QObject,  # QObject carries the signals of the conversion workers
+    QRunnable,  # QRunnable is a task run by a thread pool
+    QThreadPool,  # QThreadPool runs the conversions off the event loop
+    QTimer,  # QTimer debounces the conversions while the user types
+    pyqtSignal,  # pyqtSignal declares the signal a worker emits its result with
+)
 from src.application.frontend.custom_dialog_copy import (
     CustomCopyDialog,
 )  # CustomCopyDialog is a custom dialog for copying results
 from src.application.frontend.custom_dialog_logout import (
     CustomLogoutDialog,
 )  # CustomLogoutDialog is a custom dialog for logout confirmation
+from src.application.frontend.custom_dialog_bulk import (
+    BulkConversionDialog,
+)  # BulkConversionDialog is the panel that converts a pasted column of values
 from src.application.frontend.scenes.controller_conversor_longitudes import (
     ConversorLongitud,  # ConversorLongitud is a custom widget for length conversion
 )
@@ -76,10 +87,115 @@ from src.application.backend.values.temperatures import (
 )  # temperatures is a module for temperature conversion
 from src.application.backend.values.currencies import (
     currencies,
-)  # currencies is a module for currency conversion
+    RATES,
+)  # currencies is a module for currency conversion, RATES is its hot-reloaded rate file
 from src.application.backend.values.weights_and_masses import (
     weights_and_masses,
 )  # weights_and_masses is a module for weight and mass conversion
+from src.application.backend.values import registry  # registry holds the title of every category
+from src.application.backend.values import formatting  # formatting holds the precision of every category
+from src.application.backend import metrics  # metrics times the conversions when UNIT_CONVERSOR_METRICS is set
+
+"""
+Flag icons of the currencies.
+- FLAG_FILES maps a currency name to the image shown next to it in the combo boxes.
+- The images are decoded on first use and kept in FLAG_PIXMAPS, shared by every model.
+"""
+FLAG_FILES = {
+    "USD": "images/flags/Flag_of_the_United_States.png",
+    "MXN": "images/flags/Flag_of_Mexico.png",
+    "EUR": "images/flags/Flag_of_Europe.png",
+    "GBP": "images/flags/Flag_of_the_United_Kingdom.png",
+    "JPY": "images/flags/Flag_of_Japan.png",
+    "KRW": "images/flags/Flag_of_South_Korea.png",
+    "CAD": "images/flags/Flag_of_Canada.png",
+    "AUD": "images/flags/Flag_of_Australia.png",
+}
+FLAG_PIXMAPS = {}
+CONVERSION_DELAY_MS = 250  # Time the input must stay still before it is converted
+METRICS_INTERVAL_MS = 10000  # Time between two writes of the metric file
+
+
+def flag_icon(name):
+    """Returns the flag icon of a currency (an empty icon for the other units)."""
+    path = FLAG_FILES.get(name)
+    if path is None:
+        return QIcon()
+    if path not in FLAG_PIXMAPS:
+        FLAG_PIXMAPS[path] = QPixmap(path)  # Decoded once per process
+    return QIcon(FLAG_PIXMAPS[path])
+
+
+def convert_amount(conversion_class, amount_text, origin_unit, destination_unit):
+    """
+    Converts an amount and returns the text shown in the result label.
+    It only uses the backend, so it can run on a worker thread.
+    Args:
+        conversion_class (type): The selected conversion class (e.g. longitudes).
+        amount_text (str): The amount typed by the user.
+        origin_unit (str): The unit selected in the first combo box.
+        destination_unit (str): The unit selected in the second combo box.
+    Returns:
+        str: The result of the conversion.
+    Raises:
+        ValueError: If the amount is not a number.
+        AttributeError: If a unit is not defined in the selected class.
+    """
+    value = float(amount_text)  # Convert the amount text to a float
+    if conversion_class == currencies:  # Check if the conversion class is currencies
+        result = currencies().convert_currency(value, origin_unit, destination_unit)
+        return f"{float(value):,} {origin_unit} are {formatting.format_value(result, 'currencies')} {destination_unit}"
+    elif conversion_class == longitudes:  # Check if the conversion class is longitudes
+        result = longitudes().convert_longitud(value, origin_unit, destination_unit)
+        return f"{float(value):,} {origin_unit} are {formatting.format_value(result, 'longitudes')} {destination_unit}"
+    elif conversion_class == temperatures:  # Check if the conversion class is temperatures
+        converter = temperatures()
+        result = converter.convert_temperature(value, origin_unit, destination_unit)
+        symb_origin = converter.symbol_format(origin_unit)  # Get the symbol for the origin unit
+        symb_destin = converter.symbol_format(destination_unit)  # Get the symbol for the destination unit
+        return f"{float(value):,} {symb_origin} {origin_unit} are {formatting.format_value(result, 'temperatures')} {symb_destin} {destination_unit}"
+    elif conversion_class == weights_and_masses:  # Check if the conversion class is weights and masses
+        result = weights_and_masses().convert_weight_and_mass(value, origin_unit, destination_unit)
+        return f"{float(value):,} {origin_unit} are {formatting.format_value(result, 'weights_and_masses')} {destination_unit}"
+    return "Error: Invalid conversion type selected."
+
+
+def conversion_text(conversion_class, amount_text, origin_unit, destination_unit):
+    """
+    Same as convert_amount, but the errors are returned as the message shown to the user.
+    convert_amount is looked up on every call, so the metrics layer can time it.
+    """
+    try:
+        return convert_amount(conversion_class, amount_text, origin_unit, destination_unit)
+    except ValueError:  # Handle invalid input for the amount
+        return "Invalid amount. Please enter a number."
+    except AttributeError:  # Handle invalid unit selection
+        return "Error: Invalid unit selected."
+    except Exception as e:  # Handle any other exceptions
+        return f"An error occurred: {e}"
+
+
+class ConversionSignals(QObject):
+    """The signal a ConversionWorker emits its result with: (sequence number, result text)."""
+    finished = pyqtSignal(int, str)
+
+
+class ConversionWorker(QRunnable):
+    """
+    Runs one conversion on the thread pool of the main window.
+    The result is delivered through `signals.finished` on the event loop, together with the
+    sequence number of the request, so that results arriving out of order can be dropped.
+    """
+
+    def __init__(self, sequence, conversion_class, amount_text, origin_unit, destination_unit):
+        super().__init__()
+        self.signals = ConversionSignals()
+        self.sequence = sequence
+        self.arguments = (conversion_class, amount_text, origin_unit, destination_unit)
+
+    def run(self):
+        self.signals.finished.emit(self.sequence, conversion_text(*self.arguments))
+
 
 """
 Class:
@@ -109,6 +225,30 @@ class MainWindow(QMainWindow):
         self.setFixedSize(self.width(), self.height())  # Set fixed size
         self.setWindowTitle("Conversor")  # Set the window title
         self.setWindowIcon(QIcon("images/icon.jpg"))  # Set the window icon
+        """Combo box models, built the first time each category is selected"""
+        self.combo_models = {}
+        self.current_category = None  # Name of the selected category in the registry
+        self.bulk_dialog = None  # Bulk paste panel, created when it is first opened
+        """Convert-as-you-type state
+        - conversion_timer waits until the input has been still for CONVERSION_DELAY_MS.
+        - The conversions run on thread_pool; conversion_sequence numbers every request so that
+          only the result of the latest one is shown."""
+        self.conversion_timer = QTimer(self)
+        self.conversion_timer.setSingleShot(True)
+        self.conversion_timer.setInterval(CONVERSION_DELAY_MS)
+        self.conversion_timer.timeout.connect(self.convertAsYouType)
+        self.thread_pool = QThreadPool(self)
+        self.conversion_sequence = 0
+        """Conversion metrics
+        - Only when UNIT_CONVERSOR_METRICS names a file: the conversions are then timed and the
+          file is rewritten in the Prometheus text format every METRICS_INTERVAL_MS and on close."""
+        self.metrics_path = os.environ.get("UNIT_CONVERSOR_METRICS")
+        if self.metrics_path:
+            metrics.enable()
+            metrics.instrument(sys.modules[__name__], "convert_amount")
+            self.metrics_timer = QTimer(self)
+            self.metrics_timer.timeout.connect(self.writeMetrics)
+            self.metrics_timer.start(METRICS_INTERVAL_MS)
         self.initIU()  # Initialize the user interface
         """Variable to store the current conversion class
         - This variable is used to determine which conversion class to use based on the user's selection."""
@@ -184,6 +324,7 @@ class MainWindow(QMainWindow):
         self.combo_box2 = QComboBox(self.right_widget)  # Create a combo box for the "To" unit
         self.btn_convert = QPushButton("Convert")  # Create a button to perform the conversion
         self.btn_reset = QPushButton("Reset")  # Create a button to reset the input fields
+        self.btn_bulk = QPushButton("Bulk")  # Create a button to open the bulk paste panel
         self.label_result = QLabel("Result:")  # Create a label for the result
         self.label_txt_result = (QLabel())  # Create a label to display the conversion result
 
@@ -197,6 +338,7 @@ class MainWindow(QMainWindow):
         self.btn_copy.setObjectName("copyBtn")
         self.btn_convert.setObjectName("convertBtn")
         self.btn_reset.setObjectName("resetBtn")
+        self.btn_bulk.setObjectName("bulkBtn")
         self.label_result.setObjectName("resultLabel")
         self.label_txt_result.setObjectName("txtLabel")
 
@@ -207,6 +349,9 @@ class MainWindow(QMainWindow):
         )  # Set the current text to the default option
         self.combo_box2.addItem("Options")
         self.combo_box2.setCurrentText("Options")  # Set the current text to the default option
+        # Set the icon size once, large enough for the flags
+        self.combo_box1.setIconSize(QSize(50, 30))
+        self.combo_box2.setIconSize(QSize(50, 30))
 
         """Set placeholder text for the amount input field"""
         self.line_edit_amount.setPlaceholderText("Example: 123")
@@ -263,7 +408,7 @@ class MainWindow(QMainWindow):
                                background-color: #ffffff;
                                border: 1px solid gray;
                            }
-                           #copyBtn, #convertBtn, #resetBtn{
+                           #copyBtn, #convertBtn, #resetBtn, #bulkBtn{
                                width: 150;
                                height: 30;
                                font-size: 20px;
@@ -288,6 +433,7 @@ class MainWindow(QMainWindow):
         self.grid.addWidget(self.btn_reset, 4, 2, Qt.AlignHCenter)  # Reset button
         self.grid.addWidget(self.label_result, 5, 1, Qt.AlignHCenter)  # Result label
         self.grid.addWidget(self.label_txt_result, 6, 0, 2, 3, Qt.AlignHCenter)  # Result text
+        self.grid.addWidget(self.btn_bulk, 8, 1)  # Bulk button
 
         """Add the right widget to the main horizontal layout"""
         self.hbox_principal.addWidget(self.right_widget, 1)
@@ -296,9 +442,15 @@ class MainWindow(QMainWindow):
         self.label_txt_result.hide()
 
         """Connect buttons to their respective methods"""
-        self.btn_convert.clicked.connect(self.startConversionProcess)
+        self.btn_convert.clicked.connect(self.setConversion)
         self.btn_copy.clicked.connect(self.copyResult)
         self.btn_reset.clicked.connect(self.reset)
+        self.btn_bulk.clicked.connect(self.openBulkPanel)
+
+        """Convert while the user types or changes a unit"""
+        self.line_edit_amount.textChanged.connect(self.startConversionProcess)
+        self.combo_box1.currentIndexChanged.connect(self.startConversionProcess)
+        self.combo_box2.currentIndexChanged.connect(self.startConversionProcess)
 
         """Connect menu buttons to their respective conversion methods"""
         self.conversor_widget_longitud.button_longitud_widget.clicked.connect(
@@ -321,10 +473,15 @@ class MainWindow(QMainWindow):
     - setCurrencyConversion(): Configures the interface for currency conversion.
     - setTemperatureConversion(): Configures the interface for temperature conversion.
     - setWeightConversion(): Configures the interface for weight and mass conversion.
-    - setComboBoxes(names): Populates the combo boxes with unit names.
-    - setConversion(): Performs the conversion based on user input and displays the result.
+    - setComboBoxes(category, get_names): Swaps in the combo box model of a category, built on first use.
+    - setConversion(): Checks the user input and converts it (Convert button).
+    - convertAsYouType(): Converts the input once the debounce delay has expired, hiding the result while it is incomplete.
+    - requestConversion(conversion_class, amount_text, origin_unit, destination_unit): Runs a conversion on the thread pool.
+    - showConversion(sequence, text): Displays the result of the latest request and drops the older ones.
     - reset(): Resets the input fields and result label.
-    - startConversionProcess(): Placeholder for starting the conversion process.
+    - startConversionProcess(): Restarts the debounce delay after the amount or a unit has changed.
+    - openBulkPanel(): Opens the bulk paste panel of the selected category.
+    - writeMetrics(): Writes the conversion metrics to the UNIT_CONVERSOR_METRICS file, when it is set.
     - closeEvent(event): Handles the close event with a logout confirmation dialog.
     - copyResult(): Copies the conversion result to the clipboard.
     """
@@ -332,7 +489,7 @@ class MainWindow(QMainWindow):
     def setLongitudConversion(self):
         self.current_conversion_class = (longitudes) # Set the current conversion class to longitudes
         self.label_title.setText("Unit Convert - Longitudes") # Set the title for length conversion
-        self.setComboBoxes(self.conversor_widget_longitud.getLongitudNames()) # Populate the combo boxes with length unit names
+        self.setComboBoxes("longitudes", self.conversor_widget_longitud.getLongitudNames) # Populate the combo boxes with length unit names
         self.btn_convert.clicked.disconnect() # Disconnect the previous signal
         self.btn_convert.clicked.connect(self.setConversion) # Connect the convert button to the conversion method
         self.line_edit_amount.setPlaceholderText("Example: 123") # Set placeholder text for the amount input field
@@ -340,15 +497,16 @@ class MainWindow(QMainWindow):
     def setCurrencyConversion(self):
         self.current_conversion_class = currencies
         self.label_title.setText("Unit Convert - Currencies")
-        self.line_edit_amount.setPlaceholderText("(exchage rate of 2, June, 2025)") # Set placeholder text for the amount input field
-        self.setComboBoxes(self.conversor_widget_currency.getCurrencyNames())
+        RATES.refresh() # Pick up a new rate file before showing its date
+        self.line_edit_amount.setPlaceholderText(f"(exchange rate of {RATES.date or 'the rate file'})") # Set placeholder text for the amount input field
+        self.setComboBoxes("currencies", self.conversor_widget_currency.getCurrencyNames)
         self.btn_convert.clicked.disconnect()
         self.btn_convert.clicked.connect(self.setConversion)
 
     def setTemperatureConversion(self):
         self.current_conversion_class = temperatures
         self.label_title.setText("Unit Convert - Temperatures")
-        self.setComboBoxes(self.conversor_widget_temperatures.getTemperatureNames())
+        self.setComboBoxes("temperatures", self.conversor_widget_temperatures.getTemperatureNames)
         self.btn_convert.clicked.disconnect()
         self.btn_convert.clicked.connect(self.setConversion)
         self.line_edit_amount.setPlaceholderText("Example: 123") # Set placeholder text for the amount input field
@@ -356,45 +514,25 @@ class MainWindow(QMainWindow):
     def setWeightConversion(self):
         self.current_conversion_class = weights_and_masses
         self.label_title.setText("Unit Convert - Weights & Masses")
-        self.setComboBoxes(self.conversor_widget_weights_and_masses.getWeightNames())
+        self.setComboBoxes("weights_and_masses", self.conversor_widget_weights_and_masses.getWeightNames)
         self.btn_convert.clicked.disconnect()
         self.btn_convert.clicked.connect(self.setConversion)
         self.line_edit_amount.setPlaceholderText("Example: 123") # Set placeholder text for the amount input field
 
-    def setComboBoxes(self, names):
-        self.combo_box1.clear()  # Clear the first combo box
-        self.combo_box2.clear()  # Clear the second combo box
-        self.combo_box1.addItem("Options")  # Add default option to the first combo box
-        self.combo_box2.addItem("Options")  # Add default option to the second combo box
-        self.combo_box1.setCurrentText("Options")  # Set the current text to the default option
-        self.combo_box2.setCurrentText("Options")  # Set the current text to the default option
-        for name in names:  # Iterate through the provided names
-            icon = QIcon()  # Set the icon for the combo boxes
-            # Set the icon based on the currency name
-            if name == "USD":
-                icon = QIcon("images/flags/Flag_of_the_United_States.png")
-            elif name == "MXN":
-                icon = QIcon("images/flags/Flag_of_Mexico.png")
-            elif name == "EUR":
-                icon = QIcon("images/flags/Flag_of_Europe.png")
-            elif name == "GBP":
-                icon = QIcon("images/flags/Flag_of_the_United_Kingdom.png")
-            elif name == "JPY":
-                icon = QIcon("images/flags/Flag_of_Japan.png")
-            elif name == "KRW":
-                icon = QIcon("images/flags/Flag_of_South_Korea.png")
-            elif name == "CAD":
-                icon = QIcon("images/flags/Flag_of_Canada.png")
-            elif name == "AUD":
-                icon = QIcon("images/flags/Flag_of_Australia.png")
-            
-            self.combo_box1.addItem(icon, name) # Add each name to the first combo box and set the icon
-            self.combo_box2.addItem(icon, name)  # Add each name to the second combo box and set the icon
-            
-            # Adjust the size of the combo box to accommodate larger icons
-            self.combo_box1.setIconSize(QSize(50, 30))  # Set the icon size for the first combo box
-            self.combo_box2.setIconSize(QSize(50, 30))  # Set the icon size for the second combo box
-
+    def setComboBoxes(self, category, get_names):
+        model = self.combo_models.get(category)
+        if model is None:  # First time this category is selected: build its model once
+            model = QStandardItemModel(self)
+            model.appendRow(QStandardItem("Options"))  # Default option
+            for name in get_names():  # Iterate through the unit names of the category
+                model.appendRow(QStandardItem(flag_icon(name), name))  # Flag icon for the currencies
+            self.combo_models[category] = model
+        self.current_category = category
+        # Both combo boxes share the model; each one keeps its own selection
+        self.combo_box1.setModel(model)
+        self.combo_box2.setModel(model)
+        self.combo_box1.setCurrentIndex(0)  # Set the current item to the default option
+        self.combo_box2.setCurrentIndex(0)  # Set the current item to the default option
 
     def setConversion(self):
         # Check if a conversion class is selected
@@ -416,65 +554,79 @@ class MainWindow(QMainWindow):
             self.label_txt_result.show()
             return  # Exit the method if the conditions are met
 
-        try:
-            value = float(amount_text)  # Convert the amount text to a float
-            if (self.current_conversion_class == currencies):  # Check if the conversion class is currencies
-                converter = currencies()
-                result = converter.convert_currency(value, origin_unit, destination_unit)
-                self.label_txt_result.setText(
-                    f"{float(value):,} {origin_unit} are {result:,.2f} {destination_unit}"
-                )
-                self.label_txt_result.show()
-            elif (self.current_conversion_class == longitudes):  # Check if the conversion class is longitudes
-                converter = longitudes()
-                result = converter.convert_longitud(value, origin_unit, destination_unit)
-                self.label_txt_result.setText(
-                    f"{float(value):,} {origin_unit} are {result:,.4f} {destination_unit}"
-                )
-                self.label_txt_result.show()
-            elif (self.current_conversion_class == temperatures):  # Check if the conversion class is temperatures
-                converter = temperatures()
-                result = converter.convert_temperature(value, origin_unit, destination_unit)
-                symb_origin = converter.symbol_format(origin_unit)  # Get the symbol for the origin unit
-                symb_destin = converter.symbol_format(destination_unit)  # Get the symbol for the destination unit
-                self.label_txt_result.setText(
-                    f"{float(value):,} {symb_origin} {origin_unit} are {result:,.2f} {symb_destin} {destination_unit}"
-                )
-                self.label_txt_result.show()
-            elif (self.current_conversion_class == weights_and_masses):  # Check if the conversion class is weights and masses
-                converter = weights_and_masses()
-                result = converter.convert_weight_and_mass(value, origin_unit, destination_unit)
-                self.label_txt_result.setText(
-                    f"{float(value):,} {origin_unit} are {result:,.3f} {destination_unit}"
-                )
-                self.label_txt_result.show()
-            else:
-                self.label_txt_result.setText("Error: Invalid conversion type selected.")
-                self.label_txt_result.show()
-        except ValueError:  # Handle invalid input for the amount
-            self.label_txt_result.setText("Invalid amount. Please enter a number.")
-            self.label_txt_result.show()
-        except AttributeError:  # Handle invalid unit selection
-            self.label_txt_result.setText("Error: Invalid unit selected.")
-            self.label_txt_result.show()
-        except Exception as e:  # Handle any other exceptions
-            self.label_txt_result.setText(f"An error occurred: {e}")
-            self.label_txt_result.show()
+        self.requestConversion(self.current_conversion_class, amount_text, origin_unit, destination_unit)
+
+    def convertAsYouType(self):
+        # Same as setConversion, but incomplete input hides the result instead of showing a message
+        origin_unit = self.combo_box1.currentText()
+        destination_unit = self.combo_box2.currentText()
+        amount_text = self.line_edit_amount.text()
+        if (
+            self.current_conversion_class is None
+            or not amount_text
+            or "Options" in (origin_unit, destination_unit)
+            or origin_unit == destination_unit
+        ):
+            self.conversion_sequence += 1  # A result still on its way is now stale
+            self.label_txt_result.hide()
+            return
+        self.requestConversion(self.current_conversion_class, amount_text, origin_unit, destination_unit)
+
+    def requestConversion(self, conversion_class, amount_text, origin_unit, destination_unit):
+        self.conversion_sequence += 1  # Numbers the request, so older results can be recognized
+        worker = ConversionWorker(self.conversion_sequence, conversion_class, amount_text, origin_unit, destination_unit)
+        worker.signals.finished.connect(self.showConversion)
+        self.thread_pool.start(worker)
+
+    def showConversion(self, sequence, text):
+        if sequence != self.conversion_sequence:  # The input changed after this request: drop it
+            return
+        self.label_txt_result.setText(text)
+        self.label_txt_result.show()
 
     def reset(self):
         self.combo_box1.setCurrentText("Options")
         self.combo_box2.setCurrentText("Options")
         self.line_edit_amount.clear()
+        self.conversion_timer.stop()  # Nothing left to convert
+        self.conversion_sequence += 1  # Drops a result still on its way
         self.label_txt_result.clear()
         self.label_txt_result.hide()
 
     def startConversionProcess(self):
-        pass
+        self.conversion_sequence += 1  # The input changed: a result still on its way is stale
+        self.conversion_timer.start()  # Restarts the debounce delay
+
+    def openBulkPanel(self):
+        if self.current_category is None:
+            self.label_txt_result.setText("Please select a conversion type from the menu.")
+            self.label_txt_result.show()
+            return
+        if self.bulk_dialog is None or self.bulk_dialog.category != self.current_category:
+            if self.bulk_dialog is not None:
+                self.bulk_dialog.close()
+                self.bulk_dialog.deleteLater()  # Frees the dialog, its model and its result arrays
+            self.bulk_dialog = BulkConversionDialog(
+                self,
+                self.current_category,
+                registry.category(self.current_category).title,
+                self.combo_models[self.current_category],
+            )
+        self.bulk_dialog.show()  # Not modal: the main window stays usable
+        self.bulk_dialog.raise_()
+
+    def writeMetrics(self):
+        if self.metrics_path:
+            try:
+                metrics.write_textfile(self.metrics_path)
+            except OSError:  # The metrics never stop the application
+                pass
 
     def closeEvent(self, event):
         # Show a custom dialog to confirm logout
         dialogo_logout = CustomLogoutDialog(self)
         if dialogo_logout.get_result():  # If the user confirms logout
+            self.writeMetrics()  # Keep the metrics of the last conversions
             event.accept()  # Close the application
         else:  # If the user cancels logout
             event.ignore()  # Ignore the close event
@@ -0,0 +1,243 @@
+"""
+module: custom_dialog_bulk
+--------------------------------
+This module defines the `BulkConversionDialog` class, a PyQt5-based panel that converts a pasted column of values at once.
+The pasted text is parsed and converted with one vectorized backend call on a worker thread, and the results
+are shown in a `QTableView` over `BulkResultModel`, which formats only the rows that scroll into view.
+Notes:
+------
+- The dialog is not modal: the main window stays usable while a large paste is converted.
+- The unit combo boxes share the model of the main window, so the units are not listed twice.
+- 1M pasted values are two float64 arrays; no widget or string is built per row up front.
+Dependencies:
+-------------
+- PyQt5.QtWidgets: Used for creating the GUI components.
+- PyQt5.QtCore: Provides the table model, the thread pool and the signals of the worker.
+- src.application.backend.values.batch: Converts the whole column with a single operation.
+- src.application.backend.values.formatting: The precision of every category and the bulk formatter.
+"""
+import re # Used to check the thousands separators of the pasted numbers
+
+from PyQt5.QtWidgets import (
+    QApplication, # Import QApplication for the clipboard
+    QDialog, # Import QDialog for creating dialog windows
+    QVBoxLayout, # Import QVBoxLayout for vertical layout management
+    QHBoxLayout, # Import QHBoxLayout for horizontal layout management
+    QLabel, # Import QLabel for displaying text
+    QPushButton, # Import QPushButton for creating buttons
+    QComboBox, # Import QComboBox for the units
+    QPlainTextEdit, # Import QPlainTextEdit for the pasted column
+    QTableView, # Import QTableView for the results
+    QHeaderView, # Import QHeaderView to give the rows a fixed height
+)
+from PyQt5.QtCore import (
+    Qt, # Import Qt for using Qt constants
+    QAbstractTableModel, # Import QAbstractTableModel for the lazily formatted results
+    QModelIndex, # Import QModelIndex for the model methods
+    QObject, # Import QObject for the signals of the worker
+    QRunnable, # Import QRunnable for the conversion task
+    QThreadPool, # Import QThreadPool to run the conversion off the event loop
+    pyqtSignal, # Import pyqtSignal for the result of the worker
+)
+from src.application.backend.values import batch # Vectorized conversion for every category
+from src.application.backend.values import formatting # Precision of every category and bulk formatting
+
+
+THOUSANDS = re.compile(r"[-+]?\d{1,3}(,\d{3})+(\.\d*)?") # A number with commas between groups of three digits
+
+
+def parse_column(text):
+    """
+    Parses a pasted column of numbers (one or more per line, thousands separators allowed).
+    A comma is only accepted between groups of three digits, so a decimal comma ("1,5") is
+    reported instead of being read as 15.
+    Args:
+        text (str): The pasted text.
+    Returns:
+        numpy.ndarray: The values as float64.
+    Raises:
+        ValueError: If a pasted entry is not a number.
+    """
+    import numpy as np # Loaded with the first bulk conversion
+    if "," not in text:
+        return np.array(text.split(), dtype=np.float64)
+    entries = []
+    for line_number, line in enumerate(text.splitlines(), 1):
+        for entry in line.split():
+            if "," in entry:
+                if THOUSANDS.fullmatch(entry) is None:
+                    raise ValueError(f"line {line_number}: {entry}")
+                entry = entry.replace(",", "")
+            entries.append(entry)
+    return np.array(entries, dtype=np.float64)
+
+
+"""
+Classes:
+--------
+- BulkResultModel(QAbstractTableModel): Two columns (pasted value, converted value) over two float64 arrays.
+  A cell is formatted only when the view asks for it, that is when its row is visible.
+"""
+class BulkResultModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values = self.results = ()
+        self.headers = ("Value", "Result")
+        self.decimals = 4
+
+    def setResults(self, values, results, headers, decimals):
+        self.beginResetModel()
+        self.values, self.results, self.headers, self.decimals = values, results, headers, decimals
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        if index.column() == 0:
+            return f"{self.values[index.row()]:,}"
+        return f"{self.results[index.row()]:,.{self.decimals}f}"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+
+"""
+Classes:
+--------
+- BulkSignals(QObject): The signals of a BulkWorker: finished(sequence, values, results) or failed(sequence, message).
+- BulkWorker(QRunnable): Parses and converts a pasted column on the thread pool of the dialog.
+"""
+class BulkSignals(QObject):
+    finished = pyqtSignal(int, object, object)
+    failed = pyqtSignal(int, str)
+
+
+class BulkWorker(QRunnable):
+    def __init__(self, sequence, category, text, origin_unit, destination_unit):
+        super().__init__()
+        self.signals = BulkSignals()
+        self.sequence = sequence
+        self.arguments = (category, text, origin_unit, destination_unit)
+
+    def run(self):
+        category, text, origin_unit, destination_unit = self.arguments
+        try:
+            values = parse_column(text)
+            results = batch.convert_batch(category, values, origin_unit, destination_unit) # One call for the whole column
+        except ValueError as error: # Handle a pasted entry that is not a number
+            self.signals.failed.emit(self.sequence, f"Invalid value ({error}). Please paste one number per line.")
+        except AttributeError: # Handle invalid unit selection
+            self.signals.failed.emit(self.sequence, "Error: Invalid unit selected.")
+        except Exception as e: # Handle any other exceptions
+            self.signals.failed.emit(self.sequence, f"An error occurred: {e}")
+        else:
+            self.signals.finished.emit(self.sequence, values, results)
+
+
+"""
+Classes:
+--------
+- BulkConversionDialog(QDialog): The bulk panel of a category.
+- The dialog is initialized with the parent window, the name of the category, its title and the combo box model
+  of the category; the "Convert" button starts a BulkWorker and only the latest result is shown.
+"""
+class BulkConversionDialog(QDialog):
+    def __init__(self, parent, category, title, units_model):
+        super().__init__(parent)
+        self.category = category
+        self.setWindowTitle(f"Bulk Convert - {title}")
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # Remove the help button
+        self.resize(600, 500)
+        self.thread_pool = QThreadPool(self)
+        self.sequence = 0 # Numbers the conversions, so older results can be dropped
+        self.headers = ()
+
+        # Main layout
+        self.layout_principal = QVBoxLayout(self)
+
+        # Pasted column
+        self.text_values = QPlainTextEdit()
+        self.text_values.setPlaceholderText("Paste one value per line")
+        self.layout_principal.addWidget(self.text_values, 1)
+
+        # Units and buttons
+        self.layout_units = QHBoxLayout()
+        self.combo_from = QComboBox()
+        self.combo_to = QComboBox()
+        for combo in (self.combo_from, self.combo_to):
+            combo.setModel(units_model) # Shared with the main window
+            combo.setCurrentIndex(0)
+        self.btn_convert = QPushButton("Convert")
+        self.btn_copy = QPushButton("Copy Results")
+        self.layout_units.addWidget(QLabel("From"))
+        self.layout_units.addWidget(self.combo_from)
+        self.layout_units.addWidget(QLabel("To"))
+        self.layout_units.addWidget(self.combo_to)
+        self.layout_units.addWidget(self.btn_convert)
+        self.layout_units.addWidget(self.btn_copy)
+        self.layout_principal.addLayout(self.layout_units)
+
+        # Status message
+        self.label_status = QLabel()
+        self.layout_principal.addWidget(self.label_status)
+
+        # Results
+        self.model_results = BulkResultModel(self)
+        self.table_results = QTableView()
+        self.table_results.setModel(self.model_results)
+        self.table_results.verticalHeader().setSectionResizeMode(QHeaderView.Fixed) # Rows are never measured one by one
+        self.table_results.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.layout_principal.addWidget(self.table_results, 2)
+
+        self.btn_convert.clicked.connect(self.startConversion)
+        self.btn_copy.clicked.connect(self.copyResults)
+
+    """
+    Methods:
+    --------
+    - startConversion(): Checks the units and starts a BulkWorker on the pasted text.
+    - showResults(sequence, values, results): Shows the results of the latest conversion.
+    - showError(sequence, message): Shows the error of the latest conversion.
+    - copyResults(): Copies the converted column to the clipboard.
+    """
+    def startConversion(self):
+        origin_unit = self.combo_from.currentText()
+        destination_unit = self.combo_to.currentText()
+        if "Options" in (origin_unit, destination_unit) or not self.text_values.toPlainText().strip():
+            self.label_status.setText("Please select units and paste the values.")
+            return
+        self.sequence += 1
+        self.headers = (origin_unit, destination_unit) # Units of the conversion, even if the combos change meanwhile
+        self.label_status.setText("Converting...")
+        worker = BulkWorker(self.sequence, self.category, self.text_values.toPlainText(), origin_unit, destination_unit)
+        worker.signals.finished.connect(self.showResults)
+        worker.signals.failed.connect(self.showError)
+        self.thread_pool.start(worker)
+
+    def showResults(self, sequence, values, results):
+        if sequence != self.sequence: # A newer conversion has been started
+            return
+        self.model_results.setResults(values, results, self.headers, formatting.precision(self.category))
+        self.label_status.setText(f"{len(results):,} values converted.")
+
+    def showError(self, sequence, message):
+        if sequence == self.sequence:
+            self.label_status.setText(message)
+
+    def copyResults(self):
+        model = self.model_results
+        if len(model.results):
+            text = formatting.format_array(model.results, model.decimals) # Formatted in blocks, not row by row
+            QApplication.clipboard().setText(text.decode("ascii"))
@@ -0,0 +1 @@
+"""The conversion scenes (one menu widget per category)."""
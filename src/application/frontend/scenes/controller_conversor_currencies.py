@@ -5,25 +5,20 @@ This module defines the `ConversorCurriency` class, which is a PyQt5-based GUI w
 It provides a graphical interface with a button and methods to retrieve currency names and instances.
 Notes:
 ------
-- The `root_dir` is dynamically determined to allow importing modules from the project root directory.
+- The module is imported as part of the `src.application` package, so it needs no `sys.path` changes.
 - The button in the interface is styled with a custom stylesheet and expands to fill available space.
 """
-import sys  # Used to manipulate the Python runtime environment
-from pathlib import Path  # Used to handle file paths in a platform-independent way
-
-# Dynamically set the base directory for the application
-BASE_DIR = Path(__file__).resolve().parents[3]  # Assuming the structure is src/application/main.py
-if str(BASE_DIR) not in sys.path:
-    sys.path.append(str(BASE_DIR))  # Add the base directory to the system path
 """
 Dependencies:
 -------------
 - PyQt5.QtWidgets: Used for creating the GUI components.
-- src.application.backend.values.currencies: Provides the `currencies` and `currency` classes for handling currency data.
+- src.application.backend.values.currencies: Provides the `currencies` class for handling currency data.
+- src.application.backend.values.registry: Provides the catalog with the currency names.
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QSizePolicy # Import necessary PyQt5 classes
-# Import the currencies and currency classes from the backend module
-from src.application.backend.values.currencies import currencies, currency
+# Import the currencies class and the unit registry from the backend module
+from src.application.backend.values.currencies import currencies
+from src.application.backend.values import registry
 """
 Classes:
 --------
@@ -42,8 +37,7 @@ class ConversorCurriency(QWidget):
         Sets up the graphical user interface for the `ConversorCurriency` widget. 
         Creates a button with specific styles and adds it to the layout.
     - getCurrencyNames() -> list:
-        Retrieves a list of currency names from the `currencies` class. 
-        Iterates through the attributes of a `currencies` instance and collects the names of attributes that are instances of the `currency` class.
+        Retrieves the list of currency names from the unit registry.
     - getClass() -> currencies:
         Returns an instance of the `currencies` class.
     Attributes:
@@ -74,20 +68,14 @@ class ConversorCurriency(QWidget):
     """
     Method: getCurrencyNames
     -------------------
-    Retrieves a list of currency names from the `currencies` class.
-    Iterates through the attributes of a `currencies` instance and collects the names of attributes that are instances of the `currency` class.
+    Retrieves the list of currency names from the unit registry.
+    The names are built once when the catalog is loaded, so this is a dict lookup.
     Returns:
     -------
     - list: A list of currency names.
     """
     def getCurrencyNames(self):
-        currency_instance = currencies() # Create an instance of the currencies class
-        currency_list = [] # Initialize an empty list to store currency names
-        for key in dir(currency_instance): # Iterate through the attributes of the currencies instance
-            attribute = getattr(currency_instance, key) # Get the attribute by its name
-            if isinstance(attribute, currency): # Check if the attribute is an instance of the currency class
-                currency_list.append(attribute.name) # Append the name of the currency to the list
-        return currency_list # Return the list of currency names
+        return list(registry.category("currencies").names) # Return the list of currency names
     """
     Method: getClass
     -------------------
@@ -5,25 +5,20 @@ This module defines the `ConversorLongitud` class, which is a PyQt5-based GUI wi
 It provides a graphical interface with a button and methods to retrieve length names and instances.
 Notes:
 ------
-- The `root_dir` is dynamically determined to allow importing modules from the project root directory.
+- The module is imported as part of the `src.application` package, so it needs no `sys.path` changes.
 - The button in the interface is styled with a custom stylesheet and expands to fill available space.
 """
-import sys  # Used to manipulate the Python runtime environment
-from pathlib import Path  # Used to handle file paths in a platform-independent way
-
-# Dynamically set the base directory for the application
-BASE_DIR = Path(__file__).resolve().parents[3]  # Assuming the structure is src/application/main.py
-if str(BASE_DIR) not in sys.path:
-    sys.path.append(str(BASE_DIR))  # Add the base directory to the system path
 """
 Dependencies:
 -------------
 - PyQt5.QtWidgets: Used for creating the GUI components.
-- src.application.backend.values.longitudes: Provides the `longitudes` and `longitud` classes for handling length data.
+- src.application.backend.values.longitudes: Provides the `longitudes` class for handling length data.
+- src.application.backend.values.registry: Provides the catalog with the length unit names.
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QSizePolicy # Import necessary PyQt5 classes
-# Import the longitudes and longitud classes from the backend module
-from src.application.backend.values.longitudes import longitud, longitudes
+# Import the longitudes class and the unit registry from the backend module
+from src.application.backend.values.longitudes import longitudes
+from src.application.backend.values import registry
 """
 Classes:
 --------
@@ -64,17 +59,11 @@ class ConversorLongitud(QWidget):
     Methods:
     --------
     - getLongitudNames() -> list:
-        Retrieves a list of length names from the `longitudes` class.
-        Iterates through the attributes of a `longitudes` instance and collects the names of attributes that are instances of the `longitud` class.
+        Retrieves the list of length unit names from the unit registry.
+        The names are built once when the catalog is loaded, so this is a dict lookup.
     """
     def getLongitudNames(self):
-        longitudes_instancia = longitudes() # Create an instance of the longitudes class
-        lon_list = [] # Initialize an empty list to store length names
-        for key in dir(longitudes_instancia): # Iterate through the attributes of the longitudes instance
-            attribute = getattr(longitudes_instancia, key) # Get the attribute by name
-            if isinstance(attribute, longitud): # Check if the attribute is an instance of the longitud class
-                lon_list.append(attribute.name.replace("_", " ")) # Append the name of the length to the list
-        return lon_list # Return the list of length names
+        return list(registry.category("longitudes").names) # Return the list of length names
     """
     Method: getClass
     -------------------
@@ -5,24 +5,19 @@ This module defines the `ConversorTemperature` class, which is a PyQt5-based GUI
 It provides a graphical interface with a button and methods to retrieve temperature names and instances.
 Notes:
 ------
-- The `root_dir` is dynamically determined to allow importing modules from the project root directory.
+- The module is imported as part of the `src.application` package, so it needs no `sys.path` changes.
 - The button in the interface is styled with a custom stylesheet and expands to fill available space.
 """
-import sys  # Used to manipulate the Python runtime environment
-from pathlib import Path  # Used to handle file paths in a platform-independent way
-
-# Dynamically set the base directory for the application
-BASE_DIR = Path(__file__).resolve().parents[3]  # Assuming the structure is src/application/main.py
-if str(BASE_DIR) not in sys.path:
-    sys.path.append(str(BASE_DIR))  # Add the base directory to the system path
 """
 Dependencies:
 -------------
 - PyQt5.QtWidgets: Used for creating the GUI components.
 - src.application.backend.values.temperatures: Provides the `temperatures` class for handling temperature data.
+- src.application.backend.values.registry: Provides the catalog with the temperature scale names.
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QSizePolicy
 from src.application.backend.values.temperatures import temperatures  # Import the temperatures class from the backend
+from src.application.backend.values import registry  # Import the unit registry from the backend
 
 """
 Classes:
@@ -42,8 +37,7 @@ class ConversorTemperature(QWidget):
         Sets up the graphical user interface for the `ConversorTemperature` widget.
         Creates a button with specific styles and adds it to the layout.
     - getTemperatureNames() -> list:
-        Retrieves a list of temperature names from the `temperatures` class.
-        Defines a list of temperature names and returns it.
+        Retrieves the list of temperature scale names from the unit registry.
     - getClass() -> temperatures:
         Returns an instance of the `temperatures` class.
     Attributes:
@@ -74,15 +68,13 @@ class ConversorTemperature(QWidget):
     Methods:
     --------
     - getTemperatureNames() -> list:
-        Retrieves a list of temperature names from the `temperatures` class. 
-        Defines a list of temperature names and returns it.
+        Retrieves the list of temperature scale names from the unit registry.
     - getClass() -> temperatures:
         Returns an instance of the `temperatures` class.
     """
     def getTemperatureNames(self):
-        # Define a list of temperature names
-        temp_list = ["Celsius", "Fahrenheit", "Kelvin"]
-        return temp_list  # Return the list of temperature names
+        # Read the temperature names from the catalog
+        return list(registry.category("temperatures").names)  # Return the list of temperature names
     """
     Method: getClass
     -------------------
@@ -6,24 +6,19 @@ It provides a graphical interface with a button and methods to retrieve weight a
 with a custom stylesheet and expands to fill available space.
 Notes:
 ------
-- The `root_dir` is dynamically determined to allow importing modules from the project root directory.
+- The module is imported as part of the `src.application` package, so it needs no `sys.path` changes.
 - The button in the interface is styled with a custom stylesheet and expands to fill available space.
 """
-import sys  # Used to manipulate the Python runtime environment
-from pathlib import Path  # Used to handle file paths in a platform-independent way
-
-# Dynamically set the base directory for the application
-BASE_DIR = Path(__file__).resolve().parents[3]  # Assuming the structure is src/application/main.py
-if str(BASE_DIR) not in sys.path:
-    sys.path.append(str(BASE_DIR))  # Add the base directory to the system path
 """
 Dependencies:
 -------------
 - PyQt5.QtWidgets: Used for creating the GUI components.
-- src.application.backend.values.weights_and_masses: Provides the `weights_and_masses` and `weight_and_mass` classes for handling weight and mass data.
+- src.application.backend.values.weights_and_masses: Provides the `weights_and_masses` class for handling weight and mass data.
+- src.application.backend.values.registry: Provides the catalog with the weight and mass unit names.
 """
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QSizePolicy # Import necessary PyQt5 classes
-from src.application.backend.values.weights_and_masses import weights_and_masses, weight_and_mass # Import the weights_and_masses and weight_and_mass classes from the backend module
+from src.application.backend.values.weights_and_masses import weights_and_masses # Import the weights_and_masses class from the backend module
+from src.application.backend.values import registry # Import the unit registry from the backend module
 
 """
 Classes:
@@ -65,17 +60,11 @@ class ConversorWeightAndMasses(QWidget):
     Methods:
     --------
     - getWeightNames() -> list:
-        Retrieves a list of weight and mass names from the `weights_and_masses` class.
-        Iterates through the attributes of a `weights_and_masses` instance and collects the names of attributes that are instances of the `weight_and_mass` class.
+        Retrieves the list of weight and mass unit names from the unit registry.
+        The names are built once when the catalog is loaded, so this is a dict lookup.
     """
     def getWeightNames(self): # Method to get weight names
-        weights_instance = weights_and_masses() # Create an instance of the weights_and_masses class
-        weight_list = [] # Initialize an empty list to store weight names
-        for key in dir(weights_instance): # Iterate through the attributes of the weights_and_masses instance
-            attribute = getattr(weights_instance, key) # Get the attribute by its name
-            if isinstance(attribute, weight_and_mass): # Check if the attribute is an instance of the weight_and_mass class
-                weight_list.append(attribute.name.replace("_", " ")) # Append the name of the weight to the list
-        return weight_list # Return the list of weight names
+        return list(registry.category("weights_and_masses").names) # Return the list of weight names
     """
     Method: getClass
     ----------------
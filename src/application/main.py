@@ -42,18 +42,21 @@ version: 1.0
 import sys  # Used to manipulate the Python runtime environment
 from pathlib import Path  # Used to handle file paths in a platform-independent way
 
-# Dynamically set the base directory for the application
-BASE_DIR = Path(__file__).resolve().parents[3]  # Assuming the structure is src/application/main.py
-if str(BASE_DIR) not in sys.path:
-    sys.path.append(str(BASE_DIR))  # Add the base directory to the system path
-
-from PyQt5.QtWidgets import QApplication
-from frontend.base import MainWindow
+# Launched as a script (python main.py), the project root is not importable yet.
+# Launched as a module (python -m src.application.main), nothing has to change.
+if not __package__:
+    BASE_DIR = Path(__file__).resolve().parents[2]  # The structure is <root>/src/application/main.py
+    if str(BASE_DIR) not in sys.path:
+        sys.path.append(str(BASE_DIR))  # Add the project root to the system path
 
 def main():
     """
     Initializes the PyQt5 application and displays the main window.
+    PyQt5 and the frontend are imported here, so importing this module stays cheap.
     """
+    from PyQt5.QtWidgets import QApplication
+    from src.application.frontend.base import MainWindow
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
@@ -0,0 +1,278 @@
+"""
+This is a local HTTP/JSON service that exposes the backend converters to other programs.
+
+- It is built on asyncio streams from the standard library, so it needs no web framework
+  and never imports PyQt5.
+- Connections are kept alive (HTTP/1.1) and the number of requests converted at the same
+  time is bounded by a semaphore.
+
+Endpoints:
+- GET  /convert?category=longitudes&from=Meter&to=Feet&value=3
+    -> {"result": 9.84251968503937}  (results that are not finite, such as from value=nan, are null)
+- POST /convert/batch  {"category": "longitudes", "from": "Meter", "to": "Feet", "values": [1, 2]}
+    -> {"results": [3.280839895013123, 6.561679790026246]}
+- GET  /categories -> {"longitudes": ["Nanometer", ...], ...}
+- GET  /metrics    -> request counters and latencies in the Prometheus text format, followed
+                      by the per-pair conversion histograms when started with --metrics
+
+Usage (from the project root):
+    python -m src.application.service --port 8080 --max-concurrency 64 --metrics
+"""
+import argparse  # Used to parse the command line arguments
+import asyncio  # Used for the non-blocking server
+import json  # Used for the request and response bodies
+import math  # Used to send non-finite results as null
+import time  # Used to measure the latencies
+from urllib.parse import parse_qs, urlsplit  # Used to read the query strings
+
+from src.application.backend import metrics  # Optional per-pair conversion metrics
+from src.application.backend.values import batch, registry  # Converters and unit catalog
+
+DEFAULT_HOST = "127.0.0.1"  # Only reachable from this machine
+DEFAULT_PORT = 8080
+DEFAULT_MAX_CONCURRENCY = 64  # Requests converted at the same time
+IDLE_TIMEOUT = 30.0  # Seconds a kept-alive connection may stay idle
+MAX_BODY_SIZE = 64 * 1024 * 1024  # Largest accepted request body, in bytes
+
+PATHS = ("/convert", "/convert/batch", "/categories", "/metrics")  # Known paths, used as metric labels
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 431: "Request Header Fields Too Large"}
+
+
+class HttpError(Exception):
+    """An error answered to the client with an HTTP status code."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class ServiceMetrics:
+    """
+    Counters of the service, exported in the Prometheus text format.
+    Attributes:
+        requests (dict): (path, status) -> number of requests.
+        latency (dict): path -> [total seconds, number of requests].
+        in_flight (int): The requests being handled right now.
+        connections (int): The open connections.
+    """
+
+    def __init__(self):
+        self.requests = {}
+        self.latency = {}
+        self.in_flight = 0
+        self.connections = 0
+
+    def record(self, path, status, seconds):
+        """Counts one handled request."""
+        self.requests[(path, status)] = self.requests.get((path, status), 0) + 1
+        total = self.latency.setdefault(path, [0.0, 0])
+        total[0] += seconds
+        total[1] += 1
+
+    def render(self):
+        """Returns the metrics in the Prometheus text format."""
+        lines = ["# TYPE conversor_requests_total counter"]
+        for (path, status), count in sorted(self.requests.items()):
+            lines.append(f'conversor_requests_total{{path="{path}",status="{status}"}} {count}')
+        lines.append("# TYPE conversor_request_seconds summary")
+        for path, (seconds, count) in sorted(self.latency.items()):
+            lines.append(f'conversor_request_seconds_sum{{path="{path}"}} {seconds:.9f}')
+            lines.append(f'conversor_request_seconds_count{{path="{path}"}} {count}')
+        lines.append("# TYPE conversor_requests_in_flight gauge")
+        lines.append(f"conversor_requests_in_flight {self.in_flight}")
+        lines.append("# TYPE conversor_connections gauge")
+        lines.append(f"conversor_connections {self.connections}")
+        return "\n".join(lines) + "\n"
+
+
+class ConversionService:
+    """
+    The HTTP server of the conversion service.
+    Attributes:
+        metrics (ServiceMetrics): The counters exported on /metrics.
+    """
+
+    def __init__(self, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        self.metrics = ServiceMetrics()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Starts listening and returns the asyncio server."""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def handle_connection(self, reader, writer):
+        """Serves the requests of one connection until it is closed or stays idle."""
+        self.metrics.connections += 1
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), IDLE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except HttpError as error:
+                    writer.write(build_response(error.status, {"error": str(error)}, keep_alive=False))
+                    break
+                if request is None:  # The client closed the connection
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, payload = await self.dispatch(method, target, body)
+                writer.write(build_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            self.metrics.connections -= 1
+            writer.close()
+
+    async def dispatch(self, method, target, body):
+        """Runs one request under the concurrency limit and records its metrics."""
+        path = urlsplit(target).path
+        start = time.perf_counter()
+        async with self._semaphore:
+            self.metrics.in_flight += 1
+            try:
+                if path == "/convert/batch":  # Large arrays are converted off the event loop
+                    loop = asyncio.get_running_loop()
+                    payload = await loop.run_in_executor(None, self.route, method, target, body)
+                else:
+                    payload = self.route(method, target, body)
+                status = 200
+            except HttpError as error:
+                status, payload = error.status, {"error": str(error)}
+            except (KeyError, AttributeError, ValueError, TypeError, ArithmeticError) as error:
+                status, payload = 400, {"error": str(error)}
+            finally:
+                self.metrics.in_flight -= 1
+        self.metrics.record(path if path in PATHS else "other", status, time.perf_counter() - start)
+        return status, payload
+
+    def route(self, method, target, body):
+        """
+        Returns the payload of a request.
+        Raises:
+            HttpError: If the path or the method is not supported.
+            KeyError, AttributeError, ValueError: If the parameters are not valid.
+            ArithmeticError: If a value does not fit a float (e.g. a huge JSON integer).
+        """
+        url = urlsplit(target)
+        if url.path == "/convert":
+            require_method(method, "GET")
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            result = batch.convert_value(query["category"], query["value"], query["from"], query["to"])
+            return {"result": json_number(result)}
+        if url.path == "/convert/batch":
+            require_method(method, "POST")
+            request = json.loads(body or b"{}")
+            results = batch.convert_batch(request["category"], request["values"], request["from"], request["to"])
+            return {"results": [json_number(result) for result in results.tolist()]}
+        if url.path == "/categories":
+            require_method(method, "GET")
+            return {name: list(category.names) for name, category in registry.catalog().items()}
+        if url.path == "/metrics":
+            require_method(method, "GET")
+            if metrics.is_enabled():
+                return self.metrics.render() + metrics.METRICS.render()
+            return self.metrics.render()
+        raise HttpError(404, f"Unknown path: {url.path}")
+
+
+def json_number(value):
+    """Returns a result as a JSON number, or None (null) when it is NaN or infinite."""
+    return value if math.isfinite(value) else None
+
+
+def require_method(method, expected):
+    """Raises an HttpError when a path is requested with the wrong method."""
+    if method != expected:
+        raise HttpError(405, f"Use {expected}")
+
+
+async def read_request(reader):
+    """
+    Reads one HTTP/1.1 request from a connection.
+    Returns:
+        tuple: (method, target, headers, body), or None when the connection was closed.
+    Raises:
+        HttpError: If the request is malformed, or a line or its body is too large.
+    """
+    request_line = await read_line(reader, 400, "Request line too long")
+    if not request_line:
+        return None
+    try:
+        method, target, _ = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HttpError(400, "Malformed request line") from None
+    headers = {}
+    while True:
+        line = await read_line(reader, 431, "Request header line too long")
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length") from None
+    if length < 0:
+        raise HttpError(400, "Invalid Content-Length")
+    if length > MAX_BODY_SIZE:
+        raise HttpError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, headers, body
+
+
+async def read_line(reader, status, message):
+    """Reads one line of the request head; a line longer than the stream limit is answered with `status`."""
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):  # readline() wraps the overrun in a ValueError
+        raise HttpError(status, message) from None
+
+
+def build_response(status, payload, keep_alive):
+    """Builds the bytes of an HTTP response; text payloads are sent as they are, others as JSON."""
+    if isinstance(payload, str):
+        body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+    else:
+        body, content_type = json.dumps(payload, allow_nan=False).encode("utf-8"), "application/json"
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def serve(host, port, max_concurrency):
+    """Runs the service until it is interrupted."""
+    service = ConversionService(max_concurrency)
+    server = await service.start(host, port)
+    print(f"Serving conversions on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Parses the command line and runs the service."""
+    parser = argparse.ArgumentParser(prog="python -m src.application.service",
+                                     description="Local HTTP/JSON conversion service.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to listen on (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to listen on (default {DEFAULT_PORT})")
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+                        help=f"requests converted at the same time (default {DEFAULT_MAX_CONCURRENCY})")
+    parser.add_argument("--metrics", action="store_true",
+                        help="also export latency histograms per category and unit pair on /metrics")
+    args = parser.parse_args(argv)
+    if args.metrics:
+        metrics.enable()
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_concurrency))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
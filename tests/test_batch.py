@@ -0,0 +1,58 @@
+"""
+Tests of the heterogeneous record conversion (src/application/backend/values/batch.py).
+"""
+import math  # Used to check the NaN rows
+import random  # Used to shuffle the records
+import unittest  # Used to write the tests
+
+from src.application.backend.values import batch
+
+
+class ConvertRecordsTests(unittest.TestCase):
+
+    RECORDS = [  # (category, origin, destin, value, expected)
+        ("longitudes", "Meter", "Centimeter", 1.5, 150.0),
+        ("temperatures", "Celsius", "Fahrenheit", 100.0, 212.0),
+        ("weights_and_masses", "Kilogram", "Gram", 2.0, 2000.0),
+        ("longitudes", "Meter", "Centimeter", 3.0, 300.0),
+        ("temperatures", "Celsius", "Fahrenheit", 0.0, 32.0),
+        ("longitudes", "Feet", "Inche", 1.0, 12.0),
+    ]
+
+    def convert(self, records, **options):
+        categories, origins, destins, values, _ = zip(*records)
+        return batch.convert_records(list(categories), list(origins), list(destins), list(values),
+                                     **options).tolist()
+
+    def test_mixed_categories(self):
+        results = self.convert(self.RECORDS)
+        for result, record in zip(results, self.RECORDS):
+            self.assertAlmostEqual(result, record[4])
+
+    def test_original_order_after_grouping(self):
+        records = self.RECORDS * 50
+        random.Random(4).shuffle(records)
+        results = self.convert(records)
+        for result, (category, origin, destin, value, _) in zip(results, records):
+            self.assertEqual(result, batch.convert_value(category, value, origin, destin))
+
+    def test_unknown_unit_in_a_group(self):
+        records = list(self.RECORDS)
+        records.insert(2, ("longitudes", "Parsec", "Centimeter", 1.0, None))
+        with self.assertRaises(AttributeError):
+            self.convert(records)
+        results = self.convert(records, errors="nan")
+        self.assertTrue(math.isnan(results[2]))
+        others = results[:2] + results[3:]
+        for result, record in zip(others, self.RECORDS):
+            self.assertAlmostEqual(result, record[4])
+
+    def test_unknown_category(self):
+        records = self.RECORDS + [("volumes_of_mars", "Meter", "Centimeter", 1.0, None)]
+        with self.assertRaises(KeyError):
+            self.convert(records)
+        self.assertTrue(math.isnan(self.convert(records, errors="nan")[-1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
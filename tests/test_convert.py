@@ -0,0 +1,45 @@
+"""
+Tests of the headless CSV converter (src/application/convert.py).
+"""
+import contextlib  # Used to silence the error message of main()
+import io  # Used for the in-memory CSV streams
+import os  # Used for the temporary file paths
+import tempfile  # Used for the CSV files of main()
+import unittest  # Used to write the tests
+
+from src.application import convert
+
+
+class ConvertCsvTests(unittest.TestCase):
+
+    def run_csv(self, text, chunk_size=convert.DEFAULT_CHUNK_SIZE):
+        """Converts the length column of a CSV text from meters to centimeters."""
+        destination = io.StringIO(newline="")
+        rows = convert.convert_csv(io.StringIO(text, newline=""), destination, "longitudes",
+                                   [("length", "Meter", "Centimeter")], chunk_size)
+        return rows, destination.getvalue()
+
+    def test_blank_lines_are_skipped(self):
+        rows, output = self.run_csv("name,length\r\na,1\r\n\r\nb,2\r\n", chunk_size=1)
+        self.assertEqual(rows, 2)
+        self.assertEqual(output, "name,length\r\na,100.0\r\nb,200.0\r\n")
+
+    def test_short_row_names_its_line(self):
+        with self.assertRaisesRegex(ValueError, "line 4"):
+            self.run_csv("name,length\r\na,1\r\n\r\nb\r\nc,3\r\n")
+
+    def test_main_reports_a_short_row(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "in.csv")
+            with open(source, "w", newline="", encoding="utf-8") as source_file:
+                source_file.write("name,length\na,1\n\nb\n")
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                code = convert.main(["csv", source, os.path.join(directory, "out.csv"),
+                                     "-k", "longitudes", "-c", "length", "Meter", "Centimeter"])
+        self.assertEqual(code, 1)
+        self.assertIn("line 4", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests of the conversion daemon and its binary frame protocol (src/application/daemon.py).
+"""
+import asyncio  # Used to run the daemon
+import os  # Used for the socket path
+import socket  # Used to send raw frames
+import tempfile  # Used for the socket directory
+import threading  # Used to run the daemon next to the blocking client
+import unittest  # Used to write the tests
+
+from src.application import daemon_client
+from src.application.daemon_client import HEADER, MAX_FRAME_SIZE, STATUS_ERROR, DaemonClient, DaemonError
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+class DaemonTests(unittest.TestCase):
+
+    def setUp(self):
+        from src.application.daemon import ConversionDaemon  # Unix only
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "daemon.sock")
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(ConversionDaemon().start(self.path))
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.server.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+        self.loop.close()
+        self.directory.cleanup()
+
+    def raw_exchange(self, frame, end=False):
+        """
+        Sends raw bytes (then ends the stream when `end` is True) and returns the answer
+        frame as (status, body), or None when the daemon closed the connection without one.
+        """
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(5)
+            connection.connect(self.path)
+            connection.sendall(frame)
+            if end:
+                connection.shutdown(socket.SHUT_WR)
+            data = b""
+            while True:
+                chunk = connection.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+                if len(data) >= HEADER.size and len(data) >= HEADER.size + HEADER.unpack(data[:HEADER.size])[0]:
+                    break
+        if not data:
+            return None
+        return data[HEADER.size], data[HEADER.size + 1:]
+
+    def assert_still_serving(self):
+        with DaemonClient(self.path, timeout=5) as client:
+            self.assertEqual(client.convert_value("longitudes", 1, "Meter", "Centimeter"), 100.0)
+
+    def test_round_trip(self):
+        with DaemonClient(self.path, timeout=5) as client:
+            client.ping()
+            self.assertEqual(list(client.convert("longitudes", [1, 2.5], "Meter", "Centimeter")), [100.0, 250.0])
+            self.assertEqual(client.convert_value("temperatures", 100, "Celsius", "Fahrenheit"), 212.0)
+            with self.assertRaises(DaemonError):
+                client.convert("longitudes", [1], "Meter", "Parsec")
+            self.assertEqual(list(client.convert("longitudes", [], "Meter", "Feet")), [])  # Still open
+
+    def test_truncated_request(self):
+        payload = (bytes((daemon_client.OP_CONVERT,)) + daemon_client.encode_string("longitudes")
+                   + bytes((40,)) + b"Meter")  # The origin says 40 bytes, the frame ends after 5
+        status, body = self.raw_exchange(HEADER.pack(len(payload)) + payload)
+        self.assertEqual((status, body), (STATUS_ERROR, b"Truncated request"))
+        self.assert_still_serving()
+
+    def test_connection_closed_inside_a_frame(self):
+        frame = daemon_client.encode_convert("longitudes", [1.0, 2.0], "Meter", "Feet")
+        self.assertIsNone(self.raw_exchange(frame[:-5], end=True))
+        self.assert_still_serving()
+
+    def test_oversized_length_prefix(self):
+        status, body = self.raw_exchange(HEADER.pack(MAX_FRAME_SIZE + 1))
+        self.assertEqual((status, body), (STATUS_ERROR, b"Invalid frame length"))
+        self.assert_still_serving()
+
+
+if __name__ == "__main__":
+    unittest.main()
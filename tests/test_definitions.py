@@ -0,0 +1,52 @@
+"""
+Tests of the unit definition snapshots (src/application/backend/values/definitions.py).
+"""
+import os  # Used for the temporary file paths
+import shutil  # Used to copy the unit definitions
+import tempfile  # Used for the definition and compiler files
+import unittest  # Used to write the tests
+from unittest import mock  # Used to count the compilations and swap the compiler files
+
+from src.application.backend.values import definitions
+
+
+class SnapshotTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "units.json")
+        shutil.copy(definitions.DEFAULT_UNIT_FILE, self.path)
+        self.compiler = os.path.join(self.directory.name, "registry.py")
+        self.write_compiler("def normalize_alias(text):\n    return text.casefold()\n")
+
+    def tearDown(self):
+        definitions._categories.clear()
+        self.directory.cleanup()
+
+    def write_compiler(self, code):
+        with open(self.compiler, "w", encoding="utf-8") as compiler_file:
+            compiler_file.write(code)
+
+    def compilations(self):
+        """Loads the definitions afresh and returns how many times they were compiled."""
+        definitions._categories.clear()
+        with mock.patch.object(definitions, "COMPILER_FILES", (self.compiler,)), \
+                mock.patch.object(definitions, "compile_definitions",
+                                  wraps=definitions.compile_definitions) as compile_definitions:
+            categories = definitions.load(self.path)
+        self.assertIn("longitudes", categories)
+        return compile_definitions.call_count
+
+    def test_snapshot_is_reused(self):
+        self.assertEqual(self.compilations(), 1)
+        self.assertEqual(self.compilations(), 0)
+
+    def test_changing_the_compiler_invalidates_the_snapshot(self):
+        self.assertEqual(self.compilations(), 1)
+        self.write_compiler("def normalize_alias(text):\n    return ' '.join(text.split()).casefold()\n")
+        self.assertEqual(self.compilations(), 1)
+        self.assertEqual(self.compilations(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests of the derived units of the unit definitions (src/application/backend/values/dimensions.py).
+"""
+import json  # Used to write the definition files
+import os  # Used for the temporary file paths
+import tempfile  # Used for the definition files
+import unittest  # Used to write the tests
+
+from src.application.backend.values import definitions
+
+LENGTHS = {"title": "Lengths", "dimension": {"length": 1}, "base": "Meter",
+           "units": [{"name": "Meter", "symbol": "m", "value": 1}, {"name": "Feet", "symbol": "ft", "value": 0.3048}]}
+TIMES = {"title": "Times", "dimension": {"time": 1}, "base": "Second",
+         "units": [{"name": "Second", "symbol": "s", "value": 1}, {"name": "Hour", "symbol": "h", "value": 3600}]}
+
+
+class DerivedUnitTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        definitions._categories.clear()
+        self.directory.cleanup()
+
+    def load(self, **categories):
+        """Writes a definition file with the lengths, the times and `categories`, and loads it."""
+        path = os.path.join(self.directory.name, f"units{len(os.listdir(self.directory.name))}.json")
+        with open(path, "w", encoding="utf-8") as definition_file:
+            json.dump({"categories": {"lengths": LENGTHS, "times": TIMES, **categories}}, definition_file)
+        return definitions.load(path)
+
+    def speeds(self, *units):
+        return {"title": "Speeds", "dimension": {"length": 1, "time": -1}, "units": list(units)}
+
+    def test_derived_unit(self):
+        categories = self.load(speeds=self.speeds({"name": "Feet per Hour", "of": {"Feet": 1, "Hour": -1}}))
+        self.assertAlmostEqual(categories["speeds"].scales[0], 0.3048 / 3600)
+
+    def test_dimension_mismatch(self):
+        with self.assertRaisesRegex(ValueError, "Square Feet is a length², but speeds are length·time⁻¹"):
+            self.load(speeds=self.speeds({"name": "Square Feet", "of": {"Feet": 2}}))
+
+    def test_undefined_base_unit(self):
+        with self.assertRaisesRegex(ValueError, "Unknown unit in a derived unit: Furlong"):
+            self.load(speeds=self.speeds({"name": "Furlong per Hour", "of": {"Furlong": 1, "Hour": -1}}))
+
+    def test_unit_of_a_later_category(self):
+        with self.assertRaisesRegex(ValueError, "Unknown unit in a derived unit: Gram"):
+            self.load(speeds=self.speeds({"name": "Gram per Hour", "of": {"Gram": 1, "Hour": -1}}),
+                      masses={"dimension": {"mass": 1}, "units": [{"name": "Gram", "value": 1}]})
+
+    def test_derived_unit_without_dimension(self):
+        with self.assertRaisesRegex(ValueError, "must declare its dimension"):
+            self.load(speeds={"units": [{"name": "Feet per Hour", "of": {"Feet": 1, "Hour": -1}}]})
+
+    def test_non_integer_exponent(self):
+        with self.assertRaisesRegex(ValueError, "exponent of Feet must be an integer"):
+            self.load(speeds=self.speeds({"name": "Root Feet", "of": {"Feet": 0.5}}))
+
+
+if __name__ == "__main__":
+    unittest.main()
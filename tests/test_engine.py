@@ -0,0 +1,52 @@
+"""
+Tests of the vectorized conversion engine (src/application/backend/values/engine.py).
+"""
+import unittest  # Used to write the tests
+from array import array  # Used for typed buffers
+
+from src.application.backend.values import engine
+
+
+class BufferInputTests(unittest.TestCase):
+
+    def converted(self, values):
+        """Returns the values doubled by the NumPy path and by the pure-Python path."""
+        return list(engine.convert_array(values, 2.0)), list(engine.convert_sequence(values, 2.0))
+
+    def test_float32_view_is_converted_by_value(self):
+        numpy_result, python_result = self.converted(memoryview(array("f", [1, 2, 3, 4])))
+        self.assertEqual(numpy_result, [2.0, 4.0, 6.0, 8.0])
+        self.assertEqual(numpy_result, python_result)
+
+    def test_int64_view_is_converted_by_value(self):
+        numpy_result, python_result = self.converted(memoryview(array("q", [1, 2])))
+        self.assertEqual(numpy_result, [2.0, 4.0])
+        self.assertEqual(numpy_result, python_result)
+
+    def test_raw_bytes_are_read_as_float64(self):
+        raw = array("d", [1.5, -2.0]).tobytes()
+        self.assertEqual(list(engine.convert_array(raw, 2.0)), [3.0, -4.0])
+        self.assertEqual(list(engine.convert_array(memoryview(bytearray(raw)), 2.0)), [3.0, -4.0])
+
+    def test_out_buffer(self):
+        values = array("d", [1.0, 2.0])
+        engine.convert_array(values, 3.0, out=values)
+        self.assertEqual(list(values), [3.0, 6.0])
+
+    def test_non_float64_out_is_rejected_by_both_paths(self):
+        for convert in (engine.convert_array, engine.convert_sequence):
+            out = array("f", [0.0])
+            with self.subTest(convert=convert.__name__), \
+                    self.assertRaisesRegex(ValueError, "out must be a writable float64 buffer"):
+                convert([1.0], 3.0, out=out)
+            self.assertEqual(list(out), [0.0])
+
+    def test_raw_out_buffer_in_both_paths(self):
+        for convert in (engine.convert_array, engine.convert_sequence):
+            out = bytearray(16)
+            convert([1.0, 2.0], 3.0, out=out)
+            self.assertEqual(list(array("d", bytes(out))), [3.0, 6.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+"""
+Tests of the free-text quantity expressions (src/application/backend/values/expressions.py).
+"""
+import unittest  # Used to write the tests
+
+from src.application.backend.values import expressions
+
+
+class EvaluateTests(unittest.TestCase):
+
+    def test_sum_of_terms(self):
+        result = expressions.evaluate("5 ft 3 in to cm")
+        self.assertAlmostEqual(result.value, 160.02)
+        self.assertEqual(result.unit.name, "Centimeter")
+
+    def test_hyphenated_unit(self):
+        self.assertAlmostEqual(expressions.evaluate("1 nautical-mile to m").value, 1852)
+
+    def test_subtraction_is_rejected(self):
+        with self.assertRaises(ValueError):
+            expressions.evaluate("10 m - 3 m to m")
+
+    def test_other_operators_are_rejected(self):
+        for text in ("2 + 3 m", "2 m * 3", "10 m = 3 m", "10 m -"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                expressions.evaluate(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
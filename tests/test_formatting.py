@@ -0,0 +1,42 @@
+"""
+Tests of the bulk formatter (src/application/backend/values/formatting.py).
+Run from the project root: python -m pytest (or python -m unittest).
+"""
+import math  # Used for the special values
+import unittest  # Used to write the tests
+
+from src.application.backend.values import formatting
+
+
+class FormatArrayTests(unittest.TestCase):
+
+    def assertMatchesFormat(self, values, decimals, grouping=False):
+        """Checks format_array against format() for every value."""
+        expected = "".join(f"{value:{',' if grouping else ''}.{decimals}f}\n" for value in values)
+        self.assertEqual(formatting.format_array(values, decimals, grouping).decode("ascii"), expected)
+
+    def test_all_nan_block(self):
+        self.assertEqual(formatting.format_array([math.nan], 4), b"nan\n")
+        self.assertEqual(formatting.format_array([math.nan, math.nan], 2, nan=b""), b"\n\n")
+
+    def test_all_inf_block(self):
+        self.assertEqual(formatting.format_array([math.inf], 4), b"inf\n")
+        self.assertEqual(formatting.format_array([math.inf, -math.inf], 2, grouping=True), b"inf\n-inf\n")
+
+    def test_special_values_among_numbers(self):
+        self.assertMatchesFormat([1234567.891, math.nan, -math.inf, -0.0, 0.0], 3, grouping=True)
+
+    def test_half_ties_match_format(self):
+        self.assertMatchesFormat([2.675, 1.005, 0.125, 0.375, 2.5, 3.5, -2.675], 2)
+        self.assertMatchesFormat([round(index * 0.001, 3) for index in range(-5000, 5000)], 2)
+        self.assertMatchesFormat([index + 0.5 for index in range(-50, 50)], 0, grouping=True)
+
+    def test_large_values_match_format(self):
+        self.assertMatchesFormat([1e17, -3.5e20, 123456789012.345], 4, grouping=True)
+
+    def test_empty(self):
+        self.assertEqual(formatting.format_array([], 2), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Tests of the historical exchange-rate store (src/application/backend/values/history.py).
+"""
+import os  # Used for the temporary file paths
+import tempfile  # Used for the history files
+import unittest  # Used to write the tests
+
+from src.application.backend.values.history import HistoricalRates
+
+
+class HistoricalRatesTests(unittest.TestCase):
+
+    def test_rates_in_force(self):
+        history = HistoricalRates({"EUR": (["2025-06-03", "2025-06-02"], [1.15, 1.14])})
+        self.assertEqual(history.rate_at("EUR", "2025-06-02T12:00"), 1.14)
+        self.assertEqual(history.rate_at("EUR", "2025-06-04"), 1.15)
+
+    def test_invalid_rates_are_rejected(self):
+        for rate in (0.0, -1.14, float("nan"), float("inf")):
+            with self.subTest(rate=rate), self.assertRaises(ValueError):
+                HistoricalRates({"EUR": (["2025-06-02", "2025-06-03"], [1.14, rate])})
+
+    def test_length_mismatch_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "2 dates and 1 rates"):
+            HistoricalRates({"EUR": (["2025-06-02", "2025-06-03"], [1.14])})
+
+    def test_invalid_rate_in_a_file_names_its_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.csv")
+            with open(path, "w", newline="", encoding="utf-8") as history_file:
+                history_file.write("date,currency,rate\n2025-06-02,EUR,1.14\n2025-06-03,EUR,0\n")
+            with self.assertRaisesRegex(ValueError, "line 3"):
+                HistoricalRates.from_files(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Tests of the memory-mapped float64 conversion (src/application/backend/mapped.py).
+"""
+import os  # Used for the temporary file paths
+import tempfile  # Used for the converted files
+import unittest  # Used to write the tests
+from array import array  # Used to write the float64 files
+
+from src.application.backend.mapped import convert_file
+
+
+class ConvertFileTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "meters.bin")
+        with open(self.path, "wb") as values_file:
+            array("d", [1.0, 2.0, 3.0]).tofile(values_file)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self, path):
+        values = array("d")
+        with open(path, "rb") as values_file:
+            values.frombytes(values_file.read())
+        return list(values)
+
+    def test_output_file(self):
+        out_path = os.path.join(self.directory.name, "centimeters.bin")
+        self.assertEqual(convert_file(self.path, "longitudes", "Meter", "Centimeter", out_path), 3)
+        self.assertEqual(self.read(out_path), [100.0, 200.0, 300.0])
+        self.assertEqual(self.read(self.path), [1.0, 2.0, 3.0])
+
+    def test_output_is_the_input(self):
+        same_file = os.path.join(self.directory.name, ".", "meters.bin")
+        self.assertEqual(convert_file(self.path, "longitudes", "Meter", "Centimeter", same_file), 3)
+        self.assertEqual(self.read(self.path), [100.0, 200.0, 300.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
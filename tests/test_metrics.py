@@ -0,0 +1,57 @@
+"""
+Tests of the conversion metrics (src/application/backend/metrics.py).
+"""
+import unittest  # Used to write the tests
+
+from src.application.backend import metrics
+from src.application.backend.values import batch
+
+
+class RecordTests(unittest.TestCase):
+
+    def bucket(self, seconds):
+        """Returns the bucket index a latency is counted in."""
+        recorder = metrics.ConversionMetrics()
+        recorder.record("key", seconds)
+        return recorder.latencies["key"].index(1)
+
+    def test_zero_is_in_the_first_bucket(self):
+        self.assertEqual(self.bucket(0.0), 0)
+
+    def test_powers_of_two_are_in_their_own_bucket(self):
+        for index, bound in enumerate(metrics.BUCKET_BOUNDS):
+            with self.subTest(bound=bound):
+                self.assertEqual(self.bucket(bound), index)
+                self.assertEqual(self.bucket(bound * 1.5), index + 1)
+
+    def test_slow_conversions_are_only_in_inf(self):
+        self.assertEqual(self.bucket(metrics.BUCKET_BOUNDS[-1] * 2), len(metrics.BUCKET_BOUNDS))
+
+
+class TimedTests(unittest.TestCase):
+
+    def test_series_are_keyed_by_canonical_unit_names(self):
+        recorder = metrics.ConversionMetrics()
+        convert = metrics.timed(lambda category, value, origin, destin: value, name="convert", metrics=recorder)
+        for origin in ("ft", "FEET", "Feet", "feet", 7):
+            convert("longitudes", 1.0, origin, "m")
+        self.assertEqual(list(recorder.latencies), [("convert", "longitudes", "Feet", "Meter")])
+        self.assertEqual(sum(recorder.latencies[("convert", "longitudes", "Feet", "Meter")][:-1]), 5)
+
+    def test_keyword_arguments(self):
+        recorder = metrics.ConversionMetrics()
+        convert = metrics.timed(batch.convert_batch, metrics=recorder)
+        result = convert("longitudes", [1.0, 2.0], origin="m", destin="km")
+        self.assertEqual(result.tolist(), [0.001, 0.002])
+        convert(category="longitudes", values=[1.0], origin="m", destin="km")
+        self.assertEqual(list(recorder.latencies), [("convert_batch", "longitudes", "Meter", "Kilometer")])
+
+    def test_unreadable_labels_do_not_fail_the_call(self):
+        recorder = metrics.ConversionMetrics()
+        convert = metrics.timed(lambda *args, **kwargs: 1.0, name="convert", metrics=recorder)
+        self.assertEqual(convert("longitudes", origin="m"), 1.0)
+        self.assertEqual(list(recorder.latencies), [("convert",) + (metrics.UNLABELED,) * 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
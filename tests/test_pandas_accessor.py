@@ -0,0 +1,37 @@
+"""
+Tests of the pandas `units` accessor (src/application/backend/pandas_accessor.py).
+"""
+import unittest  # Used to write the tests
+
+try:
+    import pandas as pd  # Optional dependency of the accessor
+except ImportError:
+    pd = None
+else:
+    from src.application.backend import pandas_accessor  # Registers the accessor
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class FindCategoryTests(unittest.TestCase):
+
+    def test_category_from_unit_names(self):
+        self.assertEqual(pandas_accessor.find_category("lb", "Kilogram").name, "weights_and_masses")
+
+    def test_unit_ids_require_the_category(self):
+        with self.assertRaises(ValueError):
+            pandas_accessor.find_category(0, 1)
+
+    def test_unit_id_columns_require_the_category(self):
+        series = pd.Series([1.0, 2.0])
+        with self.assertRaises(ValueError):
+            series.units.convert(pd.Series([7, 4]), 4)
+        converted = series.units.convert(pd.Series([7, 4]), 4, category="longitudes")
+        self.assertEqual(converted.round(4).tolist(), [0.3048, 2.0])
+
+    def test_unknown_units(self):
+        with self.assertRaises(AttributeError):
+            pandas_accessor.find_category("Parsec", "Meter")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests of the rate file loader (src/application/backend/values/rates.py).
+"""
+import os  # Used for the temporary file paths
+import tempfile  # Used for the rate files
+import unittest  # Used to write the tests
+import warnings  # Used to silence the expected warnings
+
+from src.application.backend.values import rates, registry
+
+
+class RateTableTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.category = registry.Category("currencies", "Currencies", (("USD", "$", 1), ("EUR", "€", 1.14)))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load(self, name, content):
+        """Loads a rate file into the category and returns the USD -> EUR factor."""
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as rate_file:
+            rate_file.write(content)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            rates.RateTable(self.category, path).load()
+        return self.category.pair("USD", "EUR")[0]
+
+    def assertKeepsRates(self, name, content):
+        self.assertAlmostEqual(self.load(name, content), 1 / 1.14)
+        with self.assertRaises(ValueError):
+            rates.read_rate_file(rates.Path(self.directory.name) / name)
+
+    def test_valid_files(self):
+        self.assertAlmostEqual(self.load("rates.json", '{"rates": {"USD": 1, "EUR": 1.25}}'), 0.8)
+        self.assertAlmostEqual(self.load("rates.csv", "currency,rate\nUSD,1\nEUR,0.5\n"), 2.0)
+
+    def test_top_level_list(self):
+        self.assertKeepsRates("rates.json", '[1, 2]')
+
+    def test_rates_list(self):
+        self.assertKeepsRates("rates.json", '{"rates": []}')
+
+    def test_null_rate(self):
+        self.assertKeepsRates("rates.json", '{"rates": {"USD": 1, "EUR": null}}')
+
+    def test_short_csv_row(self):
+        self.assertKeepsRates("rates.csv", "currency,rate\nUSD,1\nEUR\n")
+
+    def test_nan_rate(self):
+        self.assertKeepsRates("rates.json", '{"rates": {"USD": 1, "EUR": "nan"}}')
+
+    def test_infinite_rate(self):
+        self.assertKeepsRates("rates.csv", "currency,rate\nUSD,1\nEUR,inf\n")
+
+    def test_negative_rate(self):
+        self.assertKeepsRates("rates.json", '{"rates": {"USD": 1, "EUR": -1}}')
+
+
+if __name__ == "__main__":
+    unittest.main()
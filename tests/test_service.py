@@ -0,0 +1,85 @@
+"""
+Tests of the local HTTP/JSON conversion service (src/application/service.py).
+"""
+import asyncio  # Used to run the service and the client
+import json  # Used to read the response bodies
+import unittest  # Used to write the tests
+
+from src.application.service import MAX_BODY_SIZE, ConversionService
+
+
+async def exchange(request):
+    """Starts the service on a free port, sends the raw request and returns (status, body)."""
+    server = await ConversionService().start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+        status_line = await reader.readline()
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        body = await reader.readexactly(length)
+        writer.close()
+        return int(status_line.split()[1]), body
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def post(content_length, body=b""):
+    return (f"POST /convert/batch HTTP/1.1\r\nHost: test\r\nContent-Length: {content_length}\r\n\r\n"
+            .encode("latin-1") + body)
+
+
+class ServiceTests(unittest.TestCase):
+
+    def test_non_numeric_content_length(self):
+        status, _ = asyncio.run(exchange(post("abc")))
+        self.assertEqual(status, 400)
+
+    def test_negative_content_length(self):
+        status, _ = asyncio.run(exchange(post("-1")))
+        self.assertEqual(status, 400)
+
+    def test_oversized_content_length(self):
+        status, _ = asyncio.run(exchange(post(MAX_BODY_SIZE + 1)))
+        self.assertEqual(status, 413)
+
+    def test_batch(self):
+        body = json.dumps({"category": "longitudes", "from": "Meter", "to": "Centimeter",
+                           "values": [1, 2]}).encode("utf-8")
+        status, response = asyncio.run(exchange(post(len(body), body)))
+        self.assertEqual((status, json.loads(response)), (200, {"results": [100.0, 200.0]}))
+
+    def test_nan_value_gives_valid_json(self):
+        request = b"GET /convert?category=longitudes&from=Meter&to=Feet&value=nan HTTP/1.1\r\nHost: test\r\n\r\n"
+        status, body = asyncio.run(exchange(request))
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body, parse_constant=self.fail), {"result": None})
+
+    def test_huge_integer_value(self):
+        body = b'{"category": "longitudes", "from": "Meter", "to": "Feet", "values": [1' + b"0" * 400 + b"]}"
+        status, response = asyncio.run(exchange(post(len(body), body)))
+        self.assertEqual(status, 400)
+        self.assertIn("error", json.loads(response))
+
+    def test_overlong_request_line(self):
+        request = b"GET /convert?value=" + b"1" * 100000 + b" HTTP/1.1\r\nHost: test\r\n\r\n"
+        status, _ = asyncio.run(exchange(request))
+        self.assertEqual(status, 400)
+
+    def test_overlong_header_line(self):
+        request = b"GET /categories HTTP/1.1\r\nX-Padding: " + b"a" * 100000 + b"\r\n\r\n"
+        status, _ = asyncio.run(exchange(request))
+        self.assertEqual(status, 431)
+
+
+if __name__ == "__main__":
+    unittest.main()